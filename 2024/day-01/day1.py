@@ -1,49 +1,144 @@
-def part1():
-  sum_of_differences = 0
-  ls_left = []
-  ls_right = []
+import sys
+
+from aoc.extsort import ExternalSort
+from aoc.ints import read_ints, read_ints_chunked
+
+def process_input(file_path):
+  # the two columns alternate in the flat list of numbers, one np.int64 array for both
+  numbers = read_ints(file_path, numpy=True)
+  ls_left = numbers[0::2]
+  ls_right = numbers[1::2]
+
+  return ls_left, ls_right
+
+def part1(data):
+  # Imported here, like in the parser, so importing the day stays cheap
+  import numpy as np
+
+  ls_left, ls_right = data
+  if len(ls_left) == 0:
+    return 0
+  ls_left, ls_right = np.sort(ls_left), np.sort(ls_right)
+
+  # Like the dot product in part 2, the int64 sum wraps around silently: summed over
+  # chunks short enough that they can't reach 2^63, added up as Python ints
+  largest_term = max(abs(int(ls_left[0])), abs(int(ls_left[-1]))) \
+    + max(abs(int(ls_right[0])), abs(int(ls_right[-1])))
+  if largest_term == 0:
+    return 0
+  step = ((1 << 63) - 1) // largest_term
+  if step == 0: # a single difference overflows, Python ints all the way
+    return sum(abs(l - r) for l, r in zip(ls_left.tolist(), ls_right.tolist()))
+  return sum(int(np.abs(ls_left[i:i + step] - ls_right[i:i + step]).sum())
+             for i in range(0, len(ls_left), step))
+
+
+def part2(data):
+  # Count every number on the right once, then look each left number up in the counts:
+  # O(nlogn) (or O(n)) instead of the O(n^2) brute force.
+  import numpy as np
+
+  ls_left, ls_right = data
+  if len(ls_right) == 0:
+    return 0
 
-  with open("./day-01/input.txt", "r") as f:
-    for line in f:
-      left, right = line.split()
-      ls_left.append(int(left))
-      ls_right.append(int(right))
+  if ls_right.min() >= 0 and ls_right.max() < 4 * len(ls_right) + (1 << 20):
+    # Small numbers (5 digits in the puzzle): a table indexed by the number itself
+    counts = np.bincount(ls_right)
+    counter = counts[np.clip(ls_left, 0, len(counts) - 1)]
+    counter[(ls_left < 0) | (ls_left >= len(counts))] = 0
+  else:
+    values, counts = np.unique(ls_right, return_counts=True)
+    # Binary searches in sorted order hit the same part of values one after another
+    ls_left = np.sort(ls_left)
+    i = np.searchsorted(values, ls_left)
+    i[i == len(values)] = 0 # past the largest value, can't match anything
+    counter = np.where(values[i] == ls_left, counts[i], 0)
 
-    ls_left.sort()
-    ls_right.sort()
+  # The int64 dot product wraps around silently, so it's taken over chunks short enough
+  # that their sum can't reach 2^63, added up as Python ints
+  if len(ls_left) == 0:
+    return 0
+  largest_term = int(np.abs(ls_left).max()) * int(counter.max())
+  if largest_term == 0:
+    return 0
+  step = ((1 << 63) - 1) // largest_term
+  if step == 0: # a single term overflows, Python ints all the way
+    matched = counter != 0
+    return sum(l * c for l, c in zip(ls_left[matched].tolist(), counter[matched].tolist()))
+  return sum(int(ls_left[i:i + step] @ counter[i:i + step]) for i in range(0, len(ls_left), step))
 
-    for i in range(len(ls_left)):
-      difference = abs(ls_left[i] - ls_right[i])
-      sum_of_differences += difference
+
+# Without numpy, kept to check the engine against (python -m aoc diff 2024 1)
+def part1_python(data):
+  sum_of_differences = 0
+  ls_left, ls_right = (column.tolist() for column in data)
+
+  ls_left = sorted(ls_left)
+  ls_right = sorted(ls_right)
+
+  for i in range(len(ls_left)):
+    difference = abs(ls_left[i] - ls_right[i])
+    sum_of_differences += difference
 
   return sum_of_differences
 
 
-def part2():
-  # Searching each number is O(n) unless we use binary search on a sorted list which is O(logn)
-  # Sort and binary search: O(nlogn)
-  # Brute force search: O(n^2), could also cache for speedup.
-  # Since dataset is relatively small, I'm just going to brute force it.
+def part2_python(data):
+  # Used to brute force this (O(n^2), fine for the puzzle's 1000 rows), counting the
+  # right column once is O(n)
+  ls_left, ls_right = (column.tolist() for column in data)
+  counts = {}
+  for r in ls_right:
+    counts[r] = counts.get(r, 0) + 1
 
-  ls_left = []
-  ls_right = []
   similarityScore = 0
-
-  with open("./input.txt", "r") as f:
-    for line in f:
-      left, right = line.split()
-      ls_left.append(int(left))
-      ls_right.append(int(right))
-    
   for l in ls_left:
-    counter = 0
-    for r in ls_right:
-      if l == r:
-        counter += 1
-    similarityScore += l * counter
+    similarityScore += l * counts.get(l, 0)
 
   return similarityScore
 
+def solve_external(file_path, run_size=None, tmp_dir=None):
+  # For location lists bigger than memory: each column is sorted in runs on disk and
+  # merged back (aoc.extsort), so only a run and a block per run are ever held.
+  # Part 1 pairs up the two merged streams, part 2 walks them side by side.
+  options = {"tmp_dir": tmp_dir, **({"run_size": run_size} if run_size else {})}
+  with ExternalSort(**options) as left, ExternalSort(**options) as right:
+    for chunk in read_ints_chunked(file_path):
+      left.add(chunk[0::2])
+      right.add(chunk[1::2])
+    if len(left) != len(right):
+      raise ValueError("Both lists need the same number of locations")
+
+    sum_of_differences = 0
+    for l, r in zip(left.merged(), right.merged()):
+      sum_of_differences += abs(l - r)
+
+    similarityScore = 0
+    rights = right.merged()
+    r = next(rights, None)
+    last, last_score = None, 0
+    for l in left.merged():
+      if l != last: # equal left numbers are next to each other, score them once
+        last, counter = l, 0
+        while r is not None and r < l:
+          r = next(rights, None)
+        while r is not None and r == l:
+          counter += 1
+          r = next(rights, None)
+        last_score = l * counter
+      similarityScore += last_score
+
+  return sum_of_differences, similarityScore
+
 if __name__ == "__main__":
-  print(part1())
-  print(part2())
+  if len(sys.argv) > 1 and sys.argv[1] == "--external":
+    # python day1.py --external huge.txt [values per run]
+    run_size = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    for answer in solve_external(sys.argv[2], run_size):
+      print(answer)
+    sys.exit()
+
+  data = process_input("./day-01/input.txt")
+  print(part1(data))
+  print(part2(data))
@@ -1,9 +1,18 @@
+import sys
+
+from aoc.ints import read_int_rows
+
+def process_input(file_path):
+  # Every report's levels back to back, report i is levels[offsets[i]:offsets[i + 1]]
+  levels, offsets = read_int_rows(file_path)
+  return levels.astype("int32"), offsets.astype("int32")
+
 def check_report(report):
-  is_increasing = int(report[0]) < int(report[1])
+  is_increasing = report[0] < report[1]
 
   for i in range(1, len(report)):
-    i1 = int(report[i - 1])
-    i2 = int(report[i])
+    i1 = report[i - 1]
+    i2 = report[i]
     diff = abs(i2 - i1)
     is_invalid_change = diff < 1 or diff > 3
 
@@ -11,44 +20,159 @@ def check_report(report):
       return (True, i - 1)
   return (False, -1)
 
-def solve_part1():
-  unsafe_counter = 0
-  total_lines = 0
+def bad_steps(levels):
+  # Running counts of the steps (levels[j] to levels[j + 1]) that don't increase by 1-3,
+  # and of those that don't decrease by 1-3: a report's steps from level a to level b
+  # are all good going up if increasing_bad[b] - increasing_bad[a] == 0.
+  import numpy as np
+
+  diffs = np.diff(levels)
+  increasing_bad = np.zeros(len(levels), dtype=np.int32)
+  decreasing_bad = np.zeros(len(levels), dtype=np.int32)
+  np.cumsum((diffs < 1) | (diffs > 3), out=increasing_bad[1:])
+  np.cumsum((diffs > -1) | (diffs < -3), out=decreasing_bad[1:])
+  return increasing_bad, decreasing_bad
+
+def solve_part1(data):
+  # Every report at once: safe if all its steps are good one way or the other
+  levels, offsets = data
+  if len(levels) == 0:
+    return 0
+  increasing_bad, decreasing_bad = bad_steps(levels)
+  first, last = offsets[:-1], offsets[1:] - 1
+  safe = (increasing_bad[last] == increasing_bad[first]) | \
+    (decreasing_bad[last] == decreasing_bad[first])
+  return int(safe.sum())
+
+def solve_part2(data):
+  # Rather than finding the problematic level and trying its neighbours one report at a
+  # time, try removing every level of every report at once. Without level p, a report is
+  # safe one way if its steps before p - 1 and after p + 1 are all good that way, and so
+  # is the new step from level p - 1 to p + 1.
+  import numpy as np
+
+  levels, offsets = data
+  if len(levels) == 0:
+    return 0
+  increasing_bad, decreasing_bad = bad_steps(levels)
+
+  lengths = np.diff(offsets)
+  first = np.repeat(offsets[:-1], lengths) # of the report each level is in
+  last = np.repeat(offsets[1:] - 1, lengths)
+  p = np.arange(len(levels), dtype=np.int32)
+  before = np.maximum(p - 1, first) # steps first..before and after..last are kept
+  after = np.minimum(p + 1, last)
+
+  inside = (p > first) & (p < last)
+  bridge = np.zeros_like(levels)
+  bridge[1:-1] = levels[2:] - levels[:-2]
+
+  increasing = (increasing_bad[before] == increasing_bad[first]) & \
+    (increasing_bad[last] == increasing_bad[after]) & \
+    (~inside | ((bridge >= 1) & (bridge <= 3)))
+  decreasing = (decreasing_bad[before] == decreasing_bad[first]) & \
+    (decreasing_bad[last] == decreasing_bad[after]) & \
+    (~inside | ((bridge <= -1) & (bridge >= -3)))
+
+  # A report that is already safe stays safe without its first level
+  safe = np.logical_or.reduceat(increasing | decreasing, offsets[:-1])
+  return int(safe.sum())
+
+
+# One report at a time, kept to check the vectorised parts against (python -m aoc diff 2024 2)
+def as_reports(data):
+  levels, offsets = data
+  levels, offsets = levels.tolist(), offsets.tolist()
+  return [levels[start:end] for start, end in zip(offsets, offsets[1:])]
+
+def find_problematic_reports(reports):
   problematic_reports = []
   problematic_indexes = []
 
-  with open("./day-02/input.txt", "r") as f:
-    for line in f:
-      total_lines += 1
-      report = line.split()
-      is_report_problematic, index = check_report(report)
-      if (is_report_problematic):
-        unsafe_counter += 1
-        problematic_reports.append(report)
-        problematic_indexes.append(index)
-  return problematic_reports, problematic_indexes, total_lines - unsafe_counter
-
-def solve_part2(problematic_reports, problematic_indexes):
+  for report in reports:
+    is_report_problematic, index = check_report(report)
+    if (is_report_problematic):
+      problematic_reports.append(report)
+      problematic_indexes.append(index)
+  return problematic_reports, problematic_indexes
+
+def solve_part1_python(data):
+  reports = as_reports(data)
+  problematic_reports, _ = find_problematic_reports(reports)
+  return len(reports) - len(problematic_reports)
+
+def solve_part2_python(data):
   # Safe if there is only 1 problematic level in a report.
   # Naive brute force: is to remove each level in a report and check if the report is still problematic.
   # -> Cost of checking updated report = cost of checking report * O(n) where n is the size of the report = O(n^2)
 
-  # Slightly more optimized: Pass the index of the problematic level. Remove the problematic level or its surrounding levels, 
+  # Slightly more optimized: Pass the index of the problematic level. Remove the problematic level or its surrounding levels,
   # then check if the report is still problematic.
   # -> Cost of checking updated report = cost of checking report * O(1) = O(n)
+  reports = as_reports(data)
+  problematic_reports, problematic_indexes = find_problematic_reports(reports)
   fixed_reports = 0
   for report, index in zip(problematic_reports, problematic_indexes):
     report1 = report[:index - 1] + report[index:] # excludes report[index - 1]
     report2 = report[:index] + report[index + 1:] # excludes report[index]
     report3 = report[:index + 1] + report[index + 2:] # excludes report[index + 1]
-    
+
     if not check_report(report1)[0] or not check_report(report2)[0] or not check_report(report3)[0]:
-      print(report1, report2, report3)
       fixed_reports += 1
 
-  return part1_solution + fixed_reports
+  return len(reports) - len(problematic_reports) + fixed_reports
+
+def is_safe(report, max_removals=1):
+  # Dampener for any number of removals, without building spliced copies. For each
+  # direction, removals[j] is the fewest levels removed from report[:j + 1] to make it
+  # safe while keeping level j. The level kept before j is one of the k + 1 before it,
+  # as anything further back removes too many, so this is O(n * k).
+  n = len(report)
+  if n - 1 <= max_removals:
+    return True # keep one level (or none), which is always safe
+
+  for low, high in ((1, 3), (-3, -1)):
+    # Levels up to the first bad step are kept for free
+    start = 1
+    while start < n and low <= report[start] - report[start - 1] <= high:
+      start += 1
+    if n - start <= max_removals: # remove everything from the first bad step on
+      return True
+
+    removals = [0] * n
+    for j in range(start, n):
+      fewest = j # remove every level before j
+      level = report[j]
+      for i in range(max(0, j - max_removals - 1), j):
+        removed = removals[i] + j - i - 1
+        if removed < fewest and low <= level - report[i] <= high:
+          fewest = removed
+      removals[j] = fewest
+      if fewest + n - 1 - j <= max_removals: # and remove every level after j
+        return True
+  return False
+
+def solve_part2_dp(data):
+  return sum(is_safe(report) for report in as_reports(data))
+
+def read_reports(file_path):
+  # One report at a time, for files of any size
+  with open(file_path, "r") as f:
+    for line in f:
+      if line.strip():
+        yield list(map(int, line.split()))
+
+def count_safe(reports, max_removals=1):
+  # Reports can come from a generator, like read_reports, so memory stays constant
+  return sum(1 for report in reports if is_safe(report, max_removals))
 
 if __name__ == "__main__":
-  problematic_reports, problematic_indexes, part1_solution = solve_part1()
-  print(part1_solution)
-  print(solve_part2(problematic_reports, problematic_indexes))
\ No newline at end of file
+  if len(sys.argv) > 1 and sys.argv[1] == "--stream":
+    # python day2.py --stream huge.txt [max removals]
+    max_removals = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+    print(count_safe(read_reports(sys.argv[2]), max_removals))
+    sys.exit()
+
+  reports = process_input("./day-02/input.txt")
+  print(solve_part1(reports))
+  print(solve_part2(reports))
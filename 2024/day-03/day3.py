@@ -1,13 +1,62 @@
 import re
+import sys
 
-def process_input():
-  with open("./day-03/input.txt", "r") as f:
-    return f.read().replace("\n", " ")
+# One pattern for all three instructions, so a single pass over the memory does both parts
+TOKEN = re.compile(rb"mul\((\d+),(\d+)\)|(do\(\))|don't\(\)")
+# The end of a chunk that the next chunk could still complete into an instruction
+PARTIAL = re.compile(rb"(?:m(?:u(?:l(?:\(\d*(?:,\d*)?)?)?)?|d(?:o(?:\(|n(?:'(?:t\(?)?)?)?)?)\Z")
+CHUNK_BYTES = 1 << 16
+
+def process_input(file_path):
+  with open(file_path, "rb") as f:
+    return f.read()
+
+def read_chunks(file_path, chunk_bytes=CHUNK_BYTES):
+  with open(file_path, "rb") as f:
+    while chunk := f.read(chunk_bytes):
+      yield chunk
+
+def scan(chunks):
+  # Goes through the instructions in order, adding every product for part 1 and only the
+  # ones while enabled for part 2. An instruction cut in two by the end of a chunk is
+  # carried over and finished with the next one, so memory stays at a chunk.
+  part1, part2 = 0, 0
+  enabled = True
+  carry = b""
+  for chunk in chunks:
+    memory = carry + chunk
+    for x, y, do in TOKEN.findall(memory):
+      if x:
+        product = int(x) * int(y)
+        part1 += product
+        if enabled:
+          part2 += product
+      else:
+        enabled = bool(do)
+
+    # Every instruction ends with a ")" and no unfinished one has one
+    partial = PARTIAL.search(memory, memory.rfind(b")") + 1)
+    carry = memory[partial.start():] if partial else b""
+  return part1, part2
+
+def chunks_of(data, chunk_bytes):
+  return (data[i:i + chunk_bytes] for i in range(0, len(data), chunk_bytes))
+
+def solve(data):
+  # In chunks even when it's all in memory already, one findall list per chunk is cheaper
+  return scan(chunks_of(data, CHUNK_BYTES))
+
+def solve_file(file_path, chunk_bytes=CHUNK_BYTES):
+  return scan(read_chunks(file_path, chunk_bytes))
+
+# Regex per part over the whole text, kept to check the scanner against (python -m aoc diff 2024 3)
+def as_text(data):
+  return data.decode().replace("\n", " ")
 
 def multiply(x, y):
   return int(x) * int(y)
 
-def solve_part1(input):
+def sum_of_products(input):
   regex_exp_mul = r'mul\((\d+),(\d+)\)'
   matches = re.findall(regex_exp_mul, input)
 
@@ -16,7 +65,10 @@ def solve_part1(input):
     total += multiply(x,y)
   return total
 
-def solve_part2(input):
+def solve_part1_findall(data):
+  return sum_of_products(as_text(data))
+
+def solve_part2_findall(data):
   # Add do() to the start of the input and don't() to the end of the input.
   # This will allow us to capture all groups between do() and don't().
   # We will need to do non-greedy matching otherwise we won't be able to capture
@@ -25,16 +77,23 @@ def solve_part2(input):
   # Interestingly was stuck here for awhile due to the presence of new lines `\n`,
   # which needed to be replaced as it affected pattern matching.
 
-  updated_input = "do()" + input + "don't()"
+  updated_input = "do()" + as_text(data) + "don't()"
   regex_exp_activated_input = r'do\(\)(.*?)don\'t\(\)'
   activated_inputs = re.findall(regex_exp_activated_input, updated_input)
 
   total = 0
   for activated_input in activated_inputs:
-    total += solve_part1(activated_input)
+    total += sum_of_products(activated_input)
   return total
 
+# The scanner fed a few bytes at a time, so instructions are cut at every possible place
+def solve_part1_chunked(data):
+  return scan(chunks_of(data, 7))[0]
+
+def solve_part2_chunked(data):
+  return scan(chunks_of(data, 7))[1]
+
 if __name__ == "__main__":
-  input_text = process_input()
-  print(solve_part1(input_text))
-  print(solve_part2(input_text))
\ No newline at end of file
+  part1, part2 = solve_file(sys.argv[1] if len(sys.argv) > 1 else "./day-03/input.txt")
+  print(part1)
+  print(part2)
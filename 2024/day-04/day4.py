@@ -1,48 +1,40 @@
-def process_input():
-  with open("./day-04/input.txt", "r") as f:
-    matrix = f.read().splitlines()
-    rows = len(matrix)
-    cols = len(matrix[0])
-    return matrix, rows, cols
+from aoc.grid import Grid
 
-def check_part1(x, y, letters, index, dx, dy):
-  if index == len(letters):
-    return 1
-  
-  nx, ny = x + dx, y + dy
-  if 0 <= ny < rows and 0 <= nx < cols:
-    if matrix[ny][nx] == letters[index]:
-      return check_part1(nx, ny, letters, index + 1, dx, dy)
-  return 0
+M, S = b"MS"
 
-def solve_part1():
-  directions = [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (-1, -1), (1, -1), (-1, 1)]
-  res = 0
+def process_input(file_path):
+  return Grid.from_file(file_path)
+
+def check_part1(grid, i, letters, index, step):
+  # Stepping off the grid lands on the border, which never matches a letter
+  while index < len(letters):
+    i += step
+    if grid[i] != letters[index]:
+      return 0
+    index += 1
+  return 1
 
-  for y in range(rows):
-    for x in range(cols):
-      if matrix[y][x] == 'X':
-        for dx, dy in directions:
-          res += check_part1(x, y, ['X', 'M', 'A', 'S'], 1, dx, dy)
+def solve_part1(grid):
+  res = 0
+  for i in grid.find_all("X"):
+    for step in grid.neighbours:
+      res += check_part1(grid, i, b"XMAS", 1, step)
   return res
 
-def solve_part2():
+def solve_part2(grid):
   res = 0
-  for r in range(rows):
-    for c in range(cols):
-      if matrix[r][c] == 'A':
-        diagonal1 = False
-        diagonal2 = False
-        if 0 <= r + 1 < rows and 0 <= r - 1 < rows and 0 <= c + 1 < cols and 0 <= c - 1 < cols:
-          diagonal1 = (matrix[r + 1][c + 1] == "M" and matrix[r - 1][c - 1] == "S") or \
-            (matrix[r + 1][c + 1] == "S" and matrix[r - 1][c - 1] == "M")
-          diagonal2 = (matrix[r + 1][c - 1] == "M" and matrix[r - 1][c + 1] == "S") or \
-            (matrix[r + 1][c - 1] == "S" and matrix[r - 1][c + 1] == "M")
-        if diagonal1 and diagonal2:
-          res += 1
+  up_left, up_right = grid.up + grid.left, grid.up + grid.right
+  down_left, down_right = grid.down + grid.left, grid.down + grid.right
+  for i in grid.find_all("A"):
+    diagonal1 = (grid[i + down_right] == M and grid[i + up_left] == S) or \
+      (grid[i + down_right] == S and grid[i + up_left] == M)
+    diagonal2 = (grid[i + down_left] == M and grid[i + up_right] == S) or \
+      (grid[i + down_left] == S and grid[i + up_right] == M)
+    if diagonal1 and diagonal2:
+      res += 1
   return res
 
 if __name__ == "__main__":
-  matrix, rows, cols = process_input()
-  print(solve_part1())
-  print(solve_part2())
+  data = process_input("./day-04/input.txt")
+  print(solve_part1(data))
+  print(solve_part2(data))
@@ -1,7 +1,8 @@
-import time
+from aoc.instrument import timeit
 
-def process_input():
-  with open("./day-05/input.txt", "r") as f:
+@timeit
+def process_input(file_path):
+  with open(file_path, "r") as f:
     lines = f.readlines()
     rules = set()
     updates = []
@@ -16,26 +17,35 @@ def process_input():
         rules.add(line.strip())
     return rules, updates
 
-def is_allowed(update):
+def is_allowed(update, rules):
   return not any(
     f"{update[j]}|{update[i]}" in rules
     for i in range(len(update))
     for j in range(i + 1, len(update))
   )
 
-def solve_part1():
+@timeit
+def solve_part1(data):
   # O(n^2) where n is the length of input but n is small here. /shrug
+  rules, updates = data
   total = 0
   for update in updates:
-    if is_allowed(update):
+    if is_allowed(update, rules):
       middle_number = int(update[len(update) // 2])
       total += middle_number
   return total
 
-def solve_part2():
+@timeit
+def solve_part2(data):
   # Thought about doing topo sort but there are cycles and I didn't really want to handle that separately.
+  rules, updates = data
   total = 0
   for update in updates: # O(n^3), kinda nasty but works
+    # Correctly-ordered updates only count towards part 1.
+    if is_allowed(update, rules):
+      continue
+
+    update = list(update) # Sort a copy so the parsed input can be reused
     fixed = False
 
     while not fixed:
@@ -49,21 +59,9 @@ def solve_part2():
     middle_number = int(update[len(update) // 2])
     total += middle_number
 
-  return total - part1_solution
+  return total
 
 if __name__ == "__main__":
-  start_time = time.time()
-  rules, updates = process_input()
-  end_time = time.time()
-  print(f"Processing time: {(end_time - start_time)*1e6:.1f}µs")
-
-  start_time = time.time()
-  part1_solution = solve_part1()
-  print(f"Part 1: {part1_solution}")
-  end_time = time.time()
-  print(f"Part 1 time: {(end_time - start_time)*1e6:.3f}µs")
-
-  start_time = time.time()
-  print(f"Part 2: {solve_part2()}")
-  end_time = time.time()
-  print(f"Part 2 time: {(end_time - start_time)*1e6:.3f}µs")
+  data = process_input("./day-05/input.txt")
+  print(f"Part 1: {solve_part1(data)}")
+  print(f"Part 2: {solve_part2(data)}")
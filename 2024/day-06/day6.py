@@ -1,99 +1,63 @@
-from enum import Enum
-import time
-
-def process_input():
-  with open("./day-06/input.txt", "r") as f:
-    matrix = f.readlines()
-    matrix = [list(line.strip()) for line in matrix]
-    no_of_rows = len(matrix)
-    no_of_cols = len(matrix[0])
-
-    # Get coordinates of guard and obstacles
-    guard_coord = (0, 0)
-    obstacle_set = set()
-    for x in range(no_of_cols):
-      for y in range(no_of_rows):
-        if matrix[y][x] == "#":
-          obstacle_set.add((x, y))
-        if matrix[y][x] == "^":
-          guard_coord = (x, y)
-    
-    return matrix, obstacle_set, guard_coord
-  
-def has_exited(guard_coord):
-  no_of_rows = len(matrix)
-  no_of_cols = len(matrix[0])
-  x, y = guard_coord
-  return x < 0 or x >= no_of_rows or y < 0 or y >= no_of_cols
-
-def met_obstacle(guard_coord, current_direction, obstacle_set):
-  x, y = guard_coord
-  if current_direction == Direction.UP:
-    y -= 1
-  elif current_direction == Direction.DOWN:
-    y += 1
-  elif current_direction == Direction.LEFT:
-    x -= 1
-  elif current_direction == Direction.RIGHT:
-    x += 1
-  return (x, y) in obstacle_set
-
-def solve_part1():
-  x, y = initial_guard_coord
-  direction = Direction.UP
-  visited = set()
-
-  while True:
-    if has_exited((x, y)):
-      return visited, len(visited)
-
-    visited.add((x,y))
-    
-    if met_obstacle((x, y), direction, obstacle_set):
-      next_enum_value = (direction.value % len(Direction)) + 1
-      direction = Direction(next_enum_value)
+from operator import add
+
+from aoc import parallel
+from aoc.grid import BORDER, Grid
+from aoc.instrument import timeit
+
+OBSTACLE, = b"#"
+
+def process_input(file_path):
+  grid = Grid.from_file(file_path)
+  # The guard always starts facing up (grid.directions[0])
+  return grid, grid.find("^")
+
+def walk(data):
+  grid, initial_guard = data
+  i = initial_guard
+  direction = 0
+  seen = grid.bitmap()
+  visited = []
+
+  while grid[i] != BORDER:
+    if not seen[i]:
+      seen[i] = 1
+      visited.append(i)
+
+    step = grid.directions[direction]
+    if grid[i + step] == OBSTACLE:
+      direction = (direction + 1) % 4 # Turn right
       continue
+    i += step
 
-    if direction == Direction.UP:
-      y -= 1
-    elif direction == Direction.DOWN:
-      y += 1
-    elif direction == Direction.LEFT:
-      x -= 1
-    elif direction == Direction.RIGHT:
-      x += 1
+  return visited
 
 
-def has_loop(obstacle_set):
-  visited = set()
-  direction = Direction.UP
-  x, y = initial_guard_coord
+@timeit
+def solve_part1(data):
+  return len(walk(data))
 
-  while True:
-    if has_exited((x, y)):
-      break
+def has_loop(grid, initial_guard):
+  # One bit per direction the guard has left each cell in
+  visited = grid.bitmap()
+  direction = 0
+  i = initial_guard
 
-    if (x, y, direction) in visited:
+  while grid[i] != BORDER:
+    if visited[i] & (1 << direction):
       return True
-    
-    visited.add((x, y, direction))
 
-    if met_obstacle((x, y), direction, obstacle_set):
-      direction = Direction(direction.value % len(Direction) + 1)
-      continue
+    visited[i] |= 1 << direction
 
-    if direction == Direction.UP:
-      y -= 1
-    elif direction == Direction.DOWN:
-      y += 1
-    elif direction == Direction.LEFT:
-      x -= 1
-    elif direction == Direction.RIGHT:
-      x += 1
+    step = grid.directions[direction]
+    if grid[i + step] == OBSTACLE:
+      direction = (direction + 1) % 4
+      continue
+    i += step
 
   return False
 
-def solve_part2():
+@timeit
+def solve_part2(data):
   # Brute force solution is to try every possibility for the new obstacles and check if 
   # the guard is stuck in a loop (visited set has an entry with the same coordinates and direction).
   #
@@ -103,28 +67,27 @@ def solve_part2():
   #
   # We only need to check whatever has been visited before in part 1 as only those coordinates 
   # can be reached by the guard.
+  #
+  # Every candidate is independent, so the candidates are split into chunks and checked
+  # in parallel (threads on free threaded Python, processes otherwise).
+  grid, initial_guard = data
+  possible_obstacles = walk(data)
+  chunks = parallel.split_evenly(possible_obstacles, parallel.chunk_count())
+  return parallel.map_reduce(count_loops, [(grid, initial_guard, chunk) for chunk in chunks], add, 0)
+
+def count_loops(grid, initial_guard, obstacles):
   total_loops = 0
-  possible_obstacles = visited_in_part1
+  grid = grid.copy() # Work on a copy so the parsed input (and other threads) can reuse it
 
-  for obstacle in possible_obstacles:
-    obstacle_set.add(obstacle) # Temporarily add a new obstacle to our set
-    total_loops += 1 if has_loop(obstacle_set) else 0
-    obstacle_set.remove(obstacle)
+  for obstacle in obstacles:
+    previous = grid[obstacle]
+    grid[obstacle] = OBSTACLE # Temporarily add a new obstacle to the map
+    total_loops += 1 if has_loop(grid, initial_guard) else 0
+    grid[obstacle] = previous
 
   return total_loops
 
 if __name__ == "__main__":
-  Direction = Enum("Direction", [("UP", 1), ("RIGHT", 2), ("DOWN", 3), ("LEFT", 4)])
-  matrix, obstacle_set, initial_guard_coord = process_input()
-
-  part1_start_time = time.time()
-  visited_in_part1, part1_solution = solve_part1()
-  part1_duration = time.time() - part1_start_time
-  print(f"Part 1: {part1_solution}")
-  print(f"Part 1 took {part1_duration:.4f} seconds to complete.")
-
-  part2_start_time = time.time()
-  part2_solution = solve_part2()
-  part2_duration = time.time() - part2_start_time
-  print(f"Part 2: {part2_solution}")
-  print(f"Part 2 took {part2_duration:.4f} seconds to complete.")
+  data = process_input("./day-06/input.txt")
+  print(f"Part 1: {solve_part1(data)}")
+  print(f"Part 2: {solve_part2(data)}")
@@ -1,5 +1,5 @@
-def process_input():
-  with open("./day-07/input.txt", "r") as f:
+def process_input(file_path):
+  with open(file_path, "r") as f:
     lines = f.readlines()
 
     results = []
@@ -13,17 +13,25 @@ def process_input():
     return results, components
 
 def part1_helper(target_total, curr_total, components, index):
-  if curr_total == target_total and index == len(components):
-    return True
-  if index >= len(components) or curr_total >= target_total:
-    return False
+  # Depth first over (total so far, next component) with an explicit stack, so long
+  # equations don't run out of stack frames
+  values = [int(c) for c in components]
+  stack = [(curr_total, index)]
+  while stack:
+    curr_total, index = stack.pop()
+    if curr_total == target_total and index == len(values):
+      return True
+    # Not >=: reaching the target early can still be finished off with "* 1"s
+    if index >= len(values) or curr_total > target_total:
+      continue
 
-  curr_component = int(components[index])
-  plus = part1_helper(target_total, curr_total + curr_component, components, index + 1)
-  multiply = part1_helper(target_total, curr_total * curr_component, components, index + 1) 
-  return plus or multiply
+    curr_component = values[index]
+    stack.append((curr_total * curr_component, index + 1))
+    stack.append((curr_total + curr_component, index + 1)) # plus is tried first
+  return False
 
-def solve_part1():
+def solve_part1(data):
+  results, components = data
   total = 0
   for i in range(len(results)):
     result = int(results[i])
@@ -35,19 +43,24 @@ def solve_part1():
   return total
 
 def part2_helper(target_total, curr_total, components, index):
-  if curr_total == target_total and index == len(components):
-    return True
-  if index >= len(components) or curr_total > target_total:
-    return False
-
-  curr_component_string = components[index]
-  plus = part2_helper(target_total, curr_total + int(curr_component_string), components, index + 1)
-  multiply = part2_helper(target_total, curr_total * int(curr_component_string), components, index + 1)
-  # String abuse xd
-  concat = part2_helper(target_total, int(str(curr_total) + curr_component_string), components, index + 1) 
-  return plus or multiply or concat
-
-def solve_part2():
+  # Same as part 1, with concatenation as a shift by the component's digit count
+  values = [(int(c), 10 ** len(c)) for c in components]
+  stack = [(curr_total, index)]
+  while stack:
+    curr_total, index = stack.pop()
+    if curr_total == target_total and index == len(values):
+      return True
+    if index >= len(values) or curr_total > target_total:
+      continue
+
+    curr_component, shift = values[index]
+    stack.append((curr_total * shift + curr_component, index + 1))
+    stack.append((curr_total * curr_component, index + 1))
+    stack.append((curr_total + curr_component, index + 1))
+  return False
+
+def solve_part2(data):
+  results, components = data
   total = 0
   for i in range(len(results)):
     result = int(results[i])
@@ -57,7 +70,7 @@ def solve_part2():
   return total
 
 if __name__ == "__main__":
-  results, components = process_input()
-  print(solve_part1())
-  print(solve_part2())
+  data = process_input("./day-07/input.txt")
+  print(solve_part1(data))
+  print(solve_part2(data))
 
@@ -1,28 +1,24 @@
-def process_input():
-  with open("./day-08/input.txt", "r") as f:
-    matrix = [list(line.strip()) for line in f.readlines()]
+from aoc.grid import Grid
 
-    antenna_mappings = {}
-    for y in range(len(matrix)):
-      for x in range(len(matrix[0])):
-        antenna = matrix[y][x]
-        if antenna == ".":
-          continue
-        if antenna in antenna_mappings:
-          antenna_mappings[antenna].append((x, y))
-        else:
-          antenna_mappings[antenna] = [(x, y)]
-    return matrix, antenna_mappings
+def process_input(file_path):
+  grid = Grid.from_file(file_path)
 
-def is_within_bounds(x, y):
-  max_rows = len(matrix)
-  max_cols = len(matrix[0])
-  return x >= 0 and x < max_rows and y >= 0 and y < max_cols
+  antenna_mappings = {}
+  for i in grid.indices():
+    antenna = chr(grid[i])
+    if antenna == ".":
+      continue
+    if antenna in antenna_mappings:
+      antenna_mappings[antenna].append(grid.coords(i))
+    else:
+      antenna_mappings[antenna] = [grid.coords(i)]
+  return grid, antenna_mappings
 
-def solve_part1():
+def solve_part1(data):
   # For each antenna type, we check every other of the same antenna type to
   # determine mapping.
-  antinodes = set()
+  grid, antenna_mappings = data
+  antinodes = grid.bitmap()
 
   for _, antenna_coordinates in antenna_mappings.items():
     for antenna1 in antenna_coordinates:
@@ -35,13 +31,14 @@ def solve_part1():
         dx, dy = x2 - x1, y2 - y1
         antinode = (x2 + dx, y2 + dy)
 
-        if is_within_bounds(antinode[0], antinode[1]):
-          antinodes.add(antinode)
+        if grid.contains(*antinode):
+          antinodes[grid.index(*antinode)] = 1
 
-  return len(antinodes)
+  return sum(antinodes)
 
-def solve_part2():
-  antinodes = set()
+def solve_part2(data):
+  grid, antenna_mappings = data
+  antinodes = grid.bitmap()
 
   for _, antenna_coordinates in antenna_mappings.items():
     for antenna1 in antenna_coordinates:
@@ -52,22 +49,16 @@ def solve_part2():
         x1, y1 = antenna1
         x2, y2 = antenna2
         dx, dy = x2 - x1, y2 - y1
-        
-        multiplier = 0
-        is_antinode_within_bounds = True
-        while is_antinode_within_bounds:
-          antinode = (x2 + dx * multiplier, y2 + dy * multiplier)
-
-          is_antinode_within_bounds = is_within_bounds(antinode[0], antinode[1])
-
-          if is_antinode_within_bounds:
-            antinodes.add(antinode)
 
-          multiplier += 1
+        # Antinodes repeat every (dx, dy) from the second antenna until they leave the map
+        x, y = x2, y2
+        while grid.contains(x, y):
+          antinodes[grid.index(x, y)] = 1
+          x, y = x + dx, y + dy
 
-  return len(antinodes)
+  return sum(antinodes)
 
 if __name__ == "__main__":
-  matrix, antenna_mappings = process_input()
-  print(f"Part 1: {solve_part1()}")
-  print(f"Part 2: {solve_part2()}")
+  data = process_input("./day-08/input.txt")
+  print(f"Part 1: {solve_part1(data)}")
+  print(f"Part 2: {solve_part2(data)}")
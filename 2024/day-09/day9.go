@@ -49,6 +49,9 @@ func part1() int {
       for parsed[r] == -1 {
         r -= 1
       }
+      if r < l {
+        break // the gaps left were all behind the last file block
+      }
       total += l * parsed[r]
       r -= 1
     }
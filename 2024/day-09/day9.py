@@ -1,9 +1,9 @@
-def process_input():
-  with open ("./day-09/input.txt", "r") as f:
+def process_input(file_path):
+  with open (file_path, "r") as f:
     input = f.read().strip()
     return input
 
-def solve_part1():
+def solve_part1(input):
   files = []
   for id in range(0, len(input)):
     character = id // 2 if id % 2 == 0 else "."
@@ -21,6 +21,8 @@ def solve_part1():
     while files[j] == ".":
       files[j] = 0
       j -= 1
+    if j < i: # the gaps left were all behind the last file block, nothing left to move
+      break
     files[i] = files[j]
     files[j] = 0
     j -= 1
@@ -29,7 +31,7 @@ def solve_part1():
   total = sum(c * i for i, c in enumerate(files))
   return total
 
-def solve_part2():
+def solve_part2(input):
   files = []
   for id in range(0, len(input)):
     character = id // 2 if id % 2 == 0 else "."
@@ -80,6 +82,6 @@ def solve_part2():
   return total
 
 if __name__ == "__main__":
-  input = process_input()
-  print(solve_part1())
-  print(solve_part2())
+  input = process_input("./day-09/input.txt")
+  print(solve_part1(input))
+  print(solve_part2(input))
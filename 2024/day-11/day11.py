@@ -1,32 +1,33 @@
 import time
 
-def process_input():
-  with open("./day-11/input.txt", "r") as f:
+from aoc.memo import memo
+
+def process_input(file_path):
+  with open(file_path, "r") as f:
     data = f.read().split()
     data = list(map(int, data))
     return data
 
 
-def solve_part1(data, completed_blinks, blinks_required):
-  if completed_blinks == blinks_required:
-    return len(data)
-
-  new_data = []
-  for n in data:
-    str_n = str(n)
-    if n == 0:
-      new_data.append(1)
-    elif len(str_n) % 2 == 0:
-      l = int(str_n[:len(str_n) // 2])
-      r = int(str_n[len(str_n) // 2:])
-      new_data.append(l)
-      new_data.append(r)
-    elif (len(str_n)) % 2 == 1:
-      new_data.append(n * 2024)
-  
-  return solve_part1(new_data, completed_blinks + 1, blinks_required)
-
-def solve_part2(data, blinks_required):
+def solve_part1(data, completed_blinks=0, blinks_required=25):
+  for _ in range(completed_blinks, blinks_required):
+    new_data = []
+    for n in data:
+      str_n = str(n)
+      if n == 0:
+        new_data.append(1)
+      elif len(str_n) % 2 == 0:
+        l = int(str_n[:len(str_n) // 2])
+        r = int(str_n[len(str_n) // 2:])
+        new_data.append(l)
+        new_data.append(r)
+      elif (len(str_n)) % 2 == 1:
+        new_data.append(n * 2024)
+    data = new_data
+
+  return len(data)
+
+def solve_part2(data, blinks_required=75):
   # Optimization of part 1:
   # 1. Added memoization to map each number to its output upon 
   #    expansion to reduce redundant computation.
@@ -36,7 +37,6 @@ def solve_part2(data, blinks_required):
   #    times that the new number appears.
    
   counter = {} # Maps each number to the number of times it appears in data
-  memoized = {} # Maps each number to its expansion
 
   # Build counter dict
   for n in data:
@@ -44,40 +44,33 @@ def solve_part2(data, blinks_required):
 
   # Expand all numbers to get final counter dict
   for _ in range(blinks_required):
-    counter = expand(counter, memoized)
+    counter = expand(counter)
 
   return sum(count for _, count in counter.items())
 
- 
-def expand(counter, memoized):
+
+@memo() # Maps each number to its expansion
+def blink(n):
+  if n == 0:
+    return (1,)
+  str_n = str(n)
+  if len(str_n) % 2 == 0:
+    return (int(str_n[:len(str_n) // 2]), int(str_n[len(str_n) // 2:]))
+  return (n * 2024,)
+
+
+def expand(counter):
   new_counter = {}
 
   for n, count in counter.items():
-    str_n = str(n)
-
-    if n in memoized:
-      for k in memoized[n]:
-        new_counter[k] = new_counter.get(k, 0) +  count
-      continue
-    
-    if n == 0:
-      new_counter[1] = new_counter.get(1, 0) + count
-      memoized[n] = [1]
-    elif len(str_n) % 2 == 0:
-      l = int(str_n[:len(str_n) // 2])
-      r = int(str_n[len(str_n) // 2:])
-      new_counter[l] = new_counter.get(l, 0) + count
-      new_counter[r] = new_counter.get(r, 0) + count
-      memoized[n] = [l, r]
-    else:
-      memoized[n] = [n * 2024]
-      new_counter[n * 2024] = new_counter.get(n * 2024, 0) + count
+    for k in blink(n):
+      new_counter[k] = new_counter.get(k, 0) + count
 
   return new_counter
 
 
 if __name__ == "__main__":
-  data = process_input()
+  data = process_input("./day-11/input.txt")
   print(f"Part 1 solution: {solve_part1(data, 0, 25)}")
   print(f"Part 1 solution: {solve_part2(data, 75)}")
 
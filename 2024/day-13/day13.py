@@ -1,9 +1,8 @@
 import re
-import numpy as np
 
-def process_input():
+def process_input(file_path):
   machines = []
-  with open("./day-13/input.txt", "r") as f:
+  with open(file_path, "r") as f:
     input = f.read()
     pattern = r"Button A: X\+(\d+), Y\+(\d+)\nButton B: X\+(\d+), Y\+(\d+)\nPrize: X=(\d+), Y=(\d+)"
     matches = re.findall(pattern, input)
@@ -14,7 +13,7 @@ def process_input():
       machines.append({"a": button_a, "b": button_b, "prize": prize})
   return machines
 
-def solve_part1():
+def solve_part1(machines):
   total = 0
   for machine in machines:
     total += solve_machine_part1(machine)
@@ -37,13 +36,13 @@ def solve_machine_part1(machine):
     return 0
   return min(solutions)
 
-def solve_part2():
+def solve_part2(machines):
   # Only the 2nd and 4th machines are used
-  relevant_machines = machines
-  # Fix value
-  for machine in relevant_machines:
+  # Fix value (on copies so the parsed input can be reused)
+  relevant_machines = []
+  for machine in machines:
     px, py = machine["prize"]
-    machine["prize"] = (10000000000000 + px, 10000000000000 + py)
+    relevant_machines.append({**machine, "prize": (10000000000000 + px, 10000000000000 + py)})
 
   # Instinctual reaction is binary search but I think there's a better solution that that
   # Pretty sure we can solve simultaneous equation for this
@@ -76,7 +75,7 @@ def solve_machine_part2(machine):
   return 0
 
 if __name__ == "__main__":
-  machines = process_input()
-  print(solve_part1())
-  print(solve_part2())
+  machines = process_input("./day-13/input.txt")
+  print(solve_part1(machines))
+  print(solve_part2(machines))
 
@@ -1,15 +1,10 @@
-def process_input():
-  data = []
-  with open("./day-14/input.txt", "r") as f:
-    lines = f.readlines()
-    for line in lines:
-      p, v = line.split()
-      px, py = p[2:].split(",")
-      vx, vy = v[2:].split(",")
-      data.append((int(px), int(py), int(vx), int(vy)))
-  return data
+from aoc.ints import read_ints, records
 
-def solve_part1(width, height):
+def process_input(file_path):
+  # p=px,py v=vx,vy -> (px, py, vx, vy)
+  return records(read_ints(file_path), 4)
+
+def solve_part1(data, width=101, height=103):
   seconds = 100
 
   updated_robot_coords = []
@@ -43,7 +38,7 @@ def solve_part1(width, height):
   
   return top_left * bot_left * top_right * bot_right
 
-def solve_part2(width, height):
+def solve_part2(data, width=101, height=103):
   # Guessing that the xmas tree happens when a bunch of
   # robots line up along a row which makes up a certain percentage
   # of the total width.
@@ -74,6 +69,6 @@ def solve_part2(width, height):
   
 
 if __name__ == "__main__":
-  data = process_input()
-  print(solve_part1(101, 103))
-  print(solve_part2(101,103))
+  data = process_input("./day-14/input.txt")
+  print(solve_part1(data, 101, 103))
+  print(solve_part2(data, 101,103))
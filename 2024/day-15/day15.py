@@ -1,91 +1,57 @@
-from collections import deque
-
-def process_input():
-  with open("./day-15/input.txt", "r") as f:
-    matrix = [list(line.strip()) for line in f.readlines()]
-
-    boundary = set()
-    boxes = set()
-    robot = (0, 0)
-    movements = deque()
-    map = []
-
-    for y in range(len(matrix)):
-      if len(matrix[y]) and matrix[y][0] == "#":
-        map.append(matrix[y])
-
-      for x in range(len(matrix[y])):
-        item = matrix[y][x]
-        directions = {"<": (-1, 0), "^": (0, -1), "v": (0, 1), ">": (1, 0)}
-
-        if item == "#":
-          boundary.add((x, y))
-        elif item == "O":
-          boxes.add((x, y))
-        elif item == "@":
-          robot = (x, y)
-        elif item in directions:
-          movements.append(directions[item])
-
-    fixed_matrix = [row for row in matrix if row and row[0] == '#']
-
-    return fixed_matrix, boundary, boxes, robot, movements
-
-def solve_part1():
-  matrix, boundary, boxes, robot, movements = process_input()
-
-  for dx, dy in movements:
-    nx = robot[0] + dx
-    ny = robot[1] + dy
-    if (nx, ny) in boundary:
+from aoc.grid import Grid
+
+WALL, BOX, ROBOT, EMPTY, BOX_LEFT, BOX_RIGHT = b"#O@.[]"
+
+def process_input(file_path):
+  with open(file_path, "r") as f:
+    lines = [line.strip() for line in f.readlines()]
+
+  warehouse = Grid(line for line in lines if line and line[0] == "#")
+  movements = "".join(line for line in lines if line and line[0] != "#")
+  return warehouse, movements
+
+def steps(grid):
+  return {"<": grid.left, "^": grid.up, "v": grid.down, ">": grid.right}
+
+def solve_part1(data):
+  grid, movements = data
+  grid = grid.copy() # Boxes are moved in place, so work on a copy
+  robot = grid.find(ROBOT)
+  moves = steps(grid)
+
+  for move in movements:
+    step = moves[move]
+    n = robot + step
+    if grid[n] == WALL:
       continue
 
     # Attempt to move robot and boxes
-    if (nx, ny) in boxes:
-      if move_box(boundary, boxes, nx, ny, dx, dy):
-        # Robot and boxes moved successfully
-        robot = (nx, ny)
-        continue
-    else:
-      robot = (nx, ny)
+    if grid[n] == BOX and not move_box(grid, n, step):
+      continue
+    grid[robot], grid[n] = EMPTY, ROBOT
+    robot = n
 
-  print(generate_map_part1(matrix, boundary, boxes, robot)) # For verification
+  print(grid) # For verification
 
   # Calculate sum of boxes
   total = 0
-  for (x, y) in boxes:
+  for i in grid.find_all(BOX):
+    x, y = grid.coords(i)
     total += y * 100 + x
   return total
 
-def move_box(boundary, boxes, nx, ny, dx, dy):
-  if (nx + dx, ny + dy) in boundary:
+def move_box(grid, i, step):
+  # Shifting a row of boxes by one is the same as moving its first box past the last one
+  end = i + step
+  while grid[end] == BOX:
+    end += step
+  if grid[end] == WALL:
     return False # Cannot move any boxes
 
-  if (nx + dx, ny + dy) in boxes:
-    result = move_box(boundary, boxes, nx + dx, ny + dy, dx, dy)
-    if result == False:  # Cannot move any boxes (Propagated from base case)
-      return False
-  
-  boxes.remove((nx, ny))
-  boxes.add((nx + dx, ny + dy))
+  grid[i], grid[end] = EMPTY, BOX
   return True
 
-def generate_map_part1(matrix, boundary, boxes, robot):
-  output = ""
-  for y in range(len(matrix)):
-    for x in range(len(matrix[0])):
-      if (x, y) in boundary:
-        output += "#"
-      elif (x, y) in boxes:
-        output += "O"
-      elif (x, y) == robot:
-        output += "@"
-      else:
-        output += "."
-    output += "\n"
-  return output[:-1]
-
-def solve_part2():
+def solve_part2(data):
   # Rewrote solution multiple times. Can get difficult and messy due to 
   # having to shift vertical obstacles and propagate the changes beyond
   # just the x-coordinate of the robot.
@@ -99,81 +65,70 @@ def solve_part2():
   # #   @     #         #         #
   # # # # # # #         # # # # # #
 
-  matrix, _, _, robot, movements = process_input()
-
-  # Build part 2 matrix (the warehouse)
-  new_matrix = []
-  for i in range(len(matrix)):
-    new_matrix.append([])
-    for c in matrix[i]:
-      if c == '@':
-        new_matrix[i].extend(['@', '.'])
-      elif c == '#':
-        new_matrix[i].extend(['#', '#'])
-      elif c == 'O':
-        new_matrix[i].extend(['[', ']'])
-      elif c == '.':
-        new_matrix[i].extend(['.', '.'])
-      else:
-        raise Exception(f"Error occured: Unexpected character {c} in matrix")
-
-  robot = (robot[0] * 2, robot[1]) # Update robot coordinates
-
-  for dx, dy in movements:
-    boxes_to_move =  build_boxes_to_move(new_matrix, robot[0], robot[1], dx, dy)
+  grid, movements = data
+
+  # Build part 2 grid (the warehouse)
+  widened = {"@": "@.", "#": "##", "O": "[]", ".": ".."}
+  rows = []
+  for row in grid.rows():
+    try:
+      rows.append("".join(widened[c] for c in row.decode()))
+    except KeyError as e:
+      raise Exception(f"Error occured: Unexpected character {e} in matrix")
+  grid = Grid(rows)
+  robot = grid.find(ROBOT)
+  moves = steps(grid)
+
+  for move in movements:
+    step = moves[move]
+    boxes_to_move = build_boxes_to_move(grid, robot, step)
 
     # Ensure that all boxes can be moved to new position
-    if all(new_matrix[y + dy][x + dx] == '.' for (x, y, _) in boxes_to_move):
+    if all(grid[i + step] == EMPTY for (i, _) in boxes_to_move):
       # Move boxes
-      for (x, y, half_box) in boxes_to_move:
-        new_matrix[y + dy][x + dx] = half_box
+      for (i, half_box) in boxes_to_move:
+        grid[i + step] = half_box
       # Move robot
-      robot = (robot[0] + dx, robot[1] + dy)
+      robot += step
     else:
       # Revert the replaced boxes
-      for (x, y, half_box) in boxes_to_move:
-        new_matrix[y][x] = half_box
+      for (i, half_box) in boxes_to_move:
+        grid[i] = half_box
 
-
-  printable = "\n".join("".join(line) for line in new_matrix)
-  print(printable)
+  print(grid)
   # Get final answer
   total = 0
-  for y in range(len(new_matrix)):
-    for x in range(len(new_matrix[0])):
-      if new_matrix[y][x] == '[':
-        total += 100 * y + x
+  for i in grid.find_all(BOX_LEFT):
+    x, y = grid.coords(i)
+    total += 100 * y + x
   return total
   
 
-def build_boxes_to_move(matrix, x, y, dx, dy):
-  if not is_valid(matrix, x, y):
-    return []
-
-  if matrix[y][x] == '#' or matrix[y][x] == '.':
-    return []
+def build_boxes_to_move(grid, i, step):
+  boxes_to_move = []
+  stack = [i]  # Starting box position
+  while stack:
+    i = stack.pop()
+    # Walls, empty space, the border and halves already taken stop the push
+    if grid[i] not in (ROBOT, BOX_LEFT, BOX_RIGHT):
+      continue
 
-  half_box = matrix[y][x]
-  boxes_to_move = [(x, y, half_box)]  # Starting box position
-  matrix[y][x] = '.' # Rewrite existing box to empty space
+    half_box = grid[i]
+    boxes_to_move.append((i, half_box))
+    grid[i] = EMPTY # Rewrite existing box to empty space
 
-  # Recursively find all box positions
-  if is_valid(matrix, x + dx, y + dy):
-    boxes_to_move.extend(build_boxes_to_move(matrix, x + dx, y + dy, dx, dy))
+    # Find all box positions
+    stack.append(i + step)
 
-  # Add the other half of the box
-  if half_box == "[":
-    boxes_to_move.extend(build_boxes_to_move(matrix, x + 1, y, dx, dy))
-  if half_box == "]":
-    boxes_to_move.extend(build_boxes_to_move(matrix, x - 1, y, dx, dy))
+    # Add the other half of the box
+    if half_box == BOX_LEFT:
+      stack.append(i + grid.right)
+    if half_box == BOX_RIGHT:
+      stack.append(i + grid.left)
 
   return boxes_to_move
 
-def is_valid(matrix, nx, ny):
-  return 0 <= nx < len(matrix[0]) and 0 <= ny < len(matrix)
-
 if __name__ == "__main__":
-  print(f"Part 1 solution: {solve_part1()}\n")
-  print(f"Part 2 solution: {solve_part2()}")
-
-
+  data = process_input("./day-15/input.txt")
+  print(f"Part 1 solution: {solve_part1(data)}\n")
+  print(f"Part 2 solution: {solve_part2(data)}")
@@ -1,64 +1,52 @@
-from collections import defaultdict
-from heapq import heappush, heappop
-
-def process_input():
-  with open("./day-16/input.txt", "r") as f:
-    matrix = [list(line.strip()) for line in f.readlines()]
-    start = None
-    end = None
-    for y in range(len(matrix)):
-      for x in range(len(matrix[0])):
-        item = matrix[y][x]
-        if item == "S":
-          start = (x, y)
-        if item == "E":
-          end = (x, y)
-    return matrix, start, end
-
-def solve():
-  matrix, start, end = process_input()
-
-  # Djikstra's algorithm
-  directions = [(1, 0), (-1, 0), (0, 1), (0, -1)]
-  reverse_directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-  best_cost = float("inf")
-  queue = [(0, start, 0, [start])] # stores (cost, coordinates, dir+index, path)
-  costs = defaultdict(lambda: float("inf"))
+from aoc.grid import Grid
+from aoc.search import UNREACHED, Search
+
+WALL, = b"#"
+EAST = 1 # index into grid.directions, which runs clockwise from up
+
+def process_input(file_path):
+  grid = Grid.from_file(file_path)
+  return grid, grid.find("S"), grid.find("E")
+
+def solve(data):
+  grid, start, end = data
+  passable = grid.passable(WALL)
+  steps = grid.directions
+
+  # Djikstra's algorithm over states (cell, direction), numbered cell * 4 + direction.
+  # Moving on costs 1 and turning + moving costs 1001, so Dial's buckets beat a heap.
+  # Direction (d + 2) % 4 is the reverse of d, which is where we came from.
+  def forward(state):
+    cell, d = divmod(state, 4)
+    for i in range(4):
+      if i != (d + 2) % 4 and passable[cell + steps[i]]:
+        yield (cell + steps[i]) * 4 + i, 1 if i == d else 1001
+
+  # The same moves backwards, to search from the end
+  def backward(state):
+    cell, i = divmod(state, 4)
+    came_from = cell - steps[i]
+    if passable[came_from]:
+      for d in range(4):
+        if d != (i + 2) % 4:
+          yield came_from * 4 + d, 1 if i == d else 1001
+
+  size = len(grid) * 4
+  from_start = Search(size).dial([start * 4 + EAST], forward, 1001)
+  to_end = Search(size).dial([end * 4 + d for d in range(4)], backward, 1001)
+
+  best_cost = min(from_start[end * 4 + d] for d in range(4) if from_start[end * 4 + d] != UNREACHED)
+
+  # A tile is on one of the best paths if, facing some direction, the cheapest way there
+  # plus the cheapest way on from there to the end is the best cost.
   paths = set()
+  for state, (cost, remaining) in enumerate(zip(from_start, to_end)):
+    if cost != UNREACHED and remaining != UNREACHED and cost + remaining == best_cost:
+      paths.add(state // 4)
 
-  while queue:
-    cost, coord, dir_index, path = heappop(queue)
-
-    if cost > costs[(coord, dir_index)]:
-      continue
-    costs[(coord, dir_index)] = cost
-
-    if coord == end and cost <= best_cost:
-      pathSet = set(path)
-      paths = paths | pathSet
-      best_cost = cost # This is changeed once and never again due to the use of Djikstra's.
-      # Djikstra's ensures the best cost if found as the first solution.
-
-    for i, dir in enumerate(directions):
-      # Check if we are going in the "reverse" direction AKA where we came from.
-      if dir == reverse_directions[dir_index]:
-        continue
-
-      new_coord = (coord[0] + dir[0], coord[1] + dir[1])
-      if is_valid(matrix, new_coord):
-        if i == dir_index:
-          heappush(queue, (cost + 1, new_coord, i, path + [new_coord]))
-        else:
-          heappush(queue, (cost + 1001, new_coord, i, path + [new_coord]))
-  
   return best_cost, len(paths)
 
-def is_valid(matrix, coordinate):
-  x, y = coordinate
-  return 0 <= x < len(matrix[0]) and 0 <= y < len(matrix) and matrix[y][x] != "#"
-
 if __name__ == "__main__":
-  part1_sol, part2_sol = solve()
+  part1_sol, part2_sol = solve(process_input("./day-16/input.txt"))
   print(f"Part 1: {part1_sol}")
   print(f"Part 2: {part2_sol}")
-
@@ -1,5 +1,5 @@
-def process_input():
-  with open("day-17/input.txt", "r") as f:
+def process_input(file_path):
+  with open(file_path, "r") as f:
     A, B, C = 0, 0, 0
     program = []
 
@@ -44,13 +44,13 @@ def run(A, B, C, program):
 
   return output
 
-def solve_part1():
-  A, B, C, program = process_input()
+def solve_part1(data):
+  A, B, C, program = data
   ansList = run(A, B, C, program)
   return ','.join(str(num) for num in ansList)
 
-def solve_part2():
-  A, B, C, program = process_input()
+def solve_part2(data):
+  A, B, C, program = data
   A = 1
 
   # Find smallest A such that output and program length are the same.
@@ -89,6 +89,7 @@ def solve_part2():
   return helper(0, program, len(program) - 1)
 
 if __name__ == "__main__":
-  print(f"Part 1: {solve_part1()}")
-  print(f"Part 2: {solve_part2()}")
+  data = process_input("day-17/input.txt")
+  print(f"Part 1: {solve_part1(data)}")
+  print(f"Part 2: {solve_part2(data)}")
 
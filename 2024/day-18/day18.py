@@ -1,58 +1,97 @@
-from collections import deque
-import time
+from collections import Counter
 
-def process_input():
-  with open("day-18/input.txt", "r") as f:
+from aoc.dsu import DSU
+from aoc.grid import Grid
+from aoc.instrument import timeit
+from aoc.search import UNREACHED, Search
+
+SIZE = 71 # coordinates go from 0 to 70
+
+def process_input(file_path):
+  with open(file_path, "r") as f:
     input = [tuple(map(int, line.strip().split(','))) for line in f.readlines()]
     return input
 
-def solve_part1():
-  input = process_input()
-  matrix = [['.' for _ in range(71)] for _ in range(71)]
+def memory_space():
+  return Grid(["." * SIZE] * SIZE)
+
+@timeit
+def solve_part1(input):
+  grid = memory_space()
 
   # Only first kilobyte required
-  walls = set()
-  for i in range(1024):
-    walls.add(input[i])
-  return bfs(matrix, walls)
-
-def solve_part2():
-  input = process_input()
-  matrix = [['.' for _ in range(71)] for _ in range(71)]
-
-  # Currently brute forced and runs in about ~3s with pypy3, can be optimized by
-  # continuing bfs with an added wall whenever there is a solution to the bfs.
-  walls = set()
-  for i in range(len(input)):
-    if i < 1024: pass
-    walls.add(input[i])
-
-    # No solution
-    if not bfs(matrix, walls):
-      return input[i]
-  return None
+  passable = grid.passable()
+  for x, y in input[:1024]:
+    passable[grid.index(x, y)] = 0
+  return bfs(grid, passable, Search(len(grid)))
+
+@timeit
+def solve_part2(input):
+  # Used to brute force a bfs after every byte (~3s with pypy3). Bytes only ever block
+  # paths though, so binary search for the first byte after which there is no path.
+  grid = memory_space()
+  empty = grid.passable()
+  fallen = [grid.index(x, y) for x, y in input]
+  search = Search(len(grid)) # reused by every bfs
 
-def bfs(matrix, walls):
-  q = deque()
-  visited = set()
-  directions = [(1, 0), (-1, 0), (0, 1), (0, -1)]
-  q.append((0, 0, 0))
-
-  while q:
-    x, y, steps = q.popleft()
-    if (x, y) == (70, 70):
-      return steps
-    for dx, dy in directions:
-      nx, ny = x + dx, y + dy
-      if (nx, ny) not in walls and 0 <= nx < len(matrix[0]) and 0 <= ny < len(matrix):
-        if (nx, ny) not in visited:
-          visited.add((nx, ny))
-          q.append((nx, ny, steps + 1))
+  def blocked(no_of_bytes):
+    passable = bytearray(empty)
+    for i in fallen[:no_of_bytes]:
+      passable[i] = 0
+    return not bfs(grid, passable, search)
+
+  lo, hi = 1, len(input)
+  if not blocked(hi):
+    return None
+  while lo < hi:
+    mid = (lo + hi) // 2
+    if blocked(mid):
+      hi = mid
+    else:
+      lo = mid + 1
+  return input[lo - 1]
+
+@timeit
+def solve_part2_dsu(input):
+  # No searching at all: let every byte fall, then take them back last first, joining
+  # each freed cell to its free neighbours, until the corners connect again. The byte
+  # taken back then is the first one that cut them apart.
+  grid = memory_space()
+  passable = grid.passable()
+  fallen = [grid.index(x, y) for x, y in input]
+  bytes_on = Counter(fallen) # a cell is only free once every byte on it is gone
+  for i in fallen:
+    passable[i] = 0
+
+  regions = DSU(len(grid))
+  for i in grid.indices():
+    if passable[i]:
+      for step in (grid.right, grid.down):
+        if passable[i + step]:
+          regions.union(i, i + step)
+
+  start, end = grid.index(0, 0), grid.index(SIZE - 1, SIZE - 1)
+  if regions.connected(start, end):
+    return None
+  for no_of_bytes in range(len(fallen) - 1, -1, -1):
+    i = fallen[no_of_bytes]
+    bytes_on[i] -= 1
+    if bytes_on[i]:
+      continue
+    passable[i] = 1
+    for step in grid.directions:
+      if passable[i + step]:
+        regions.union(i, i + step)
+    if regions.connected(start, end):
+      return input[no_of_bytes]
   return None
 
+def bfs(grid, passable, search):
+  start, end = grid.index(0, 0), grid.index(SIZE - 1, SIZE - 1)
+  dist = search.bfs_grid([start], passable, grid.directions, target=end)
+  return dist[end] if dist[end] != UNREACHED else None
+
 if __name__ == "__main__":
-  print(f"Part 1: {solve_part1()}")
-  start = time.time()
-  print(f"Part 2: {solve_part2()}")
-  elapsed = time.time()
-  print(elapsed - start)
+  input = process_input("day-18/input.txt")
+  print(f"Part 1: {solve_part1(input)}")
+  print(f"Part 2: {solve_part2(input)}")
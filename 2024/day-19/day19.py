@@ -1,52 +1,69 @@
-def process_input():
-  with open("./day-19/input.txt", "r") as f:
+from aoc import counters
+from aoc.counters import COUNTING
+
+def process_input(file_path):
+  with open(file_path, "r") as f:
     towels, patterns = f.read().split('\n\n')
     towels = towels.split(', ')
     patterns = patterns.split('\n')[:-1]
     return towels, patterns
 
-def solve_part1():
-  towels, patterns = process_input()
-
-  def helper(pattern, towels):
-    if len(pattern) == 0:
-      return 1
-    for t in towels:
-      if len(t) <= len(pattern) and pattern[:len(t)] == t:
-        res = helper(pattern[len(t):], towels)
-        if res:
-          return res
-    return 0
-
+def solve_part1(data):
+  towels, patterns = data
+  towels, lengths = towel_lengths(towels)
   total = 0
   for p in patterns:
-    total += helper(p, towels)
+    total += can_make(p, towels, lengths)
   return total
 
-def solve_part2():
-  towels, patterns = process_input()
-  cache = {} # memoization to avoid repeated work
+def solve_part2(data):
+  towels, patterns = data
+  towels, lengths = towel_lengths(towels)
+  total = 0
+  for p in patterns:
+    total += count_ways(p, towels, lengths)
+  return total
 
-  def helper(pattern, towels):
-    if pattern in cache:
-      return cache[pattern]
+def towel_lengths(towels):
+  # Looking the next few letters up in a set beats comparing every towel
+  return set(towels), sorted({len(t) for t in towels})
 
-    if len(pattern) == 0:
+def can_make(pattern, towels, lengths):
+  # Explicit stack of where the rest of the pattern starts. Whether a rest can be made
+  # doesn't depend on how we got there, so each start is only tried once.
+  stack, seen = [0], {0}
+  while stack:
+    start = stack.pop()
+    if COUNTING:
+      counters.add("states")
+      counters.peak("max_stack", len(stack) + 1)
+    if start == len(pattern):
       return 1
+    for l in lengths:
+      rest = start + l
+      if rest > len(pattern):
+        break
+      if rest not in seen and pattern[start:rest] in towels:
+        seen.add(rest)
+        stack.append(rest)
+  return 0
 
-    res = 0
-    for t in towels:
-      if len(t) <= len(pattern) and pattern[:len(t)] == t:
-        res += helper(pattern[len(t):], towels)
-
-    cache[pattern] = res
-    return res
-
-  total = 0
-  for p in patterns:
-    total += helper(p, towels)
-  return total
+def count_ways(pattern, towels, lengths):
+  # ways[i] is the number of arrangements of pattern[i:], filled in from the end
+  # instead of recursing down from the start
+  ways = [0] * len(pattern) + [1]
+  for start in range(len(pattern) - 1, -1, -1):
+    for l in lengths:
+      rest = start + l
+      if rest > len(pattern):
+        break
+      if pattern[start:rest] in towels:
+        ways[start] += ways[rest]
+  if COUNTING:
+    counters.add("states", len(pattern))
+  return ways[0]
 
 if __name__ == "__main__":
-  print(solve_part1())
-  print(solve_part2())
+  data = process_input("./day-19/input.txt")
+  print(solve_part1(data))
+  print(solve_part2(data))
@@ -1,77 +1,63 @@
-from collections import deque
+from aoc.grid import Grid
+from aoc.search import Search
 
-def process_input():
-  with open("./day-20/input.txt", "r") as f:
-    matrix = [list(line.strip()) for line in f.readlines()]
-    start, end = (-1, -1), (-1, -1)
-    for y in range(len(matrix)):
-      for x in range(len(matrix[0])):
-        if matrix[y][x] == "S": start = (x, y)
-        if matrix[y][x] == "E": end = (x, y)
-    return matrix, start, end
+WALL, = b"#"
 
-def bfs(mat, origin):
-  q = deque([(origin[0], origin[1], 0)])
-  distances = {origin: 0}
-  dirs = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+def process_input(file_path):
+  grid = Grid.from_file(file_path)
+  return grid, grid.find("S"), grid.find("E")
 
-  while q:
-    x, y, steps = q.popleft()
+def bfs(grid, origin):
+  # Distances by cell index (every track cell is reachable from both ends)
+  return Search(len(grid)).bfs_grid([origin], grid.passable(WALL), grid.directions)
 
-    for dx, dy in dirs:
-      nx, ny = x + dx, y + dy
-      if (0 <= nx < len(mat[0]) and 0 <= ny < len(mat)
-          and (nx, ny) not in distances and mat[ny][nx] != "#"):
-        distances[(nx, ny)] = steps + 1
-        q.append((nx, ny, steps + 1))
-
-  return distances
-
-def solve():
-  mat, start, end = process_input()
+def solve(data):
+  grid, start, end = data
 
   # Part 1:
-  from_start, to_end = bfs(mat, start), bfs(mat, end)
+  from_start, to_end = bfs(grid, start), bfs(grid, end)
   steps_without_cheat = from_start[end]
 
-  dirs = [(1, 0), (-1, 0), (0, 1), (0, -1)]
   part1 = 0
-  for y in range(len(mat)):
-    for x in range(len(mat[0])):
-      if mat[y][x] != "#":
-          continue
-
-      valid_neighbors = []
-      for dx, dy in dirs:
-        nx, ny = x + dx, y + dy
-        if 0 <= nx < len(mat[0]) and 0 <= ny < len(mat) and mat[ny][nx] != "#":
-          valid_neighbors.append((nx, ny))
-
-      for i, (nx1, ny1) in enumerate(valid_neighbors):
-        for j in range(i + 1, len(valid_neighbors)):
-          nx2, ny2 = valid_neighbors[j]
-
-          steps_with_cheat = min(
-            from_start[(nx1, ny1)] + to_end[(nx2, ny2)] + 2,
-            from_start[(nx2, ny2)] + to_end[(nx1, ny1)] + 2
-          )
-          part1 += 1 if steps_without_cheat - steps_with_cheat >= 100 else 0
+  passable = grid.passable(WALL)
+  for i in grid.find_all(WALL):
+    valid_neighbors = [i + step for step in grid.directions if passable[i + step]]
+
+    for a, n1 in enumerate(valid_neighbors):
+      for n2 in valid_neighbors[a + 1:]:
+        steps_with_cheat = min(
+          from_start[n1] + to_end[n2] + 2,
+          from_start[n2] + to_end[n1] + 2
+        )
+        part1 += 1 if steps_without_cheat - steps_with_cheat >= 100 else 0
 
   # Part 2:
-  tracks = [(x, y) for y in range(len(mat)) for x in range(len(mat[0])) if mat[y][x] != "#"]
+  # Instead of comparing every pair of track cells, only look at the cells within 20
+  # steps of each one. Offsets only go "forwards" (down, or right on the same row) so
+  # every pair is still counted once, and x is bounds checked as rows would wrap.
+  cheats = [
+    (dx, dy, dy * grid.stride + dx, abs(dx) + abs(dy))
+    for dy in range(21)
+    for dx in range(-20, 21)
+    if abs(dx) + abs(dy) <= 20 and (dy > 0 or dx > 0)
+  ]
 
   part2 = 0
-  for i, (x1, y1) in enumerate(tracks):
-    for j in range(i + 1, len(tracks)): 
-      x2, y2 = tracks[j]
+  for i1 in grid.indices():
+    if grid[i1] == WALL:
+      continue
+    x1, y1 = grid.coords(i1)
 
-      manhattan_distance = abs(x1 - x2) + abs(y1 - y2)
-      if manhattan_distance > 20:
+    for dx, dy, offset, manhattan_distance in cheats:
+      if not (0 <= x1 + dx < grid.width and y1 + dy < grid.height):
+        continue
+      i2 = i1 + offset
+      if grid[i2] == WALL:
         continue
 
       steps_with_cheat = min(
-        from_start[(x1, y1)] + to_end[(x2, y2)] + manhattan_distance,
-        from_start[(x2, y2)] + to_end[(x1, y1)] + manhattan_distance
+        from_start[i1] + to_end[i2] + manhattan_distance,
+        from_start[i2] + to_end[i1] + manhattan_distance
       )
       part2 += 1 if steps_without_cheat - steps_with_cheat >= 100 else 0
 
@@ -79,4 +65,4 @@ def solve():
 
 
 if __name__ == "__main__":
-  print(solve())
+  print(solve(process_input("./day-20/input.txt")))
@@ -1,13 +1,22 @@
-from functools import cache
-import time
+from aoc.instrument import timeit
+from aoc.memo import memo
 
-def process_input():
-  with open("./day-21/input.txt", "r") as f:
-    return f.read().split()
+numpad = {
+  '7': (0, 0), '8': (1, 0), '9': (2, 0),
+  '4': (0, 1), '5': (1, 1), '6': (2, 1),
+  '1': (0, 2), '2': (1, 2), '3': (2, 2),
+               '0': (1, 3), 'A': (2, 3)
+}
+arrowkeys = {
+               '^': (1, 0), 'A': (2, 0),
+  '<': (0, 1), 'v': (1, 1), '>': (2, 1)
+}
 
-def solve(max_depth):
-  codes = process_input()
+def process_input(file_path):
+  with open(file_path, "r") as f:
+    return f.read().split()
 
+def solve(codes, max_depth):
   res = 0
   for code in codes:
     complexity = 0
@@ -20,7 +29,15 @@ def solve(max_depth):
     res += complexity * int(code[:-1]) 
   return res
 
-@cache
+@timeit
+def solve_part1(codes):
+  return solve(codes, 2)
+
+@timeit
+def solve_part2(codes):
+  return solve(codes, 25)
+
+@memo()
 def step(curr, target, depth, max_depth):
   # At each step, we find the required movement and compute all permutations 
   # of horizontal/vertical movements.
@@ -74,19 +91,7 @@ def generate_valid_permutations(cx, cy, tx, ty, horizontal, vertical, pad):
   return permutations
 
 if __name__ == "__main__":
-  numpad = {
-    '7': (0, 0), '8': (1, 0), '9': (2, 0),
-    '4': (0, 1), '5': (1, 1), '6': (2, 1),
-    '1': (0, 2), '2': (1, 2), '3': (2, 2),
-                 '0': (1, 3), 'A': (2, 3)
-  }
-  arrowkeys = {
-                 '^': (1, 0), 'A': (2, 0),
-    '<': (0, 1), 'v': (1, 1), '>': (2, 1)
-  }
-
-  print(f"Part 1: {solve(2)}")
-  curr= time.time()
-  print(f"Part 2: {solve(25)}")
-  print(f"Part 2 took: {(time.time() - curr):.5f}s")
+  codes = process_input("./day-21/input.txt")
+  print(f"Part 1: {solve_part1(codes)}")
+  print(f"Part 2: {solve_part2(codes)}")
   # Part 2 takes only ~0.0008s!
@@ -1,14 +1,13 @@
 import time
-from functools import lru_cache
 
-def process_input():
-  with open("./day-21/input.txt", "r") as f:
+from aoc.memo import memo
+
+def process_input(file_path):
+  with open(file_path, "r") as f:
     codes = [i.strip() for i in f.readlines()]
     return codes
 
-def solve(max_depth):
-  codes = process_input()
-
+def solve(codes, max_depth):
   coords = {
     '7': (0, 0), '8': (1, 0), '9': (2, 0),
     '4': (0, 1), '5': (1, 1), '6': (2, 1),
@@ -46,7 +45,13 @@ def solve(max_depth):
 
   return res
 
-@lru_cache
+def solve_part1(codes):
+  return solve(codes, 2)
+
+def solve_part2(codes):
+  return solve(codes, 25)
+
+@memo(maxsize=128) # lru_cache's default size
 def compute_for_next_robot(commands):
   coords = {
                  '^': (1, 0), 'A': (2, 0),
@@ -66,7 +71,7 @@ def compute_for_next_robot(commands):
 
   return converted_commands
 
-@lru_cache
+@memo(maxsize=128) # lru_cache's default size
 def move(curr, target, invalid_coord):
   x_commands = ""
   y_commands = ""
@@ -101,7 +106,8 @@ def move(curr, target, invalid_coord):
 
 if __name__ == "__main__":
   curr = time.time()
-  print(f"Part 1: {solve(2)}")
-  print(f"Part 2: {solve(25)}")
+  codes = process_input("./day-21/input.txt")
+  print(f"Part 1: {solve_part1(codes)}")
+  print(f"Part 2: {solve_part2(codes)}")
   elapsed = time.time()
   print(elapsed-curr)
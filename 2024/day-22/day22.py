@@ -1,8 +1,9 @@
 from collections import deque
 
-def process_input():
-  with open("./day-22/input.txt", "r") as f:
-    return list(map(int, f.read().split()))
+from aoc.ints import read_ints
+
+def process_input(file_path):
+  return read_ints(file_path)
 
 def solve_part1(secrets):
   updated_secrets = []
@@ -51,6 +52,6 @@ def transform(secret):
   return secret
 
 if __name__ == "__main__":
-  secrets = process_input()
+  secrets = process_input("./day-22/input.txt")
   print(f"Part 1: {solve_part1(secrets)}")
   print(f"Part 2: {solve_part2(secrets)}")
@@ -1,12 +1,13 @@
 from itertools import combinations
 
-def process_input():
-  with open("./day-23/input.txt", "r") as f:
+from aoc import counters
+
+def process_input(file_path):
+  with open(file_path, "r") as f:
     connections = f.read().split()
     return connections
 
-def solve_part1():
-  connections = process_input()
+def solve_part1(connections):
   graph = {}
   
   for connection in connections:
@@ -24,8 +25,7 @@ def solve_part1():
 
   return len(triplets_with_t)
 
-def solve_part2():
-  connections = process_input()
+def solve_part2(connections):
   graph = {}
   
   for connection in connections:
@@ -49,6 +49,7 @@ def solve_part2():
   return ",".join(sorted(max_clique))
 
 def compute_max_clique(adj_matrix):
+  @counters.counted("helper")
   def helper(clique, candidates):
     # Base case
     if not candidates:
@@ -70,5 +71,6 @@ def compute_max_clique(adj_matrix):
   return helper([], list(range(len(adj_matrix))))
 
 if __name__ == "__main__":
-  print(solve_part1())
-  print(solve_part2())
+  connections = process_input("./day-23/input.txt")
+  print(solve_part1(connections))
+  print(solve_part2(connections))
@@ -1,7 +1,7 @@
 from copy import deepcopy
 
-def process_input():
-  with open("./day-24/input.txt", "r") as f:
+def process_input(file_path):
+  with open(file_path, "r") as f:
     raw_values, raw_gates = [line.strip().split("\n") for line in f.read().split("\n\n")]
     
     values = {}
@@ -16,8 +16,9 @@ def process_input():
 
     return values, gates
 
-def part1():
-  values, gates = process_input()
+def part1(data):
+  values, gates = data
+  values, gates = dict(values), dict(gates) # Both are consumed below, so work on copies
 
   while gates:
     gates_copy = deepcopy(gates)
@@ -42,7 +43,7 @@ def part1():
   return int(bin, 2)
 
 
-def part2():
+def part2(data):
   # Cases = no. of ways to choose 8 items in 222 items * no. of permutations of 8 items
   #       = 222C8 * 8!
   #       = 5e18 (Cannot bruteforce)
@@ -52,7 +53,7 @@ def part2():
   # carry_n = OR(AND(xn, yn), AND(carry_(n-1), XOR(xn, yn))
   # zn = XOR(carry_(n-1), XOR(xn, yn))
 
-  _, gates = process_input()
+  _, gates = data
   gates_to_output = {value: key for key, value in gates.items()}
   z_msb = max([i for i in gates if i[0] == 'z'], key=lambda k: int(k[1:]))
 
@@ -96,5 +97,6 @@ def alu(x, y, operator):
   elif operator == "XOR": return x ^ y
 
 if __name__ == "__main__":
-  print(part1())
-  print(part2())
+  data = process_input("./day-24/input.txt")
+  print(part1(data))
+  print(part2(data))
@@ -1,6 +1,6 @@
-def process_input():
+def process_input(file_path):
   chunks = []
-  with open("./day-25/input.txt", "r") as f:
+  with open(file_path, "r") as f:
     chunks = [line.split() for line in f.read().split('\n\n')]
 
   keys, locks = [], []
@@ -16,12 +16,12 @@ def process_input():
   return locks, keys, lock_height
 
 
-def solve_part1():
-  locks, keys, lock_height = process_input()
+def solve_part1(data):
+  locks, keys, lock_height = data
   return sum(1 for lock in locks
                for key in keys 
                if all(l + k <= lock_height for l, k in zip(lock, key)))
 
 
 if __name__ == "__main__":
-  print(solve_part1())
+  print(solve_part1(process_input("./day-25/input.txt")))
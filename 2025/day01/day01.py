@@ -1,15 +1,4 @@
-from time import perf_counter_ns
-
-
-def timeit(f):
-    def wrap(*args, **kwargs):
-        start = perf_counter_ns()
-        res = f(*args, **kwargs)
-        end = perf_counter_ns()
-        print(f"Function {f.__name__} took {(end - start) / 1000000:.2f}ms")
-        return res
-
-    return wrap
+from aoc.instrument import timeit
 
 
 @timeit
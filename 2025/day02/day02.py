@@ -1,8 +1,8 @@
-from time import perf_counter_ns
+from operator import add
+from typing import Callable
 
-# For parallelization
-import os
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from aoc import parallel
+from aoc.instrument import timeit
 
 """
 Runtime       | p1 seq    | p2 seq     | p1 par (procs) | part2 par (procs) | p1 par (threads) | part 2 parallel (threads)
@@ -15,17 +15,6 @@ Python 3.14T* | 330.06 ms | 861.74 ms  | 160.00 ms      | 250.72ms          | 73
 """
 
 
-def timeit(f):
-    def wrap(*args, **kwargs):
-        start = perf_counter_ns()
-        res = f(*args, **kwargs)
-        end = perf_counter_ns()
-        print(f"Function {f.__name__} took {(end - start) / 1e6:.2f}ms")
-        return res
-
-    return wrap
-
-
 @timeit
 def read_input(file_path: str) -> list[tuple[int, int]] | None:
     try:
@@ -97,80 +86,80 @@ def part2(input: list[tuple[int, int]]) -> int:
 
 
 # === Parallelized ===
-def part1_par_worker(left: int, right: int) -> int:
+def part1_par_worker(ranges: list[tuple[int, int]]) -> int:
     local_sum = 0
-    for id_int in range(left, right + 1):
-        id_str = str(id_int)
-        id_len = len(id_str)
+    for left, right in ranges:
+        for id_int in range(left, right + 1):
+            id_str = str(id_int)
+            id_len = len(id_str)
 
-        # odd no. of digits is always valid
-        if id_len % 2 != 0:
-            continue
+            # odd no. of digits is always valid
+            if id_len % 2 != 0:
+                continue
 
-        substr_len = id_len // 2
-        if is_invalid(id_str, id_len, substr_len):
-            local_sum += id_int
+            substr_len = id_len // 2
+            if is_invalid(id_str, id_len, substr_len):
+                local_sum += id_int
     return local_sum
 
 
-def part2_par_worker(left: int, right: int) -> int:
+def part2_par_worker(ranges: list[tuple[int, int]]) -> int:
     local_sum = 0
-    for id_int in range(left, right + 1):
-        id_str = str(id_int)
-        id_len = len(id_str)
+    for left, right in ranges:
+        for id_int in range(left, right + 1):
+            id_str = str(id_int)
+            id_len = len(id_str)
 
-        max_substr_len = id_len // 2
-        for substr_len in range(max_substr_len, 0, -1):
-            if id_len % substr_len != 0:
-                continue
-            if is_invalid(id_str, id_len, substr_len):
-                local_sum += id_int
-                break
+            max_substr_len = id_len // 2
+            for substr_len in range(max_substr_len, 0, -1):
+                if id_len % substr_len != 0:
+                    continue
+                if is_invalid(id_str, id_len, substr_len):
+                    local_sum += id_int
+                    break
     return local_sum
 
 
+def run_par(
+    worker: Callable[[list[tuple[int, int]]], int],
+    input: list[tuple[int, int]],
+    kind: parallel.Kind | None = None,
+) -> int:
+    # Load balanced: the ranges are re-cut into chunks with the same number of ids each,
+    # instead of one task per range (some ranges are much larger than others)
+    chunks = parallel.split_ranges(input, parallel.chunk_count())
+    return parallel.map_reduce(worker, [(chunk,) for chunk in chunks], add, 0, kind=kind)
+
+
+@timeit
+def part1_par(input: list[tuple[int, int]]) -> int:
+    # threads on free threaded Python, processes otherwise
+    return run_par(part1_par_worker, input)
+
+
+@timeit
+def part2_par(input: list[tuple[int, int]]) -> int:
+    return run_par(part2_par_worker, input)
+
+
 @timeit
 def part1_par_procs(input: list[tuple[int, int]]) -> int:
-    num_workers = os.cpu_count() or 1
-    with ProcessPoolExecutor(max_workers=num_workers) as executor:
-        # should probably load balance the work as some ranges can be larger than others
-        futures = [
-            executor.submit(part1_par_worker, left, right) for (left, right) in input
-        ]
-        return sum(f.result() for f in futures)
+    return run_par(part1_par_worker, input, "processes")
 
 
 @timeit
 def part2_par_procs(input: list[tuple[int, int]]) -> int:
-    num_workers = os.cpu_count() or 1
-    with ProcessPoolExecutor(max_workers=num_workers) as executor:
-        # should probably load balance the work as some ranges can be larger than others
-        futures = [
-            executor.submit(part2_par_worker, left, right) for (left, right) in input
-        ]
-        return sum(f.result() for f in futures)
+    return run_par(part2_par_worker, input, "processes")
 
 
 @timeit
 def part1_par_threads(input: list[tuple[int, int]]) -> int:
-    num_workers = os.cpu_count() or 1
-    with ThreadPoolExecutor(max_workers=num_workers) as executor:
-        # should probably load balance the work as some ranges can be larger than others
-        futures = [
-            executor.submit(part1_par_worker, left, right) for (left, right) in input
-        ]
-        return sum(f.result() for f in futures)
+    return run_par(part1_par_worker, input, "threads")
 
 
 @timeit
 def part2_par_threads(input: list[tuple[int, int]]) -> int:
-    num_workers = os.cpu_count() or 1
-    with ThreadPoolExecutor(max_workers=num_workers) as executor:
-        # should probably load balance the work as some ranges can be larger than others
-        futures = [
-            executor.submit(part2_par_worker, left, right) for (left, right) in input
-        ]
-        return sum(f.result() for f in futures)
+    return run_par(part2_par_worker, input, "threads")
 
 
 if __name__ == "__main__":
@@ -181,7 +170,11 @@ if __name__ == "__main__":
     print(part1(input))
     print(part2(input))
 
-    # Parallel
+    # Parallel (picks threads or processes for this interpreter)
+    print(part1_par(input))
+    print(part2_par(input))
+
+    # Parallel Processes
     print(part1_par_procs(input))
     print(part2_par_procs(input))
 
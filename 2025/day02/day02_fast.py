@@ -1,16 +1,6 @@
-from time import monotonic_ns
 from math import isqrt
 
-
-def timeit(f):
-    def wrap(*args, **kwargs):
-        start = monotonic_ns()
-        res = f(*args, **kwargs)
-        end = monotonic_ns()
-        print(f"Function {f.__name__} took {(end - start) / 1e6:.2f}ms")
-        return res
-
-    return wrap
+from aoc.instrument import timeit
 
 
 @timeit
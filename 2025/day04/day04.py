@@ -1,22 +1,13 @@
-from time import perf_counter_ns
+from aoc.grid import Grid
+from aoc.instrument import timeit
 
-
-def timeit(f):
-    def wrap(*args, **kwargs):
-        start = perf_counter_ns()
-        res = f(*args, **kwargs)
-        end = perf_counter_ns()
-        print(f"Function {f.__name__} took {(end - start) / 1e6:.2f}ms")
-        return res
-
-    return wrap
+ROLL, EMPTY = b"@."
 
 
 @timeit
-def read_input(file_path: str) -> list[str] | None:
+def read_input(file_path: str) -> Grid | None:
     try:
-        with open(file_path, "r") as f:
-            return f.read().split()
+        return Grid.from_file(file_path)
     except FileNotFoundError:
         print(f"Error: The file '{file_path}' was not found.")
     except Exception as e:
@@ -24,58 +15,45 @@ def read_input(file_path: str) -> list[str] | None:
 
 
 @timeit
-def part1(grid: list[str]) -> int:
-    rows = len(grid)
-    cols = len(grid[0])
-
+def part1(grid: Grid) -> int:
     accessible = 0
-    for i in range(rows):
-        for j in range(cols):
-            if grid[i][j] != "@":
-                continue
+    for i in grid.find_all(ROLL):
+        # count adjacent, the border is never a roll
+        count = 0
+        for step in grid.neighbours:
+            if grid[i + step] == ROLL:
+                count += 1
 
-            # count adjacent
-            count = 0
-            for di in (-1, 0, 1):
-                for dj in (-1, 0, 1):
-                    if (
-                        not (di == 0 and dj == 0)
-                        and 0 <= i + di < rows
-                        and 0 <= j + dj < cols
-                        and grid[i + di][j + dj] == "@"
-                    ):
-                        count += 1
-
-            if count < 4:
-                accessible += 1
+        if count < 4:
+            accessible += 1
 
     return accessible
 
 
 @timeit
-def part2(grid: list[str]) -> int:
-    # Use set instead for speed
-    occupied = set()
-    for i in range(len(grid)):
-        for j in range(len(grid[0])):
-            if grid[i][j] == "@":
-                occupied.add((i, j))
-    initial_size = len(occupied)
+def part2(grid: Grid) -> int:
+    # Remove rolls from a copy of the grid, and only rescan the rolls still standing
+    grid = grid.copy()
+    rolls = grid.find_all(ROLL)
+    initial_size = len(rolls)
 
     needs_rescan = True
     while needs_rescan:
         needs_rescan = False
-        for i, j in occupied.copy():
+        remaining = []
+        for i in rolls:
             count = 0
-            for di in (-1, 0, 1):
-                for dj in (-1, 0, 1):
-                    if not (di == 0 and dj == 0) and (i + di, j + dj) in occupied:
-                        count += 1
+            for step in grid.neighbours:
+                if grid[i + step] == ROLL:
+                    count += 1
             if count < 4:
-                occupied.remove((i, j))
+                grid[i] = EMPTY
                 needs_rescan = True
+            else:
+                remaining.append(i)
+        rolls = remaining
 
-    return initial_size - len(occupied)
+    return initial_size - len(rolls)
 
 
 if __name__ == "__main__":
@@ -1,29 +1,17 @@
-from time import perf_counter_ns
 from bisect import bisect_right
+from typing import Sequence
 
-
-def timeit(f):
-    def wrap(*args, **kwargs):
-        start = perf_counter_ns()
-        res = f(*args, **kwargs)
-        end = perf_counter_ns()
-        print(f"Function {f.__name__} took {(end - start) / 1e6:.2f}ms")
-        return res
-
-    return wrap
+from aoc.instrument import timeit
+from aoc.ints import ints, read_bytes, records
 
 
 @timeit
-def read_input(file_path: str) -> tuple[list[tuple[int, int]], list[int]] | None:
+def read_input(file_path: str) -> tuple[list[tuple[int, int]], Sequence[int]] | None:
     try:
-        with open(file_path, "r") as f:
-            ranges_str, ids_str = f.read().split("\n\n", 1)
-            ranges: list[tuple[int, int]] = []
-            for r in ranges_str.split():
-                start_str, end_str = r.split("-", 1)
-                ranges.append((int(start_str), int(end_str)))
-            ids = list(map(int, ids_str.split()))
-            return ranges, ids
+        with read_bytes(file_path) as data:
+            ranges_bytes, ids_bytes = data.split(b"\n\n", 1)
+            ranges = records(ints(ranges_bytes.replace(b"-", b" ")), 2)
+            return ranges, ints(ids_bytes)
     except FileNotFoundError:
         print(f"Error: The file '{file_path}' was not found.")
     except Exception as e:
@@ -44,7 +32,7 @@ def sort_and_merge_intervals(intervals: list[tuple[int, int]]) -> list[tuple[int
 
 
 @timeit
-def part1(input: tuple[list[tuple[int, int]], list[int]]) -> int:
+def part1(input: tuple[list[tuple[int, int]], Sequence[int]]) -> int:
     intervals, ids = input
     intervals = sort_and_merge_intervals(intervals)
 
@@ -58,7 +46,7 @@ def part1(input: tuple[list[tuple[int, int]], list[int]]) -> int:
 
 
 @timeit
-def part2(input: tuple[list[tuple[int, int]], list[int]]) -> int:
+def part2(input: tuple[list[tuple[int, int]], Sequence[int]]) -> int:
     intervals, _ = input
     intervals = sort_and_merge_intervals(intervals)
 
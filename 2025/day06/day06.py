@@ -1,16 +1,6 @@
-from time import perf_counter_ns
 from math import prod
 
-
-def timeit(f):
-    def wrap(*args, **kwargs):
-        start = perf_counter_ns()
-        res = f(*args, **kwargs)
-        end = perf_counter_ns()
-        print(f"Function {f.__name__} took {(end - start) / 1e6:.2f}ms")
-        return res
-
-    return wrap
+from aoc.instrument import timeit
 
 
 @timeit
@@ -1,24 +1,14 @@
-from time import perf_counter_ns
-from collections import deque
-from functools import cache
+from aoc.grid import BORDER, Grid
+from aoc.instrument import timeit
+from aoc.memo import memo
 
-
-def timeit(f):
-    def wrap(*args, **kwargs):
-        start = perf_counter_ns()
-        res = f(*args, **kwargs)
-        end = perf_counter_ns()
-        print(f"Function {f.__name__} took {(end - start) / 1e6:.2f}ms")
-        return res
-
-    return wrap
+(SPLITTER,) = b"^"
 
 
 @timeit
-def read_input(file_path: str) -> str | None:
+def read_input(file_path: str) -> Grid | None:
     try:
-        with open(file_path, "r") as f:
-            return f.read()
+        return Grid.from_file(file_path)
 
     except FileNotFoundError:
         print(f"Error: The file '{file_path}' was not found.")
@@ -27,107 +17,83 @@ def read_input(file_path: str) -> str | None:
 
 
 @timeit
-def part1(input: str) -> int:
-    grid = list(map(list, input.strip().split()))
-    rows = len(grid)
-    cols = len(grid[0])
-
-    source = (0, 0)
-    for y in range(rows):
-        for x in range(cols):
-            if grid[y][x] == "S":
-                source = (x, y)
-                break
-
+def part1(grid: Grid) -> int:
     splits = 0
-    beams = set([source[0]])
+    beams = {grid.find("S")}
 
-    for y in range(source[1] + 1, rows):
+    while beams:
         next_beams: set[int] = set()
 
-        for x in beams:
-            if grid[y][x] == "^":
+        for i in beams:
+            below = i + grid.down
+            if grid[below] == SPLITTER:
                 splits += 1
-                if x - 1 >= 0:
-                    next_beams.add(x - 1)
-                if x + 1 <= cols:
-                    next_beams.add(x + 1)
-            else:
-                next_beams.add(x)
+                next_beams.add(below + grid.left)
+                next_beams.add(below + grid.right)
+            elif grid[below] != BORDER:
+                next_beams.add(below)
 
-        beams = next_beams
-        if not beams:
-            break
+        # Beams leaving the manifold end up on the border and are dropped
+        beams = {i for i in next_beams if grid[i] != BORDER}
 
     return splits
 
 
 @timeit
-def part2(input: str) -> int:
-    grid = list(map(list, input.strip().split()))
-    rows = len(grid)
-    cols = len(grid[0])
-
-    source = (0, 0)
-    splitters: set[tuple[int, int]] = set()
-    for y in range(rows):
-        for x in range(cols):
-            if grid[y][x] == "S":
-                source = (x, y)
-            elif grid[y][x] == "^":
-                splitters.add((x, y))
+def part2(grid: Grid) -> int:
+    # Every index from the left border cell of the bottom border row onwards is below the grid
+    bottom = grid.index(-1, grid.height)
 
     # At every split, there are 2 paths. We simply need to cache the number of paths at each
     # split and reuse our solution. We then propagate everything back up to the root.
-    @cache
-    def dfs(x: int, y: int) -> int:
+    @memo()
+    def dfs(i: int) -> int:
         # reached the end
-        if y >= rows:
+        if i >= bottom:
             return 1
 
         # out of bounds
-        if y < 0 or x < 0 or x >= cols:
+        if grid[i] == BORDER:
             return 0
 
-        if (x, y) in splitters:
-            return dfs(x - 1, y) + dfs(x + 1, y)
+        if grid[i] == SPLITTER:
+            return dfs(i + grid.left) + dfs(i + grid.right)
         else:
-            return dfs(x, y + 1)
+            return dfs(i + grid.down)
 
-    return dfs(source[0], source[1])
+    return dfs(grid.find("S"))
 
 
 @timeit
-def part2_dp(input: str) -> int:
-    grid = list(map(list, input.strip().split()))
-    rows = len(grid)
-    cols = len(grid[0])
-
-    source = (0, 0)
-    for y in range(rows):
-        for x in range(cols):
-            if grid[y][x] == "S":
-                source = (x, y)
+def part2_dp(grid: Grid) -> int:
+    rows = grid.height
+    cols = grid.width
+    source_x, source_y = grid.coords(grid.find("S"))
 
     # Chuen Yang's DP solution!
-    # DP, we propagate the number of paths down rather than propagate up with DFS
-    dp = [[0] * cols for _ in range(rows)]
-    dp[source[1]][source[0]] = 1
-
-    for row in range(1, rows):
+    # DP, we propagate the number of paths down rather than propagate up with DFS. Only the
+    # previous row is needed. The border is never a splitter, so the checks next to the
+    # edges short-circuit before reading outside `prev`.
+    prev = [0] * cols
+    prev[source_x] = 1
+
+    for row in range(source_y + 1, rows):
+        above = grid.index(0, row - 1)
+        dp = [0] * cols
         for col in range(cols):
-            dp[row][col] = dp[row - 1][col]
+            dp[col] = prev[col]
 
             # If there is a splitter at (row-1, col-1), it is the right split
-            if col + 1 < cols and grid[row - 1][col + 1] == "^":
-                dp[row][col] += dp[row - 1][col + 1]
+            if grid[above + col + 1] == SPLITTER:
+                dp[col] += prev[col + 1]
             # If there is a splitter at (row-1, col+1), it is the left split
-            if col - 1 >= 0 and grid[row - 1][col - 1] == "^":
-                dp[row][col] += dp[row - 1][col - 1]
+            if grid[above + col - 1] == SPLITTER:
+                dp[col] += prev[col - 1]
             # If there is a splitter at (row-1, col), no routes.
-            if grid[row - 1][col] == "^":
-                dp[row][col] = 0
-    return sum(dp[rows - 1][col] for col in range(cols))
+            if grid[above + col] == SPLITTER:
+                dp[col] = 0
+        prev = dp
+    return sum(prev)
 
 
 if __name__ == "__main__":
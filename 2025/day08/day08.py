@@ -1,7 +1,12 @@
-from time import perf_counter_ns
-from collections import Counter
 from math import prod
-import numpy as np
+from typing import TYPE_CHECKING, Any
+
+from aoc.dsu import DSU
+from aoc.instrument import timeit
+from aoc.ints import read_ints, records
+
+if TYPE_CHECKING:
+    import numpy as np
 
 """
 # Without numpy:
@@ -22,27 +27,10 @@ part2: 53.66ms
 """
 
 
-def timeit(f):
-    def wrap(*args, **kwargs):
-        start = perf_counter_ns()
-        res = f(*args, **kwargs)
-        end = perf_counter_ns()
-        print(f"Function {f.__name__} took {(end - start) / 1e6:.2f}ms")
-        return res
-
-    return wrap
-
-
 @timeit
 def read_input(file_path: str) -> list[tuple[int, int, int]] | None:
     try:
-        with open(file_path, "r") as f:
-            out: list[tuple[int, int, int]] = []
-            for line in f:
-                a, b, c = map(int, line.split(",", 2))
-                out.append((a, b, c))
-            return out
-
+        return records(read_ints(file_path), 3)
     except FileNotFoundError:
         print(f"Error: The file '{file_path}' was not found.")
     except Exception as e:
@@ -62,7 +50,10 @@ def get_sorted_edges(nodes: list[tuple[int, int, int]]) -> list[tuple[int, int,
     return edges
 
 
-def get_sorted_edges_numpy(nodes: list[tuple[int, int, int]]) -> np.ndarray:
+def get_sorted_edges_numpy(nodes: list[tuple[int, int, int]]) -> "np.ndarray":
+    # Imported here so parsing (and startup) doesn't pay for numpy
+    import numpy as np
+
     coords = np.array(nodes)
     n = len(nodes)
 
@@ -75,66 +66,56 @@ def get_sorted_edges_numpy(nodes: list[tuple[int, int, int]]) -> np.ndarray:
     return np.column_stack((distances[order], i_idx[order], j_idx[order]))
 
 
-def find_parent(circuits: list[int], x: int) -> int:
-    # path compression
-    if circuits[x] != x:
-        circuits[x] = find_parent(circuits, circuits[x])
-    return circuits[x]
+def endpoints(edges: "np.ndarray | list[tuple[int, int, int]]") -> Any:
+    """(id1, id2) of every edge, for DSU.union_many."""
+    if isinstance(edges, list):
+        return [(id1, id2) for _, id1, id2 in edges]
+    return edges[:, 1:]
 
 
-@timeit
-def part1(nodes: list[tuple[int, int, int]]) -> int:
-    # pretty easy, we could get dist of every coordinate from each other, sort, then go through
-    # them. union find to map to set/parent.
-    edges = get_sorted_edges_numpy(nodes)  # (distance, id1, id2)
-    circuits = list(range(len(nodes)))
+def largest_circuits(
+    nodes: list[tuple[int, int, int]], edges: "np.ndarray | list[tuple[int, int, int]]"
+) -> int:
+    circuits = DSU(len(nodes))
+    circuits.union_many(endpoints(edges[:1000]))
 
-    for _, id1, id2 in edges[:1000]:
-        parent1, parent2 = find_parent(circuits, id1), find_parent(circuits, id2)
+    largest_three = sorted(circuits.sizes(), reverse=True)[:3]
+    return prod(largest_three)
 
-        # already in the same circuit
-        if parent1 == parent2:
-            continue
 
-        # smaller parent represents circuit
-        if parent1 < parent2:
-            circuits[parent2] = parent1
-        else:
-            circuits[parent1] = parent2
+def last_connection(
+    nodes: list[tuple[int, int, int]], edges: "np.ndarray | list[tuple[int, int, int]]"
+) -> int:
+    # union until everything is one circuit, the last edge that merged two made it one
+    pairs = endpoints(edges)
+    last = DSU(len(nodes)).union_many(pairs, until=1)
+    last_two_id = pairs[last] if last >= 0 else (0, 0)
 
-    roots = [find_parent(circuits, i) for i in range(len(nodes))]
-    count = Counter(roots)
-    largest_three = sorted(count.values(), reverse=True)[:3]
-    return prod(largest_three)
+    x_coords = [nodes[id][0] for id in last_two_id]
+    return prod(x_coords)
 
 
 @timeit
-def part2(nodes: list[tuple[int, int, int]]) -> int:
-    edges = get_sorted_edges_numpy(nodes)  # (distance, id1, id2)
-    circuits = list(range(len(nodes)))
-    num_components = len(nodes)
-    last_two_id = (0, 0)
+def part1(nodes: list[tuple[int, int, int]]) -> int:
+    # pretty easy, we could get dist of every coordinate from each other, sort, then go through
+    # them. union find to map to set/parent.
+    return largest_circuits(nodes, get_sorted_edges_numpy(nodes))  # (distance, id1, id2)
 
-    for _, id1, id2 in edges:
-        parent1, parent2 = find_parent(circuits, id1), find_parent(circuits, id2)
 
-        # already in the same circuit
-        if parent1 == parent2:
-            continue
+@timeit
+def part2(nodes: list[tuple[int, int, int]]) -> int:
+    return last_connection(nodes, get_sorted_edges_numpy(nodes))
 
-        # smaller parent represents circuit
-        num_components -= 1
-        last_two_id = (id1, id2)
-        if parent1 < parent2:
-            circuits[parent2] = parent1
-        else:
-            circuits[parent1] = parent2
 
-        if num_components == 1:
-            break
+# Without numpy, kept to check the numpy edges against (python -m aoc diff 2025 8)
+@timeit
+def part1_python(nodes: list[tuple[int, int, int]]) -> int:
+    return largest_circuits(nodes, get_sorted_edges(nodes))
 
-    x_coords = [nodes[id][0] for id in last_two_id]
-    return prod(x_coords)
+
+@timeit
+def part2_python(nodes: list[tuple[int, int, int]]) -> int:
+    return last_connection(nodes, get_sorted_edges(nodes))
 
 
 if __name__ == "__main__":
@@ -1,28 +1,14 @@
-from time import perf_counter_ns
 from bisect import bisect_left, bisect_right
 
-
-def timeit(f):
-    def wrap(*args, **kwargs):
-        start = perf_counter_ns()
-        res = f(*args, **kwargs)
-        end = perf_counter_ns()
-        print(f"Function {f.__name__} took {(end - start) / 1e6:.2f}ms")
-        return res
-
-    return wrap
+from aoc import parallel
+from aoc.instrument import timeit
+from aoc.ints import read_ints, records
 
 
 @timeit
 def read_input(file_path: str) -> list[tuple[int, int]] | None:
     try:
-        with open(file_path, "r") as f:
-            out: list[tuple[int, int]] = []
-            for line in f:
-                a, b = map(int, line.split(",", 2))
-                out.append((a, b))
-            return out
-
+        return records(read_ints(file_path), 2)
     except FileNotFoundError:
         print(f"Error: The file '{file_path}' was not found.")
     except Exception as e:
@@ -33,13 +19,16 @@ def compute_area(x1: int, y1: int, x2: int, y2: int) -> int:
     return (abs(x1 - x2) + 1) * (abs(y1 - y2) + 1)
 
 
-@timeit
-def part1(nodes: list[tuple[int, int]]) -> int:
+def pair_rows(n: int) -> list[range]:
+    # Row i pairs node i with the n - i - 1 nodes after it, so split rows by that cost
+    # rather than evenly (the first rows hold most of the pairs)
+    return parallel.split_costs([n - i - 1 for i in range(n)], parallel.chunk_count())
+
+
+def largest_area(nodes: list[tuple[int, int]], rows: range) -> int:
     best = 0
     n = len(nodes)
-
-    # Embarrasingly parallel
-    for i in range(n):
+    for i in rows:
         a1, b1 = nodes[i]
         for j in range(i + 1, n):
             a2, b2 = nodes[j]
@@ -47,6 +36,13 @@ def part1(nodes: list[tuple[int, int]]) -> int:
     return best
 
 
+@timeit
+def part1(nodes: list[tuple[int, int]]) -> int:
+    # Embarrasingly parallel
+    tasks = [(nodes, rows) for rows in pair_rows(len(nodes))]
+    return parallel.map_reduce(largest_area, tasks, max, 0)
+
+
 # def is_in_polygon(vert_edges: list[tuple[int, int, int]], x: int, y: int) -> bool:
 #     # "Draw" a horizontal line on the right of the point and see if it intersects with an edge.
 #     # Eliminate edges on the left of the point. Bisect_right to avoid the edge itself
@@ -101,7 +97,6 @@ def is_valid_rectangle(
 @timeit
 def part2(nodes: list[tuple[int, int]]) -> int:
     # We compute the rect's edges and check that they do not intersect with the polygon's edges.
-    best = 0
     n = len(nodes)
     vert_edges: list[tuple[int, int, int]] = []  # x, min_y, max_y
     hori_edges: list[tuple[int, int, int]] = []  # y, min_x, max_x
@@ -119,7 +114,23 @@ def part2(nodes: list[tuple[int, int]]) -> int:
     vert_x = [e[0] for e in vert_edges]  # reduce lambda usage later (for speed)
     hori_y = [e[0] for e in hori_edges]
 
-    for i in range(n):
+    edges = (vert_edges, hori_edges, vert_x, hori_y)
+    tasks = [(nodes, rows, edges) for rows in pair_rows(n)]
+    return parallel.map_reduce(largest_valid_area, tasks, max, 0)
+
+
+def largest_valid_area(
+    nodes: list[tuple[int, int]],
+    rows: range,
+    edges: tuple[
+        list[tuple[int, int, int]], list[tuple[int, int, int]], list[int], list[int]
+    ],
+) -> int:
+    vert_edges, hori_edges, vert_x, hori_y = edges
+    best = 0  # per chunk, so the early exit below is only as good as this chunk's best
+    n = len(nodes)
+
+    for i in rows:
         x1, y1 = nodes[i]
         for j in range(i + 1, n):
             x2, y2 = nodes[j]
@@ -1,16 +1,6 @@
-from time import perf_counter_ns
-from scipy.optimize import linprog
-
-
-def timeit(f):
-    def wrap(*args, **kwargs):
-        start = perf_counter_ns()
-        res = f(*args, **kwargs)
-        end = perf_counter_ns()
-        print(f"Function {f.__name__} took {(end - start) / 1e6:.2f}ms")
-        return res
-
-    return wrap
+from aoc import counters
+from aoc.counters import COUNTING
+from aoc.instrument import timeit
 
 
 @timeit
@@ -49,37 +39,27 @@ def read_input(
         print(f"An error occurred: {e}")
 
 
-def compute_fewest_button_presses(
-    lights: int,
-    combos: list[int],
-    len_combos: int,
-    combo_idx: int,
-    presses: int,
-    state: int,
-) -> float:
-    # every button set can be selected or not selected
-    if state == lights:
-        return presses  # no smaller answers are possible from this path onwards
+def compute_fewest_button_presses(lights: int, combos: list[int]) -> float:
+    # every button set can be selected or not selected. Rather than branching on each
+    # one, keep the fewest presses reaching every state seen so far and add the button
+    # sets one at a time; states repeat, so there are far fewer than 2^len(combos)
+    fewest: dict[int, int] = {0: 0}
+    for combo in combos:
+        for state, presses in list(fewest.items()):
+            pressed_state = state ^ combo  # XOR
+            if presses + 1 < fewest.get(pressed_state, presses + 2):
+                fewest[pressed_state] = presses + 1
+        if COUNTING:
+            counters.add("states", len(fewest))
 
-    if combo_idx >= len_combos:
-        return float("inf")
-
-    pressed_state = state ^ combos[combo_idx]  # XOR
-
-    a = compute_fewest_button_presses(
-        lights, combos, len_combos, combo_idx + 1, presses + 1, pressed_state
-    )
-    b = compute_fewest_button_presses(
-        lights, combos, len_combos, combo_idx + 1, presses, state
-    )
-    return min(a, b)
+    return fewest.get(lights, float("inf"))
 
 
 @timeit
 def part1(input: list[tuple[int, list[int], list[int]]]) -> int:
     res = 0
     for lights, combos, _ in input:
-        curr = compute_fewest_button_presses(lights, combos, len(combos), 0, 0, 0)
+        curr = compute_fewest_button_presses(lights, combos)
         res += curr if curr != float("inf") else 0
     return int(res)
 
@@ -104,6 +84,9 @@ def part2(input: list[tuple[int, list[int], list[int]]]) -> int:
             Joltage 2: x_0 = 4
             Joltage 3: x_1 = 7
     """
+    # scipy takes ~0.3s to import, so only part 2 pays for it
+    from scipy.optimize import linprog
+
     res = 0
 
     for _, combos, joltages in input:
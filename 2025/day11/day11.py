@@ -1,16 +1,5 @@
-from time import perf_counter_ns
-from functools import cache
-
-
-def timeit(f):
-    def wrap(*args, **kwargs):
-        start = perf_counter_ns()
-        res = f(*args, **kwargs)
-        end = perf_counter_ns()
-        print(f"Function {f.__name__} took {(end - start) / 1e6:.2f}ms")
-        return res
-
-    return wrap
+from aoc.instrument import timeit
+from aoc.memo import memo
 
 
 @timeit
@@ -34,7 +23,7 @@ def read_input(file_path: str) -> dict[str, list[str]] | None:
 
 @timeit
 def part1(path_map: dict[str, list[str]]) -> int:
-    @cache
+    @memo()
     def dfs(curr: str) -> int:
         if curr == "out":
             return 1
@@ -48,7 +37,7 @@ def part1(path_map: dict[str, list[str]]) -> int:
 
 @timeit
 def part2(path_map: dict[str, list[str]]) -> int:
-    @cache
+    @memo()
     def dfs(curr: str, fft_found: bool, dac_found: bool) -> int:
         if curr == "out":
             return fft_found and dac_found
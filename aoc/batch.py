@@ -0,0 +1,111 @@
+"""
+Solves many inputs per day on a process pool, e.g. to check the solutions against the
+inputs of several accounts:
+
+    python -m aoc batch inputs/                 # every day found under inputs/
+    python -m aoc batch inputs/ 2024 5          # only 2024 day 5
+
+Inputs are laid out by year and day, one file per input, with day directories named like
+the solutions' (`05`, `day05` or `day-05` all work):
+
+    inputs/2024/05/alice.txt
+    inputs/2024/05/bob.txt
+    inputs/2025/day08/alice.txt
+
+Each worker imports a day's module the first time it gets one of its inputs and keeps it
+for the rest of the sweep, so the sweep pays one interpreter start and one import per
+worker and day rather than per input. Anything the solutions print is dropped. Results
+stream out as JSON lines as soon as each input finishes, in completion order:
+
+    {"year": 2024, "day": 5, "input": "inputs/2024/05/bob.txt", "ok": true,
+     "parse_ns": 812345, "parts": {"1": {"answer": "143", "elapsed_ns": 20345}, ...}}
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any, Iterator
+
+from aoc import runner
+
+# Days already imported by this worker process
+_days: dict[tuple[int, int], runner.Day] = {}
+
+
+@dataclass(frozen=True)
+class Task:
+    year: int
+    day: int
+    input_path: Path
+
+
+def discover_inputs(root: Path, year: int | None = None, day: int | None = None) -> list[Task]:
+    if not root.is_dir():
+        raise runner.SolutionError(f"{root} is not a directory")
+    tasks = []
+    for year_dir in sorted(root.iterdir()):
+        if not year_dir.is_dir() or not year_dir.name.isdigit():
+            continue
+        if year is not None and int(year_dir.name) != year:
+            continue
+        for day_dir in sorted(year_dir.iterdir()):
+            name = day_dir.name
+            number = int(name) if name.isdigit() else runner.day_dir_number(name)
+            if not day_dir.is_dir() or number is None or (day is not None and number != day):
+                continue
+            for path in sorted(day_dir.iterdir()):
+                if path.is_file() and not path.name.startswith("."):
+                    tasks.append(Task(int(year_dir.name), number, path))
+    return tasks
+
+
+def _init_worker() -> None:
+    # The sweep already keeps every core busy, so days built on aoc.parallel run serially
+    # inside a worker instead of each starting a pool of their own
+    os.environ["AOC_PARALLEL"] = "serial"
+
+
+def solve(task: Task) -> dict[str, Any]:
+    """Runs in a worker: parse and solve one input, never raising."""
+    out: dict[str, Any] = {
+        "year": task.year,
+        "day": task.day,
+        "input": str(task.input_path),
+        "worker": os.getpid(),
+    }
+    try:
+        key = (task.year, task.day)
+        if key not in _days:
+            _days[key] = runner.find_day(task.year, task.day)
+            _days[key].load()
+        day = _days[key]
+
+        # The solutions' own prints would land in the middle of the JSON lines
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            start = perf_counter_ns()
+            parsed = day.parse(task.input_path)
+            out["parse_ns"] = perf_counter_ns() - start
+            out["parts"] = {}
+            for r in runner.run_parts(day, parsed):
+                part = {"answer": str(r.answer), "elapsed_ns": r.elapsed_ns}
+                if r.counters:  # AOC_COUNTERS=1
+                    part["counters"] = r.counters
+                out["parts"][str(r.part)] = part
+        out["ok"] = True
+    except Exception as e:
+        out["ok"] = False
+        out["error"] = f"{type(e).__name__}: {e}"
+    return out
+
+
+def run(tasks: list[Task], workers: int | None = None) -> Iterator[dict[str, Any]]:
+    """Yields one result per task as it completes."""
+    # Inputs of the same day go out together, so a worker's imports get reused
+    tasks = sorted(tasks, key=lambda t: (t.year, t.day))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = [pool.submit(solve, task) for task in tasks]
+        for future in as_completed(futures):
+            yield future.result()
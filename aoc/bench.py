@@ -0,0 +1,353 @@
+"""
+Benchmarks every part (and every variant of a part) and stores the results in SQLite.
+
+Results are keyed by git commit, interpreter and a hash of the input, so a run can be
+compared with the most recent earlier run of the same part on the same interpreter and
+input (with uncommitted edits, the most recent clean run at the same commit). Running the
+suite under several interpreters (`pypy3 -m aoc bench`) fills in the rows of the comparison
+tables rendered by `table()`.
+"""
+
+import hashlib
+import math
+import platform
+import sqlite3
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+from aoc import cache, generators, instrument, runner
+
+DEFAULT_DB = runner.ROOT / ".aoc" / "bench.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    created_at REAL NOT NULL,
+    git_commit TEXT NOT NULL,
+    git_dirty INTEGER NOT NULL,
+    interpreter TEXT NOT NULL,
+    input_hash TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    part INTEGER NOT NULL,
+    variant TEXT NOT NULL,
+    n INTEGER NOT NULL,
+    min_ns INTEGER NOT NULL,
+    median_ns INTEGER NOT NULL,
+    p95_ns INTEGER NOT NULL,
+    peak_bytes INTEGER,
+    answer TEXT
+);
+CREATE INDEX IF NOT EXISTS results_key
+    ON results (year, day, part, variant, interpreter, input_hash);
+"""
+
+
+@dataclass
+class Result:
+    year: int
+    day: int
+    part: int
+    variant: str
+    record: instrument.Record
+    answer: Any
+
+    @property
+    def label(self) -> str:
+        return f"{self.year}/{self.day:02d}/part{self.part}" + (
+            f"[{self.variant}]" if self.variant else ""
+        )
+
+
+@dataclass
+class Regression:
+    result: Result
+    baseline_commit: str
+    baseline_ns: int
+    current_ns: int
+
+    @property
+    def ratio(self) -> float:
+        return self.current_ns / self.baseline_ns
+
+
+def interpreter_id() -> str:
+    version = platform.python_version()
+    # free-threaded builds are tagged like their executables (python3.14t)
+    if not getattr(sys, "_is_gil_enabled", lambda: True)():
+        version += "t"
+    return f"{sys.implementation.name}-{version}"
+
+
+def interpreter_label(interpreter: str) -> str:
+    name, version = interpreter.split("-", 1)
+    major_minor = ".".join(version.rstrip("t").split(".")[:2])
+    if name == "pypy":
+        return "PyPy3"
+    return f"Python {major_minor}" + ("T*" if version.endswith("t") else "")
+
+
+def git_state() -> tuple[str, bool]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=runner.ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=runner.ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        return commit, bool(dirty)
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", True
+
+
+def hash_file(path: str | Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def connect(db_path: str | Path = DEFAULT_DB) -> sqlite3.Connection:
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def bench_day(
+    day: runner.Day,
+    input_path: str | Path,
+    repeat: int = 5,
+    warmup: int = 1,
+    variants: bool = True,
+    memory: bool = False,
+    cached: bool = True,
+) -> Iterator[Result]:
+    parsed = cache.parse(day, input_path) if cached else day.parse(input_path)
+    entry_points = day.variants() if variants else {p: {"": f} for p, f in day.parts().items()}
+    for part, fns in sorted(entry_points.items()):
+        for variant, f in fns.items():
+            answer, record = instrument.sample(
+                f,
+                parsed,
+                name=f"{day.key}/part{part}",
+                repeat=repeat,
+                warmup=warmup,
+                memory=memory,
+            )
+            yield Result(day.year, day.day, part, variant, record, answer)
+
+
+def bench_scales(
+    day: runner.Day,
+    scales: list[float],
+    seed: int = 0,
+    repeat: int = 3,
+    budget_s: float = 10.0,
+) -> Iterator[tuple[float, str, int]]:
+    """
+    Yields (scale, step, median_ns) for parsing and every part on generated inputs of
+    growing scale. A step that takes longer than `budget_s` is not run at larger scales,
+    which is how the quadratic ones announce themselves.
+    """
+    over_budget: set[str] = set()
+    for scale in sorted(scales):
+        path = generators.generated_path(day.year, day.day, scale, seed)
+        parsed, record = instrument.sample(
+            day.parse, path, name=f"{day.key}/parse", repeat=repeat, warmup=0, memory=False
+        )
+        yield scale, "parse", int(record.summary()["median_ns"])
+        for part, f in sorted(day.parts().items()):
+            step = f"part{part}"
+            if step in over_budget:
+                continue
+            _, record = instrument.sample(
+                f, parsed, name=f"{day.key}/{step}", repeat=repeat, warmup=0, memory=False
+            )
+            median_ns = int(record.summary()["median_ns"])
+            if median_ns > budget_s * 1e9:
+                over_budget.add(step)
+            yield scale, step, median_ns
+
+
+def growth_exponent(scale1: float, ns1: int, scale2: float, ns2: int) -> float:
+    """k in time ~ scale^k between two measurements (1 = linear, 2 = quadratic)."""
+    return math.log(max(ns2, 1) / max(ns1, 1)) / math.log(scale2 / scale1)
+
+
+def store(
+    conn: sqlite3.Connection,
+    results: list[Result],
+    input_hash: str,
+    commit: str,
+    dirty: bool,
+    interpreter: str,
+) -> None:
+    now = time.time()
+    rows = []
+    for r in results:
+        summary = r.record.summary()
+        rows.append(
+            (
+                now,
+                commit,
+                int(dirty),
+                interpreter,
+                input_hash,
+                r.year,
+                r.day,
+                r.part,
+                r.variant,
+                summary["n"],
+                summary["min_ns"],
+                summary["median_ns"],
+                summary["p95_ns"],
+                summary["peak_bytes"],
+                str(r.answer),
+            )
+        )
+    conn.executemany(
+        "INSERT INTO results (created_at, git_commit, git_dirty, interpreter, input_hash,"
+        " year, day, part, variant, n, min_ns, median_ns, p95_ns, peak_bytes, answer)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+
+
+def find_baseline(
+    conn: sqlite3.Connection,
+    result: Result,
+    input_hash: str,
+    interpreter: str,
+    commit: str,
+    dirty: bool,
+    baseline_commit: str | None = None,
+) -> tuple[str, int] | None:
+    """Latest (commit, median_ns) for the same part to compare a run against.
+
+    A clean tree is compared with the latest earlier run, uncommitted edits with the latest
+    clean run at `commit` (or, before there is one, the latest run at another commit).
+    """
+    query = (
+        "SELECT git_commit, median_ns FROM results"
+        " WHERE year = ? AND day = ? AND part = ? AND variant = ?"
+        " AND interpreter = ? AND input_hash = ?"
+    )
+    params: list[Any] = [
+        result.year,
+        result.day,
+        result.part,
+        result.variant,
+        interpreter,
+        input_hash,
+    ]
+    filters: list[tuple[str, list[Any]]]
+    if baseline_commit:
+        filters = [(" AND git_commit = ?", [baseline_commit])]
+    elif dirty:
+        filters = [
+            (" AND git_commit = ? AND git_dirty = 0", [commit]),
+            (" AND git_commit != ?", [commit]),
+        ]
+    else:
+        filters = [("", [])]
+    for condition, values in filters:
+        row = conn.execute(
+            query + condition + " ORDER BY created_at DESC, id DESC LIMIT 1", params + values
+        ).fetchone()
+        if row:
+            return row[0], row[1]
+    return None
+
+
+def check_regressions(
+    conn: sqlite3.Connection,
+    results: list[Result],
+    input_hash: str,
+    interpreter: str,
+    commit: str,
+    dirty: bool,
+    threshold: float,
+    baseline_commit: str | None = None,
+) -> list[Regression]:
+    regressions: list[Regression] = []
+    for r in results:
+        baseline = find_baseline(
+            conn, r, input_hash, interpreter, commit, dirty, baseline_commit
+        )
+        if baseline is None:
+            continue
+        baseline_commit_found, baseline_ns = baseline
+        current_ns = int(r.record.summary()["median_ns"])
+        if current_ns > baseline_ns * (1 + threshold):
+            regressions.append(Regression(r, baseline_commit_found, baseline_ns, current_ns))
+    return regressions
+
+
+def check_memory(results: list[Result], budget_bytes: int) -> list[Result]:
+    """Results whose traced peak exceeds the budget (results without a peak are skipped)."""
+    return [
+        r
+        for r in results
+        if r.record.peak_bytes is not None and r.record.peak_bytes > budget_bytes
+    ]
+
+
+def column_label(part: int, variant: str) -> str:
+    if not variant:
+        return f"p{part} seq"
+    kind, _, detail = variant.partition("_")
+    return f"p{part} {kind} ({detail})" if detail else f"p{part} {kind}"
+
+
+def table(conn: sqlite3.Connection, year: int, day: int, input_hash: str | None = None) -> str:
+    """Renders the latest median of every (interpreter, part variant) like day02's docstring."""
+    query = (
+        "SELECT interpreter, part, variant, median_ns FROM results"
+        " WHERE year = ? AND day = ?"
+    )
+    params: list[Any] = [year, day]
+    if input_hash:
+        query += " AND input_hash = ?"
+        params.append(input_hash)
+
+    latest: dict[tuple[str, int, str], int] = {}
+    for interpreter, part, variant, median_ns in conn.execute(
+        query + " ORDER BY created_at", params
+    ):
+        latest[(interpreter, part, variant)] = median_ns
+    if not latest:
+        return ""
+
+    columns = sorted({(part, variant) for _, part, variant in latest}, key=lambda c: (c[0], c[1]))
+    interpreters = sorted({interpreter for interpreter, _, _ in latest})
+
+    header = ["Runtime"] + [column_label(part, variant) for part, variant in columns]
+    rows = [header]
+    for interpreter in interpreters:
+        row = [interpreter_label(interpreter)]
+        for part, variant in columns:
+            median_ns = latest.get((interpreter, part, variant))
+            row.append(f"{median_ns / 1e6:.2f} ms" if median_ns is not None else "-")
+        rows.append(row)
+
+    widths = [max(len(row[i]) for row in rows) + 1 for i in range(len(header))]
+    lines = ["| ".join(cell.ljust(w) for cell, w in zip(row, widths)).rstrip() for row in rows]
+    lines.insert(1, "-" * len(lines[0]))
+    for interpreter in interpreters:
+        if interpreter.endswith("t"):
+            label = interpreter_label(interpreter).rstrip("*")
+            lines += ["", f"* {label} = Free threaded (GIL-free) Python"]
+            break
+    return "\n".join(lines)
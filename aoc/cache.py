@@ -0,0 +1,186 @@
+"""
+On-disk cache of parsed inputs, so repeated runs skip parsing.
+
+Entries are keyed by a hash of the input bytes, of the day's source file and of every aoc
+module it imports, directly or not (any edit to the parser or its helpers invalidates
+them), plus the interpreter. Each entry is a pickle
+(protocol 5) followed by its out-of-band buffers, so large buffers such as numpy arrays
+are not copied on load but memory-mapped straight from the file (and are read-only).
+Least recently used entries are evicted once the cache grows beyond MAX_BYTES:
+
+    AOC_CACHE=0                   disable the cache
+    AOC_CACHE_MAX_BYTES=268435456 size bound (default 256 MiB)
+"""
+
+import hashlib
+import mmap
+import os
+import pickle
+import re
+import struct
+import sys
+from pathlib import Path
+from typing import Any
+
+from aoc import runner
+
+CACHE_DIR = runner.ROOT / ".aoc" / "cache"
+PACKAGE_DIR = Path(__file__).parent
+# `import aoc.x` and `from aoc.x import y, z` at any indentation, a regex rather than ast
+# as this runs on every cache lookup
+IMPORT = re.compile(r"^[ \t]*(?:from[ \t]+([\w.]+)[ \t]+)?import[ \t]+([\w., ]+)", re.M)
+MAX_BYTES = int(os.environ.get("AOC_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+ENABLED = os.environ.get("AOC_CACHE", "1") not in ("", "0")
+
+MAGIC = b"AOCPKL5\0"
+HEADER = struct.Struct("<8sII")  # magic, pickle length, number of buffers
+BUFFER_LENGTH = struct.Struct("<Q")
+ALIGNMENT = 64  # numpy wants aligned buffers
+
+
+def aoc_imports(path: Path) -> set[Path]:
+    """Source files of the aoc modules imported anywhere in `path`, even inside functions."""
+    found = set()
+    for package, names in IMPORT.findall(path.read_text()):
+        modules = [name.split(" as ")[0].strip() for name in names.split(",")]
+        if package:
+            # `from aoc import grid` imports a module, `from aoc.grid import Grid` doesn't
+            modules = [package] + [f"{package}.{name}" for name in modules]
+        for module in modules:
+            parts = module.split(".")
+            if parts[0] != "aoc":
+                continue
+            module_path = PACKAGE_DIR.joinpath(*parts[1:])
+            for source in (module_path.with_suffix(".py"), module_path / "__init__.py"):
+                if source.is_file():
+                    found.add(source)
+    return found
+
+
+def source_files(day: runner.Day) -> list[Path]:
+    """The day's source file and every aoc module it depends on, this one included."""
+    seen = {day.path, Path(__file__)}
+    pending = list(seen)
+    while pending:
+        for source in aoc_imports(pending.pop()) - seen:
+            seen.add(source)
+            pending.append(source)
+    return sorted(seen)
+
+
+def entry_path(day: runner.Day, input_path: str | Path) -> Path:
+    digest = hashlib.sha256()
+    digest.update(Path(input_path).read_bytes())
+    for source in source_files(day):
+        digest.update(source.read_bytes())
+    digest.update(str(sys.implementation.cache_tag).encode())
+    return CACHE_DIR / f"{day.year}-{day.day:02d}-{digest.hexdigest()[:24]}.pkl"
+
+
+def padding(offset: int) -> int:
+    return -offset % ALIGNMENT
+
+
+def dump(obj: Any, path: Path) -> None:
+    buffers: list[pickle.PickleBuffer] = []
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    raws = [b.raw() for b in buffers]
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(data), len(raws)))
+        for raw in raws:
+            f.write(BUFFER_LENGTH.pack(raw.nbytes))
+        f.write(data)
+        for raw in raws:
+            f.write(b"\0" * padding(f.tell()))
+            f.write(raw)
+    tmp.replace(path)
+
+
+def load(path: Path) -> Any:
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    magic, data_length, n_buffers = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a cache entry")
+
+    offset = HEADER.size
+    lengths = []
+    for _ in range(n_buffers):
+        lengths.append(BUFFER_LENGTH.unpack_from(view, offset)[0])
+        offset += BUFFER_LENGTH.size
+    data = view[offset : offset + data_length]
+    offset += data_length
+
+    buffers = []
+    for length in lengths:
+        offset += padding(offset)
+        buffers.append(view[offset : offset + length])
+        offset += length
+    parsed = pickle.loads(data, buffers=buffers)
+    if not buffers:
+        # Nothing refers to the map once unpickled, so don't hold on to it
+        data.release()
+        view.release()
+        mapped.close()
+    return parsed
+
+
+def get(day: runner.Day, input_path: str | Path) -> Any | None:
+    """The cached parse of `input_path`, or None on a miss."""
+    path = entry_path(day, input_path)
+    if not path.is_file():
+        return None
+    day.load()  # pickles may refer to classes defined in the day's module
+    try:
+        parsed = load(path)
+    except Exception:
+        path.unlink(missing_ok=True)
+        return None
+    os.utime(path)  # mtime doubles as the last use for eviction
+    return parsed
+
+
+def put(day: runner.Day, input_path: str | Path, parsed: Any) -> None:
+    try:
+        dump(parsed, entry_path(day, input_path))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return  # e.g. a parser returning a generator or a local class
+    evict()
+
+
+def parse(day: runner.Day, input_path: str | Path) -> Any:
+    """Day.parse, served from the cache when possible."""
+    if not ENABLED:
+        return day.parse(input_path)
+    parsed = get(day, input_path)
+    if parsed is None:
+        parsed = day.parse(input_path)
+        put(day, input_path, parsed)
+    return parsed
+
+
+def evict(max_bytes: int | None = None) -> None:
+    max_bytes = MAX_BYTES if max_bytes is None else max_bytes
+    entries = []
+    for path in CACHE_DIR.glob("*.pkl"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def clear() -> None:
+    for path in CACHE_DIR.glob("*.pkl"):
+        path.unlink(missing_ok=True)
@@ -0,0 +1,541 @@
+import argparse
+import sys
+from pathlib import Path
+from time import perf_counter_ns
+
+from aoc import cache, counters, instrument, runner
+
+# bench, generators and importtime are imported by the commands that use them, so that
+# `run` starts without sqlite3, subprocess and the generators
+
+
+def format_ms(ns: int) -> str:
+    return f"{ns / 1e6:.2f}ms"
+
+
+def select_days(args: argparse.Namespace) -> list[runner.Day]:
+    if args.all:
+        return runner.discover()
+    if args.year is None:
+        raise runner.SolutionError("Specify a year (and optionally a day), or pass --all")
+    if args.day is None:
+        return runner.discover((args.year,))
+    return [runner.find_day(args.year, args.day)]
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    days = select_days(args)
+    if args.input and len(days) != 1:
+        raise runner.SolutionError("--input can only be used with a single day")
+    parts = (args.part,) if args.part else (1, 2)
+    if args.daemon:
+        if args.instrument or args.counters:
+            raise runner.SolutionError("--instrument and --counters cannot be used with --daemon")
+        return run_on_daemon(args, days, parts)
+    profiling = args.profile or args.lines or args.memory
+    if profiling and args.instrument:
+        raise runner.SolutionError(
+            "--instrument cannot be used with --profile, --lines or --memory"
+        )
+    if args.instrument:
+        # Must happen before the days are imported for their @timeit to take effect.
+        instrument.enable(args.instrument, args.repeat, args.warmup, not args.no_memory)
+    if args.counters:
+        counters.enable()  # likewise for their `if COUNTING:` blocks
+    use_cache = cache.ENABLED and not args.no_cache
+
+    failures = 0
+    for day in days:
+        input_path = Path(args.input) if args.input else day.default_input
+        if not input_path.is_file():
+            print(f"{day.name}: skipped, no input at {input_path}")
+            continue
+
+        try:
+            start = perf_counter_ns()
+            parsed = cache.get(day, input_path) if use_cache else None
+            if parsed is not None:
+                print(f"{day.name} parse: cached ({format_ms(perf_counter_ns() - start)})")
+            else:
+                parsed, elapsed = runner.parse(day, input_path)
+                print(f"{day.name} parse: {format_ms(elapsed)}")
+                if use_cache:
+                    cache.put(day, input_path, parsed)
+            if profiling:
+                profile_parts(args, day, parsed, parts)
+                continue
+            for result in runner.run_parts(day, parsed, parts):
+                print(
+                    f"{day.name} part {result.part}: {result.answer} "
+                    f"({format_ms(result.elapsed_ns)})"
+                )
+                if result.counters:
+                    print(f"    {counters.format_counters(result.counters)}")
+        except Exception as e:
+            failures += 1
+            print(f"{day.name}: failed with {type(e).__name__}: {e}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+def profile_parts(
+    args: argparse.Namespace, day: runner.Day, parsed: object, parts: tuple[int, ...]
+) -> None:
+    if args.memory:
+        from aoc import memory
+
+        for part_memory in memory.profile_parts(day, parsed, parts, args.top):
+            result = part_memory.result
+            print(
+                f"{day.name} part {result.part}: {result.answer} "
+                f"({format_ms(result.elapsed_ns)}, traced)"
+            )
+            print(part_memory.report())
+        return
+
+    from aoc import profiling
+
+    functions = set(args.lines.split(",")) if args.lines else None
+    for profiled in profiling.profile_parts(
+        day, parsed, parts, args.profile, functions, args.top, args.interval / 1000
+    ):
+        result = profiled.result
+        print(
+            f"{day.name} part {result.part}: {result.answer} "
+            f"({format_ms(result.elapsed_ns)}, profiled)"
+        )
+        print(profiled.report)
+        for path in profiled.files:
+            print(f"wrote {path}")
+
+
+def run_on_daemon(args: argparse.Namespace, days: list[runner.Day], parts: tuple[int, ...]) -> int:
+    from aoc import client
+
+    failures = 0
+    try:
+        with client.Client(args.socket or client.SOCKET_PATH) as daemon:
+            for day in days:
+                input_path = Path(args.input) if args.input else day.default_input
+                if not input_path.is_file():
+                    print(f"{day.name}: skipped, no input at {input_path}")
+                    continue
+
+                response = daemon.request(
+                    {
+                        "year": day.year,
+                        "day": day.day,
+                        "input": str(input_path.resolve()),
+                        "parts": list(parts),
+                    }
+                )
+                if not response["ok"]:
+                    failures += 1
+                    print(f"{day.name}: failed with {response['error']}", file=sys.stderr)
+                    continue
+                print("\n".join(client.format_response(day.name, response)))
+    except client.DaemonError as e:
+        raise runner.SolutionError(str(e)) from e
+    return 1 if failures else 0
+
+
+def cmd_daemon(args: argparse.Namespace) -> int:
+    from aoc import client, daemon
+
+    path = Path(args.socket) if args.socket else daemon.SOCKET_PATH
+    if args.stop:
+        try:
+            with client.Client(path) as running:
+                running.request({"command": "stop"})
+        except client.DaemonError as e:
+            raise runner.SolutionError(str(e)) from e
+        return 0
+
+    modules = () if args.no_preload else daemon.PRELOAD
+    daemon.serve(path, modules, cache.ENABLED and not args.no_cache)
+    return 0
+
+
+def cmd_batch(args: argparse.Namespace) -> int:
+    import json
+
+    from aoc import batch, parallel
+
+    tasks = batch.discover_inputs(Path(args.inputs), args.year, args.day)
+    if not tasks:
+        raise runner.SolutionError(f"No inputs found under {args.inputs}")
+
+    failures = 0
+    start = perf_counter_ns()
+    for result in batch.run(tasks, args.workers or parallel.worker_count()):
+        failures += not result["ok"]
+        print(json.dumps(result), flush=True)
+    print(
+        f"{len(tasks)} inputs, {failures} failed, {format_ms(perf_counter_ns() - start)}",
+        file=sys.stderr,
+    )
+    return 1 if failures else 0
+
+
+def cmd_diff(args: argparse.Namespace) -> int:
+    from aoc import bench, generators, golden
+
+    conn = golden.connect(args.db or bench.DEFAULT_DB)
+    seeds = [int(seed) for seed in args.seeds.split(",")] if args.seeds else []
+    failures = 0
+    for day in select_days(args):
+        inputs: list[tuple[Path, str]] = []
+        if args.input:
+            inputs.append((Path(args.input), args.input))
+        elif day.default_input.is_file() and not seeds:
+            inputs.append((day.default_input, "input.txt"))
+        for seed in seeds or ([] if inputs else [0]):
+            try:
+                path = generators.generated_path(day.year, day.day, args.scale, seed)
+            except runner.SolutionError as e:
+                print(f"{day.name}: skipped, {e}")
+                continue
+            inputs.append((path, f"generated x{args.scale:g} seed {seed}"))
+
+        for input_path, label in inputs:
+            checks = golden.check_day(
+                conn,
+                day,
+                input_path,
+                label,
+                bench.hash_file(input_path),
+                args.repeat,
+                args.timeout,
+                args.update,
+            )
+            for check in checks:
+                failures += not check.ok
+                print(golden.format_check(day, check), flush=True)
+    return 1 if failures else 0
+
+
+def cmd_crosslang(args: argparse.Namespace) -> int:
+    from aoc import crosslang, generators
+
+    days = [day for day in select_days(args) if crosslang.ports(day)]
+    if not days:
+        raise runner.SolutionError("No Go or Rust ports for the selected days")
+    if args.input and len(days) != 1:
+        raise runner.SolutionError("--input can only be used with a single day")
+
+    failures = 0
+    for day in days:
+        if args.input:
+            input_path, label = Path(args.input), args.input
+        elif day.default_input.is_file() and args.seed is None:
+            input_path, label = day.default_input, "input.txt"
+        else:
+            seed = args.seed or 0
+            input_path = generators.generated_path(day.year, day.day, args.scale, seed)
+            label = f"generated x{args.scale:g} seed {seed}"
+        comparison = crosslang.compare(day, input_path, label, args.repeat, args.timeout)
+        failures += not comparison.ok
+        print(crosslang.format_comparison(comparison), flush=True)
+    return 1 if failures else 0
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    from aoc import bench
+
+    days = select_days(args)
+    if args.input and len(days) != 1:
+        raise runner.SolutionError("--input can only be used with a single day")
+
+    conn = bench.connect(args.db or bench.DEFAULT_DB)
+    commit, dirty = bench.git_state()
+    interpreter = bench.interpreter_id()
+    regressions: list[bench.Regression] = []
+    over_budget: list[bench.Result] = []
+
+    for day in days:
+        input_path = Path(args.input) if args.input else day.default_input
+        if not input_path.is_file():
+            print(f"{day.name}: skipped, no input at {input_path}")
+            continue
+
+        input_hash = bench.hash_file(input_path)
+        results = list(
+            bench.bench_day(
+                day,
+                input_path,
+                args.repeat,
+                args.warmup,
+                not args.no_variants,
+                args.memory or args.memory_budget is not None,
+                cache.ENABLED and not args.no_cache,
+            )
+        )
+        for r in results:
+            summary = r.record.summary()
+            line = (
+                f"{r.label}: median {format_ms(summary['median_ns'])}"
+                f" min {format_ms(summary['min_ns'])} p95 {format_ms(summary['p95_ns'])}"
+            )
+            if summary["peak_bytes"] is not None:
+                line += f" peak {summary['peak_bytes'] / (1 << 20):.1f} MB"
+            print(line)
+        if args.memory_budget is not None:
+            over_budget += bench.check_memory(results, int(args.memory_budget * (1 << 20)))
+
+        day_regressions = bench.check_regressions(
+            conn,
+            results,
+            input_hash,
+            interpreter,
+            commit,
+            dirty,
+            args.threshold,
+            args.baseline,
+        )
+        regressions += day_regressions
+        if not args.no_store:
+            bench.store(conn, results, input_hash, commit, dirty, interpreter)
+
+    for reg in regressions:
+        print(
+            f"REGRESSION {reg.result.label}: {format_ms(reg.current_ns)} vs"
+            f" {format_ms(reg.baseline_ns)} at {reg.baseline_commit} ({reg.ratio:.2f}x)",
+            file=sys.stderr,
+        )
+    for r in over_budget:
+        print(
+            f"OVER MEMORY BUDGET {r.label}: peak {r.record.peak_bytes / (1 << 20):.1f} MB"
+            f" > {args.memory_budget:g} MB",
+            file=sys.stderr,
+        )
+    return 1 if regressions or over_budget else 0
+
+
+def cmd_table(args: argparse.Namespace) -> int:
+    from aoc import bench
+
+    conn = bench.connect(args.db or bench.DEFAULT_DB)
+    input_hash = bench.hash_file(args.input) if args.input else None
+    rendered = bench.table(conn, args.year, args.day, input_hash)
+    if not rendered:
+        print(f"No stored results for {args.year} day {args.day:02d}", file=sys.stderr)
+        return 1
+    print(rendered)
+    return 0
+
+
+def cmd_gen(args: argparse.Namespace) -> int:
+    from aoc import generators
+
+    text = generators.generate(args.year, args.day, args.scale, args.seed)
+    if args.output:
+        Path(args.output).write_text(text)
+    else:
+        sys.stdout.write(text)
+    return 0
+
+
+def cmd_scale(args: argparse.Namespace) -> int:
+    from aoc import bench
+
+    day = runner.find_day(args.year, args.day)
+    scales = [float(s) for s in args.scales.split(",")]
+    timings: dict[str, dict[float, int]] = {}
+    for scale, step, median_ns in bench.bench_scales(
+        day, scales, args.seed, args.repeat, args.budget
+    ):
+        points = timings.setdefault(step, {})
+        cell = format_ms(median_ns)
+        if points:
+            prev_scale = max(points)
+            k = bench.growth_exponent(prev_scale, points[prev_scale], scale, median_ns)
+            cell += f" (n^{k:.1f})"
+        points[scale] = median_ns
+        print(f"{day.name} x{scale:g} {step}: {cell}", flush=True)
+
+    for step, points in timings.items():
+        if max(points) < max(scales):
+            print(f"{day.name} {step}: stopped after x{max(points):g}, over the time budget")
+    return 0
+
+
+def cmd_imports(args: argparse.Namespace) -> int:
+    from aoc import importtime
+
+    over_budget = 0
+    for day in select_days(args):
+        profile = importtime.profile(day)
+        heaviest = ", ".join(f"{name} {us / 1e3:.1f}ms" for name, us in profile.heaviest())
+        line = f"{day.name} import: {profile.load_ms:.2f}ms"
+        if heaviest:
+            line += f" ({heaviest})"
+        if profile.load_ms > args.budget:
+            over_budget += 1
+            line += f" OVER BUDGET ({args.budget:g}ms)"
+        print(line, flush=True)
+    return 1 if over_budget else 0
+
+
+def add_day_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("year", type=int, nargs="?")
+    parser.add_argument("day", type=int, nargs="?")
+    parser.add_argument("--all", action="store_true", help="every discovered day")
+
+
+def add_instrument_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--instrument",
+        nargs="?",
+        const="-",
+        metavar="PATH",
+        help="emit JSON timing records (to stderr, or appended to PATH)",
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="timed samples per part")
+    parser.add_argument("--warmup", type=int, default=0, help="untimed runs per part")
+    parser.add_argument(
+        "--no-memory", action="store_true", help="skip the tracemalloc peak run"
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="aoc")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="solve days in-process")
+    add_day_arguments(run)
+    run.add_argument("--part", type=int, choices=(1, 2))
+    run.add_argument("--input", help="input file (defaults to the day's input.txt)")
+    add_instrument_arguments(run)
+    run.add_argument(
+        "--counters", action="store_true", help="count states, cache hits etc. of each part"
+    )
+    run.add_argument("--no-cache", action="store_true", help="always parse the input")
+    run.add_argument(
+        "--profile",
+        nargs="?",
+        const="sample",
+        choices=("sample", "cprofile"),
+        help="profile each part: flamegraph stacks (sample) or exact call counts (cprofile)",
+    )
+    run.add_argument(
+        "--lines", metavar="FUNC[,FUNC]", help="per-line hits and time of these functions"
+    )
+    run.add_argument(
+        "--memory", action="store_true", help="peak RSS and top allocation sites per part"
+    )
+    run.add_argument("--top", type=int, default=15, help="hot functions/sites to list per part")
+    run.add_argument("--interval", type=float, default=1.0, help="sampling interval in ms")
+    run.add_argument("--daemon", action="store_true", help="solve on a running `aoc daemon`")
+    run.add_argument("--socket", help="daemon socket (default: .aoc/daemon.sock)")
+    run.set_defaults(func=cmd_run)
+
+    daemon_cmd = commands.add_parser("daemon", help="serve runs from a warm resident process")
+    daemon_cmd.add_argument("--socket", help="socket to listen on (default: .aoc/daemon.sock)")
+    daemon_cmd.add_argument("--stop", action="store_true", help="stop a running daemon")
+    daemon_cmd.add_argument("--no-cache", action="store_true", help="don't use the disk cache")
+    daemon_cmd.add_argument(
+        "--no-preload", action="store_true", help="don't import numpy and scipy up front"
+    )
+    daemon_cmd.set_defaults(func=cmd_daemon)
+
+    batch_cmd = commands.add_parser(
+        "batch", help="solve every input under a directory on a process pool (JSON lines)"
+    )
+    batch_cmd.add_argument("inputs", help="directory laid out as YEAR/DAY/<input files>")
+    batch_cmd.add_argument("year", type=int, nargs="?")
+    batch_cmd.add_argument("day", type=int, nargs="?")
+    batch_cmd.add_argument("--workers", type=int, help="processes (default: one per CPU)")
+    batch_cmd.set_defaults(func=cmd_batch)
+
+    diff = commands.add_parser(
+        "diff", help="check every implementation of a part agrees, against a golden answer"
+    )
+    add_day_arguments(diff)
+    diff.add_argument("--input", help="input file (default: input.txt, else generated)")
+    diff.add_argument("--seeds", help="comma-separated seeds of generated inputs to check")
+    diff.add_argument("--scale", type=float, default=1, help="scale of generated inputs")
+    diff.add_argument("--repeat", type=int, default=3, help="timed runs per implementation")
+    diff.add_argument(
+        "--timeout", type=float, default=60.0, help="seconds before an implementation is dropped"
+    )
+    diff.add_argument("--update", action="store_true", help="re-record changed golden answers")
+    diff.add_argument("--db", help="results database (default: .aoc/bench.sqlite)")
+    diff.set_defaults(func=cmd_diff)
+
+    crosslang_cmd = commands.add_parser(
+        "crosslang", help="run the Go and Rust ports next to Python on the same input"
+    )
+    add_day_arguments(crosslang_cmd)
+    crosslang_cmd.add_argument("--input", help="input file (default: input.txt, else generated)")
+    crosslang_cmd.add_argument("--seed", type=int, help="use the generated input of this seed")
+    crosslang_cmd.add_argument("--scale", type=float, default=1, help="scale of generated inputs")
+    crosslang_cmd.add_argument("--repeat", type=int, default=3, help="timed runs per program")
+    crosslang_cmd.add_argument(
+        "--timeout", type=float, default=120.0, help="seconds before a program is killed"
+    )
+    crosslang_cmd.set_defaults(func=cmd_crosslang)
+
+    bench_cmd = commands.add_parser("bench", help="benchmark parts and flag regressions")
+    add_day_arguments(bench_cmd)
+    bench_cmd.add_argument("--input", help="input file (defaults to the day's input.txt)")
+    bench_cmd.add_argument("--repeat", type=int, default=5)
+    bench_cmd.add_argument("--warmup", type=int, default=1)
+    bench_cmd.add_argument(
+        "--threshold", type=float, default=0.1, help="allowed slowdown, 0.1 = 10%%"
+    )
+    bench_cmd.add_argument("--baseline", help="commit to compare against (default: latest)")
+    bench_cmd.add_argument("--memory", action="store_true", help="also record tracemalloc peak")
+    bench_cmd.add_argument(
+        "--memory-budget",
+        type=float,
+        metavar="MB",
+        help="fail any part whose tracemalloc peak exceeds this (implies --memory)",
+    )
+    bench_cmd.add_argument("--no-variants", action="store_true", help="main entry points only")
+    bench_cmd.add_argument("--no-cache", action="store_true", help="always parse the input")
+    bench_cmd.add_argument("--no-store", action="store_true", help="compare without recording")
+    bench_cmd.add_argument("--db", help="results database (default: .aoc/bench.sqlite)")
+    bench_cmd.set_defaults(func=cmd_bench)
+
+    table = commands.add_parser("table", help="render a stored comparison table for a day")
+    table.add_argument("year", type=int)
+    table.add_argument("day", type=int)
+    table.add_argument("--input", help="only results for this input")
+    table.add_argument("--db", help="results database (default: .aoc/bench.sqlite)")
+    table.set_defaults(func=cmd_table)
+
+    gen = commands.add_parser("gen", help="write a synthetic input for a day")
+    gen.add_argument("year", type=int)
+    gen.add_argument("day", type=int)
+    gen.add_argument("--scale", type=float, default=1, help="input size, 1 = puzzle sized")
+    gen.add_argument("--seed", type=int, default=0)
+    gen.add_argument("-o", "--output", help="file to write (default: stdout)")
+    gen.set_defaults(func=cmd_gen)
+
+    scale = commands.add_parser("scale", help="time a day on growing synthetic inputs")
+    scale.add_argument("year", type=int)
+    scale.add_argument("day", type=int)
+    scale.add_argument("--scales", default="1,10,100", help="comma-separated scale factors")
+    scale.add_argument("--seed", type=int, default=0)
+    scale.add_argument("--repeat", type=int, default=3)
+    scale.add_argument(
+        "--budget", type=float, default=10.0, help="seconds before a part stops being scaled"
+    )
+    scale.set_defaults(func=cmd_scale)
+
+    imports = commands.add_parser("imports", help="report (-X importtime) what each day imports")
+    add_day_arguments(imports)
+    imports.add_argument(
+        "--budget", type=float, default=20.0, help="ms a day may take to import"
+    )
+    imports.set_defaults(func=cmd_imports)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except runner.SolutionError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
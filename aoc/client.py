@@ -0,0 +1,113 @@
+"""
+Thin client for `python -m aoc daemon`, for re-running a day over and over while solving:
+
+    python -m aoc.client 2024 21 --input example.txt --part 2
+
+It imports nothing beyond json and socket (not even aoc.runner), so a run costs little more
+than interpreter startup plus the solve itself on the warm daemon.
+"""
+
+import json
+import os
+import socket
+import sys
+from typing import Any
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOCKET_PATH = os.environ.get("AOC_DAEMON_SOCKET", os.path.join(ROOT, ".aoc", "daemon.sock"))
+
+USAGE = "usage: python -m aoc.client YEAR DAY [--input PATH] [--part 1|2] [--socket PATH]"
+
+
+class DaemonError(Exception):
+    pass
+
+
+class Client:
+    """One connection to the daemon, reusable for many requests."""
+
+    def __init__(self, path: str | os.PathLike[str] = SOCKET_PATH) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self.sock.connect(os.fspath(path))
+        except OSError as e:
+            self.sock.close()
+            raise DaemonError(f"no daemon on {path} (start one with `python -m aoc daemon`)") from e
+        self.file = self.sock.makefile("rwb")
+
+    def request(self, request: dict[str, Any]) -> dict[str, Any]:
+        self.file.write(json.dumps(request).encode() + b"\n")
+        self.file.flush()
+        line = self.file.readline()
+        if not line:
+            raise DaemonError("the daemon closed the connection")
+        return json.loads(line)
+
+    def close(self) -> None:
+        self.file.close()
+        self.sock.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def format_ms(ns: int) -> str:
+    return f"{ns / 1e6:.2f}ms"
+
+
+def format_response(name: str, response: dict[str, Any]) -> list[str]:
+    """The lines `python -m aoc run` would print for the same day."""
+    reloaded = ", reloaded" if response["reloaded"] else ""
+    lines = [f"{name} parse: {response['parse']} ({format_ms(response['parse_ns'])}{reloaded})"]
+    for result in response["parts"]:
+        lines.append(
+            f"{name} part {result['part']}: {result['answer']} ({format_ms(result['elapsed_ns'])})"
+        )
+    return lines
+
+
+def main(argv: list[str]) -> int:
+    # Parsed by hand, argparse alone costs more than the round trip to the daemon
+    options: dict[str, str | None] = {"--input": None, "--part": None, "--socket": SOCKET_PATH}
+    positional = []
+    args = iter(argv)
+    for arg in args:
+        value = next(args, None) if arg in options else None
+        if arg in options and value is not None:
+            options[arg] = value
+        elif arg.isdigit():
+            positional.append(int(arg))
+        else:
+            print(USAGE, file=sys.stderr)
+            return 2
+    if len(positional) != 2:
+        print(USAGE, file=sys.stderr)
+        return 2
+
+    year, day = positional
+    request: dict[str, Any] = {"year": year, "day": day}
+    if options["--input"]:
+        request["input"] = os.path.abspath(options["--input"])
+    if options["--part"]:
+        request["parts"] = [int(options["--part"])]
+
+    try:
+        with Client(options["--socket"] or SOCKET_PATH) as client:
+            response = client.request(request)
+    except DaemonError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    name = f"{year} day {day:02d}"
+    if not response["ok"]:
+        print(f"{name}: failed with {response['error']}", file=sys.stderr)
+        return 1
+    print("\n".join(format_response(name, response)))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
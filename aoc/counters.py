@@ -0,0 +1,92 @@
+"""
+Counters and gauges for the inner loops of the search-heavy days, to tell whether a change
+helped by visiting fewer states or by making each one cheaper:
+
+    from aoc import counters
+    from aoc.counters import COUNTING
+
+    while queue:
+        d, node = heappop(queue)
+        if COUNTING:
+            counters.add("popped")
+            counters.peak("max_queue", len(queue) + 1)
+
+    @counters.counted("helper")     # helper.calls and helper.depth (deepest recursion)
+    def helper(pattern):
+        ...
+
+Like `instrument.timeit`, everything is decided when the solutions are imported: unless
+counting was enabled by then (`python -m aoc run --counters`, or AOC_COUNTERS=1), COUNTING
+is False, so a guarded block costs one global lookup and a branch, and `counted` hands back
+the undecorated function. Guard every call: `add` and `peak` always count.
+
+`python -m aoc run --counters` resets them before every part and prints them under its
+timing. They add up over every call of the part, so they multiply with `--repeat`.
+"""
+
+import os
+from collections import Counter
+from functools import wraps
+from typing import Any, Callable, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+COUNTING = os.environ.get("AOC_COUNTERS", "0") not in ("", "0")
+
+counts: Counter[str] = Counter()
+peaks: dict[str, int] = {}
+_depths: Counter[str] = Counter()
+
+
+def enable() -> None:
+    """Turns counting on for the solutions (and aoc modules) imported afterwards."""
+    global COUNTING
+    COUNTING = True
+
+
+def add(name: str, n: int = 1) -> None:
+    counts[name] += n
+
+
+def peak(name: str, value: int) -> None:
+    """Keeps the largest value seen, e.g. of a queue length."""
+    if value > peaks.get(name, value - 1):
+        peaks[name] = value
+
+
+def counted(name: str) -> Callable[[F], F]:
+    """Counts a (recursive) function's calls as name.calls, its deepest nesting as name.depth."""
+
+    def decorate(f: F) -> F:
+        if not COUNTING:
+            return f
+
+        calls, depth = f"{name}.calls", f"{name}.depth"
+
+        @wraps(f)
+        def wrap(*args: Any, **kwargs: Any) -> Any:
+            counts[calls] += 1
+            _depths[name] += 1
+            peak(depth, _depths[name])
+            try:
+                return f(*args, **kwargs)
+            finally:
+                _depths[name] -= 1
+
+        return wrap  # type: ignore[return-value]
+
+    return decorate
+
+
+def reset() -> None:
+    counts.clear()
+    peaks.clear()
+    _depths.clear()
+
+
+def snapshot() -> dict[str, int]:
+    return {**counts, **peaks}
+
+
+def format_counters(values: dict[str, int]) -> str:
+    return ", ".join(f"{name}={value:,}" for name, value in sorted(values.items()))
@@ -0,0 +1,372 @@
+"""
+Runs the Go and Rust ports of a day next to the Python solution on the same input:
+
+    python -m aoc crosslang 2024 1              # input.txt if present, else generated seed 0
+    python -m aoc crosslang 2025 --scale 10     # every 2025 day with a Rust port
+    python -m aoc crosslang --all --repeat 5
+
+The ports are 2024's `day-NN/dayN.go` files and the `[[bin]]`s of 2025/Cargo.toml. They
+are built under .aoc/build when their toolchain (go, cargo) is on PATH, and skipped with a
+note otherwise. Neither takes an input path: the Go programs read `./day-NN/input.txt`
+relative to where they run, so they run in a scratch directory holding the input there,
+and the Rust ones embed `input.txt` at compile time (include_str!), so the bin is rebuilt
+in a staged copy of the crate whenever the input changes. The staged input has its final
+newline stripped, as the ports split on "\n" and don't expect an empty last line. Builds
+are not timed.
+
+Every implementation runs as a whole process, Python included (`python -m aoc run
+--no-cache`), and the table shows the median wall time, the CPU time (user + sys, which
+exceeds wall time for the multithreaded ports) and the peak RSS (see measure()). The answers
+are scraped from what each program prints: every line that isn't a timing, in order,
+gives part 1 then part 2, and any further ones (e.g. day02's parallel variants) are
+checked against part 2.
+"""
+
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import tomllib
+from dataclasses import dataclass, field
+from pathlib import Path
+from statistics import median
+from time import perf_counter_ns
+
+from aoc import runner
+
+BUILD_DIR = runner.ROOT / ".aoc" / "build"
+CARGO_TOML = runner.ROOT / "2025" / "Cargo.toml"
+DEFAULT_TIMEOUT = 120.0
+HWM_POLL_INTERVAL = 0.001
+
+# Printed lines that report timings rather than answers
+TIMING_WORDS = ("time", "took", "parse", "read_input")
+ANSWER_LINE = re.compile(r"^(?:(?P<label>[^:]*):)?\s*(?P<answer>\S+)(?:\s+\(.*\))?$")
+
+
+@dataclass(frozen=True)
+class Port:
+    language: str  # "go" or "rust"
+    year: int
+    day: int
+    source: Path
+    binary: str  # the Cargo bin name, or the Go file's stem
+
+    @property
+    def toolchain(self) -> str:
+        return "go" if self.language == "go" else "cargo"
+
+
+@dataclass
+class Run:
+    wall_ns: int
+    cpu_ns: int
+    peak_rss: int | None
+    returncode: int
+    stdout: str
+    stderr: str
+
+    @property
+    def failure(self) -> str:
+        lines = [line.strip() for line in (self.stderr + self.stdout).splitlines()]
+        reason = next((line for line in lines if line), "")
+        return f"exited with code {self.returncode}" + (f": {reason}" if reason else "")
+
+
+@dataclass
+class Measurement:
+    implementation: str
+    answers: list[str] = field(default_factory=list)
+    wall_ns: int | None = None
+    cpu_ns: int | None = None
+    peak_rss: int | None = None
+    error: str | None = None  # missing toolchain, failed build or run
+
+
+def go_ports() -> list[Port]:
+    ports = []
+    for day in runner.discover((2024,)):
+        for source in sorted(day.path.parent.glob("*.go")):
+            ports.append(Port("go", day.year, day.day, source, source.stem))
+    return ports
+
+
+def rust_ports() -> list[Port]:
+    if not CARGO_TOML.is_file():
+        return []
+    with open(CARGO_TOML, "rb") as f:
+        manifest = tomllib.load(f)
+    ports = []
+    for bin in manifest.get("bin", []):
+        source = CARGO_TOML.parent / bin["path"]
+        number = runner.day_dir_number(source.parent.name)
+        if number is not None and source.is_file():
+            ports.append(Port("rust", 2025, number, source, bin["name"]))
+    return ports
+
+
+def ports(day: runner.Day) -> list[Port]:
+    return [p for p in go_ports() + rust_ports() if (p.year, p.day) == (day.year, day.day)]
+
+
+def _vm_hwm(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+def _watch_hwm(pid: int, stop: threading.Event, peak: list[int]) -> None:
+    while True:
+        peak[0] = max(peak[0], _vm_hwm(pid))
+        if stop.wait(HWM_POLL_INTERVAL):
+            return
+
+
+def measure(cmd: list[str], cwd: Path, timeout: float) -> Run:
+    """
+    Runs cmd to completion, with its CPU time and peak RSS from wait4.
+
+    Linux charges a child's ru_maxrss with the RSS of the process it was forked from (the
+    high-water mark is carried over at exec), so a child smaller than this process would
+    report our size. Below that floor the peak is taken from polling the child's VmHWM
+    instead, which can miss a spike in its last HWM_POLL_INTERVAL.
+    """
+    from aoc.memory import peak_rss
+
+    floor = peak_rss() or 0
+    # Output goes to files rather than pipes, so a chatty program can't block while we
+    # sit in wait4
+    with (
+        open(os.devnull, "rb") as stdin,
+        tempfile.TemporaryFile() as stdout,
+        tempfile.TemporaryFile() as stderr,
+    ):
+        start = perf_counter_ns()
+        process = subprocess.Popen(cmd, cwd=cwd, stdin=stdin, stdout=stdout, stderr=stderr)
+        timer = threading.Timer(timeout, process.kill)
+        stop, polled = threading.Event(), [0]
+        watcher = threading.Thread(target=_watch_hwm, args=(process.pid, stop, polled))
+        timer.start()
+        watcher.start()
+        try:
+            _, status, usage = os.wait4(process.pid, 0)
+        finally:
+            timer.cancel()
+            stop.set()
+            watcher.join()
+        wall = perf_counter_ns() - start
+        process.returncode = os.waitstatus_to_exitcode(status)  # so Popen doesn't reap again
+        stdout.seek(0)
+        stderr.seek(0)
+        output = stdout.read().decode(errors="replace")
+        errors = stderr.read().decode(errors="replace")
+
+    if process.returncode < 0 and wall >= timeout * 1e9:
+        raise runner.SolutionError(f"timed out after {timeout:g}s")
+    # ru_maxrss is in kilobytes on Linux, bytes on macOS
+    rss = usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+    peak: int | None = rss
+    if rss <= floor:
+        peak = polled[0] or None  # exited before the first poll
+    cpu = int((usage.ru_utime + usage.ru_stime) * 1e9)
+    return Run(wall, cpu, peak, process.returncode, output, errors)
+
+
+def scrape_answers(output: str) -> list[str]:
+    answers = []
+    for line in output.splitlines():
+        line = line.strip()
+        match = ANSWER_LINE.match(line)
+        if not line or match is None:
+            continue
+        label = (match["label"] or "").lower()
+        if any(word in label for word in TIMING_WORDS):
+            continue
+        answers.append(match["answer"])
+    return answers
+
+
+def python_answers(day: runner.Day, output: str) -> list[str]:
+    answers = []
+    for part in (1, 2):
+        match = re.search(rf"^{day.name} part {part}: (\S+)", output, re.MULTILINE)
+        if match:
+            answers.append(match[1])
+    return answers
+
+
+def _build(cmd: list[str], cwd: Path) -> None:
+    result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+    if result.returncode != 0:
+        lines = (result.stderr or result.stdout).strip().splitlines()
+        errors = [line.strip() for line in lines if "error" in line.lower()]
+        reason = errors[0] if errors else lines[-1] if lines else ""
+        raise runner.SolutionError(f"build failed: {reason}")
+
+
+def build_go(port: Port, input_path: Path) -> tuple[list[str], Path]:
+    """The command that runs the port on input_path, and the directory to run it in."""
+    out_dir = BUILD_DIR / "go"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    binary = out_dir / f"{port.year}-{port.day:02d}-{port.binary}"
+    if not binary.is_file() or binary.stat().st_mtime < port.source.stat().st_mtime:
+        _build(["go", "build", "-o", str(binary), str(port.source)], port.source.parent)
+
+    # The program opens ./day-NN/input.txt
+    run_dir = out_dir / "run"
+    day_dir = run_dir / port.source.parent.name
+    day_dir.mkdir(parents=True, exist_ok=True)
+    _stage_input(input_path, day_dir / "input.txt")
+    return [str(binary)], run_dir
+
+
+def build_rust(port: Port, input_path: Path) -> tuple[list[str], Path]:
+    crate = BUILD_DIR / "rust"
+    crate.mkdir(parents=True, exist_ok=True)
+    for manifest in ("Cargo.toml", "Cargo.lock"):
+        if (CARGO_TOML.parent / manifest).is_file():
+            _stage(CARGO_TOML.parent / manifest, crate / manifest)
+    # cargo wants every declared bin's source, but only builds (and so only needs the
+    # input of) this one
+    for other in rust_ports():
+        target = crate / other.source.relative_to(CARGO_TOML.parent)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        _stage(other.source, target)
+    # Compiled into the binary by include_str!("input.txt")
+    _stage_input(input_path, crate / port.source.parent.name / "input.txt")
+    _build(["cargo", "build", "--release", "--quiet", "--bin", port.binary], crate)
+    return [str(crate / "target" / "release" / port.binary)], crate
+
+
+def _stage(source: Path, target: Path, data: bytes | None = None) -> None:
+    # Only rewritten when changed, so cargo's and our own freshness checks keep working
+    data = source.read_bytes() if data is None else data
+    if not target.is_file() or target.read_bytes() != data:
+        target.write_bytes(data)
+
+
+def _stage_input(input_path: Path, target: Path) -> None:
+    # The ports split the input on "\n" and choke on the empty line after a final newline,
+    # which the generated inputs (and most editors) end with
+    _stage(input_path, target, input_path.read_bytes().rstrip(b"\r\n"))
+
+
+def _measure_repeated(
+    name: str, cmd: list[str], cwd: Path, repeat: int, timeout: float
+) -> tuple[Measurement, str]:
+    runs = []
+    for _ in range(max(1, repeat)):
+        run = measure(cmd, cwd, timeout)
+        if run.returncode != 0:
+            return Measurement(name, error=run.failure), run.stdout
+        runs.append(run)
+    measurement = Measurement(
+        name,
+        wall_ns=int(median(r.wall_ns for r in runs)),
+        cpu_ns=int(median(r.cpu_ns for r in runs)),
+        peak_rss=max((r.peak_rss for r in runs if r.peak_rss is not None), default=None),
+    )
+    return measurement, runs[-1].stdout
+
+
+def run_python(day: runner.Day, input_path: Path, repeat: int, timeout: float) -> Measurement:
+    cmd = [sys.executable, "-m", "aoc", "run", str(day.year), str(day.day)]
+    cmd += ["--input", str(input_path.resolve()), "--no-cache"]
+    try:
+        measurement, output = _measure_repeated("python", cmd, runner.ROOT, repeat, timeout)
+    except runner.SolutionError as e:
+        return Measurement("python", error=str(e))
+    measurement.answers = python_answers(day, output)
+    return measurement
+
+
+def run_port(port: Port, input_path: Path, repeat: int, timeout: float) -> Measurement:
+    name = f"{port.language} ({port.binary})"
+    if shutil.which(port.toolchain) is None:
+        return Measurement(name, error=f"skipped, no {port.toolchain} on PATH")
+    build = build_go if port.language == "go" else build_rust
+    try:
+        cmd, cwd = build(port, input_path.resolve())
+        measurement, output = _measure_repeated(name, cmd, cwd, repeat, timeout)
+    except runner.SolutionError as e:
+        return Measurement(name, error=str(e))
+    measurement.answers = scrape_answers(output)
+    return measurement
+
+
+@dataclass
+class Comparison:
+    day: runner.Day
+    input_label: str
+    measurements: list[Measurement]
+
+    @property
+    def reference(self) -> list[str]:
+        return self.measurements[0].answers  # Python's
+
+    def mismatches(self, measurement: Measurement) -> list[str]:
+        reference = self.reference
+        if measurement.error is not None or len(reference) < 2:
+            return []
+        found = []
+        for i, answer in enumerate(measurement.answers):
+            expected = reference[min(i, 1)]
+            if answer != expected:
+                found.append(f"part {min(i, 1) + 1}: {answer} != {expected}")
+        if len(measurement.answers) < len(reference):
+            found.append(f"printed {len(measurement.answers)} answers")
+        return found
+
+    @property
+    def ok(self) -> bool:
+        return all(not self.mismatches(m) for m in self.measurements)
+
+
+def compare(
+    day: runner.Day,
+    input_path: Path,
+    input_label: str,
+    repeat: int = 3,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> Comparison:
+    measurements = [run_python(day, input_path, repeat, timeout)]
+    for port in ports(day):
+        measurements.append(run_port(port, input_path, repeat, timeout))
+    return Comparison(day, input_label, measurements)
+
+
+def format_comparison(comparison: Comparison) -> str:
+    from aoc.memory import format_mb
+
+    reference = comparison.measurements[0]
+    status = "answers agree" if comparison.ok else "ANSWERS DIFFER"
+    ran = sum(m.error is None for m in comparison.measurements)
+    if ran < len(comparison.measurements):
+        status += f" ({ran} of {len(comparison.measurements)} ran)"
+    lines = [
+        f"{comparison.day.name} on {comparison.input_label}: {status}",
+        f"    {'implementation':<24} {'wall':>10} {'cpu':>10} {'peak RSS':>10}  answers",
+    ]
+    for m in comparison.measurements:
+        if m.error is not None:
+            lines.append(f"    {m.implementation:<24} {m.error}")
+            continue
+        assert m.wall_ns is not None and m.cpu_ns is not None
+        speedup = ""
+        if m is not reference and reference.wall_ns:
+            speedup = f"  {reference.wall_ns / m.wall_ns:.1f}x python"
+        mismatches = comparison.mismatches(m)
+        mark = f"  <- {'; '.join(mismatches)}" if mismatches else ""
+        lines.append(
+            f"    {m.implementation:<24} {m.wall_ns / 1e6:>8.2f}ms {m.cpu_ns / 1e6:>8.2f}ms"
+            f" {format_mb(m.peak_rss):>10}  {' '.join(m.answers)}{speedup}{mark}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,173 @@
+"""
+A resident worker that keeps solutions imported and inputs parsed between runs.
+
+    python -m aoc daemon &                  # serve on .aoc/daemon.sock
+    python -m aoc.client 2024 21            # same output as `run`, solved by the daemon
+    python -m aoc run 2024 21 --daemon      # the same through the full CLI (slower start)
+    python -m aoc daemon --stop
+
+Requests and responses are single JSON lines over a Unix domain socket, so any client that
+can write a line works (`echo '{"year": 2024, "day": 21}' | nc -U .aoc/daemon.sock`):
+
+    {"year": 2024, "day": 21, "input": "path", "parts": [1, 2]}
+    {"ok": true, "reloaded": false, "parse": "memory", "parse_ns": 0,
+     "parts": [{"part": 1, "answer": "...", "elapsed_ns": 123}, ...]}
+
+A day's module is re-imported whenever its file's mtime changes, which also drops its
+parsed inputs. Shared modules (aoc.grid, ...) are not watched; restart the daemon after
+editing those. Every part runs with the aoc.memo caches emptied, so repeat timings are of
+the solution rather than of cache hits left by the last request. Requests are served one
+at a time.
+"""
+
+import json
+import socket
+import socketserver
+import sys
+import threading
+import traceback
+from collections import OrderedDict
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any
+
+from aoc import cache, client, memo, runner
+
+SOCKET_PATH = Path(client.SOCKET_PATH)
+PRELOAD = ("numpy", "scipy.optimize")  # heavy imports the days load lazily
+MAX_PARSED = 16  # parsed inputs kept in memory, least recently used go first
+
+
+class Worker:
+    def __init__(self, use_cache: bool = cache.ENABLED) -> None:
+        self.use_cache = use_cache
+        self.days: dict[tuple[int, int], tuple[runner.Day, int]] = {}
+        self.parsed: OrderedDict[tuple[Any, ...], Any] = OrderedDict()
+
+    def day(self, year: int, day: int) -> tuple[runner.Day, bool]:
+        """The loaded day, re-imported (and its parsed inputs dropped) if its file changed."""
+        loaded = self.days.get((year, day))
+        if loaded is not None:
+            d, mtime = loaded
+            if d.path.stat().st_mtime_ns == mtime:
+                return d, False
+
+        d = runner.find_day(year, day)
+        mtime = d.path.stat().st_mtime_ns
+        d.load()
+        self.days[(year, day)] = (d, mtime)
+        for key in [key for key in self.parsed if key[:2] == (year, day)]:
+            del self.parsed[key]
+        return d, loaded is not None
+
+    def parse(self, day: runner.Day, input_path: Path) -> tuple[Any, str, int]:
+        stat = input_path.stat()
+        key = (day.year, day.day, str(input_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        start = perf_counter_ns()
+        if key in self.parsed:
+            self.parsed.move_to_end(key)
+            return self.parsed[key], "memory", perf_counter_ns() - start
+
+        source = "disk"
+        parsed = cache.get(day, input_path) if self.use_cache else None
+        if parsed is None:
+            source = "parsed"
+            parsed = day.parse(input_path)
+            if self.use_cache:
+                cache.put(day, input_path, parsed)
+        elapsed = perf_counter_ns() - start
+
+        self.parsed[key] = parsed
+        while len(self.parsed) > MAX_PARSED:
+            self.parsed.popitem(last=False)
+        return parsed, source, elapsed
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        day, reloaded = self.day(int(request["year"]), int(request["day"]))
+        input_path = Path(request.get("input") or day.default_input)
+        if not input_path.is_file():
+            raise runner.SolutionError(f"{day.name}: no input at {input_path}")
+
+        parsed, source, parse_ns = self.parse(day, input_path)
+        results = []
+        for part in request.get("parts") or (1, 2):
+            # Memos still hold the previous request's answers, which would time cache hits
+            memo.clear_all()
+            results.extend(runner.run_parts(day, parsed, (part,)))
+        return {
+            "ok": True,
+            "reloaded": reloaded,
+            "parse": source,
+            "parse_ns": parse_ns,
+            "parts": [
+                {"part": r.part, "answer": str(r.answer), "elapsed_ns": r.elapsed_ns}
+                for r in results
+            ],
+        }
+
+
+class Handler(socketserver.StreamRequestHandler):
+    server: "Server"
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                if request.get("command") == "stop":
+                    response: dict[str, Any] = {"ok": True}
+                    # shutdown() waits for serve_forever, which is waiting for us
+                    threading.Thread(target=self.server.shutdown).start()
+                else:
+                    response = self.server.worker.handle(request)
+            except Exception as e:
+                response = {
+                    "ok": False,
+                    "error": f"{type(e).__name__}: {e}",
+                    "traceback": traceback.format_exc(),
+                }
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class Server(socketserver.UnixStreamServer):
+    def __init__(self, path: Path, worker: Worker) -> None:
+        self.worker = worker
+        super().__init__(str(path), Handler)
+
+
+def running(path: Path = SOCKET_PATH) -> bool:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.connect(str(path))
+        return True
+    except OSError:
+        return False
+
+
+def preload(modules: tuple[str, ...] = PRELOAD) -> list[str]:
+    loaded = []
+    for name in modules:
+        try:
+            __import__(name)
+            loaded.append(name)
+        except ImportError:
+            pass
+    return loaded
+
+
+def serve(
+    path: Path = SOCKET_PATH, modules: tuple[str, ...] = PRELOAD, use_cache: bool = cache.ENABLED
+) -> None:
+    if running(path):
+        raise runner.SolutionError(f"a daemon is already listening on {path}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)  # stale socket from a daemon that didn't exit cleanly
+
+    loaded = preload(modules)
+    server = Server(path, Worker(use_cache))
+    print(f"aoc daemon on {path} (preloaded: {', '.join(loaded) or 'nothing'})", file=sys.stderr)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        path.unlink(missing_ok=True)
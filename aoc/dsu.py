@@ -0,0 +1,105 @@
+"""
+Union-find over integer node ids (Grid cell indices, junction box ids, ...), in two flat
+`array('i')` buffers rather than a dict or a list of ints:
+
+    circuits = DSU(len(nodes))
+    circuits.union(a, b)                    # False if they were already connected
+    circuits.union_many(edges[:1000, 1:])   # an (n, 2) numpy array, or any pairs
+    circuits.size(a), circuits.components, circuits.sizes()
+
+Union by size keeps every tree O(log n) deep whatever order the unions come in (linking
+"smaller index wins" can build an n-long chain), and `find` halves the path it walks, so
+neither ever recurses. Which node represents a component is an implementation detail:
+compare `find`s, don't store them across unions.
+"""
+
+from array import array
+from typing import Any, Iterable, Iterator
+
+CHUNK = 4096  # numpy rows converted to Python ints at a time
+
+
+class DSU:
+    __slots__ = ("parent", "size_of", "components")
+
+    def __init__(self, n: int) -> None:
+        self.parent = array("i", range(n))
+        self.size_of = array("i", [1]) * n  # only meaningful for roots
+        self.components = n
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            # Path halving: point x at its grandparent and continue from there
+            parent[x] = x = parent[parent[x]]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        """Merges the components of a and b, False if they already were one."""
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        size_of = self.size_of
+        if size_of[a] < size_of[b]:
+            a, b = b, a
+        self.parent[b] = a
+        size_of[a] += size_of[b]
+        self.components -= 1
+        return True
+
+    def union_many(self, pairs: Any, until: int = 1) -> int:
+        """
+        Unions pairs in order, an (n, 2) numpy array or any iterable of pairs, stopping as
+        soon as only `until` components are left. Returns the index of the last pair that
+        merged two components (pairs already connected don't count), -1 if none did.
+        """
+        parent, size_of = self.parent, self.size_of
+        components = self.components
+        last = -1
+        # find() and union() inlined, this loop runs once per edge
+        for i, (a, b) in enumerate(python_pairs(pairs)):
+            while parent[a] != a:
+                parent[a] = a = parent[parent[a]]
+            while parent[b] != b:
+                parent[b] = b = parent[parent[b]]
+            if a == b:
+                continue
+            if size_of[a] < size_of[b]:
+                a, b = b, a
+            parent[b] = a
+            size_of[a] += size_of[b]
+            components -= 1
+            last = i
+            if components <= until:
+                break
+        self.components = components
+        return last
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
+
+    def size(self, x: int) -> int:
+        """Number of nodes in x's component."""
+        return self.size_of[self.find(x)]
+
+    def roots(self) -> Iterable[int]:
+        return (x for x, p in enumerate(self.parent) if x == p)
+
+    def sizes(self) -> list[int]:
+        """The size of every component, in no particular order."""
+        return [self.size_of[x] for x in self.roots()]
+
+
+def python_pairs(pairs: Any) -> Iterator[Any]:
+    """
+    A numpy array's rows as lists of Python ints (numpy ints are slow to index an
+    array('i') with), a chunk at a time since union_many often stops early.
+    """
+    if not hasattr(pairs, "tolist"):
+        yield from pairs
+        return
+    for start in range(0, len(pairs), CHUNK):
+        yield from pairs[start : start + CHUNK].tolist()
@@ -0,0 +1,109 @@
+"""
+Sorting streams of 64-bit integers that don't fit in memory, for inputs of many gigabytes:
+
+    with ExternalSort() as left:
+        for chunk in read_ints_chunked(file_path):   # array('q') chunks
+            left.add(chunk)
+        for value in left.merged():                  # every value, in ascending order
+            ...
+
+Values are buffered in an array('q') until `run_size` of them are held, then that run is
+sorted and written to a temporary file as raw int64s. `merged` k-way merges the runs with
+`heapq.merge`, reading each one back `BLOCK` values at a time, and can be called again
+for another pass. A merge never reads more than FAN_IN runs at once: while there are more,
+groups of FAN_IN are first merged into longer runs on disk, as many passes as it takes.
+So whatever the input size, memory stays at about one run being sorted (`sorted` makes a
+list of Python ints, ~36 bytes a value) or FAN_IN blocks (MERGE_BYTES) per merge, and
+each merge holds at most FAN_IN files open. Runs go to the system temp directory unless
+`tmp_dir` says otherwise, and are deleted when the `with` block ends.
+"""
+
+import heapq
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Iterable, Iterator
+
+RUN_SIZE = 1 << 20  # values sorted in memory at a time, ~40 MB while sorting
+FAN_IN = 64  # runs merged at once, so files open per merge
+MERGE_BYTES = 16 << 20  # read buffers of one merge, split between its runs
+BLOCK = MERGE_BYTES // (8 * FAN_IN)  # values read back from a run at a time while merging
+
+
+class ExternalSort:
+    def __init__(self, run_size: int = RUN_SIZE, tmp_dir: str | Path | None = None) -> None:
+        self.run_size = run_size
+        self.buffer = array("q")
+        self.runs: list[Path] = []
+        self._written = 0  # runs ever written, to name the next one
+        self._dir = tempfile.TemporaryDirectory(prefix="aoc-extsort-", dir=tmp_dir)
+
+    def __enter__(self) -> "ExternalSort":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._dir.cleanup()
+
+    def __len__(self) -> int:
+        return sum(path.stat().st_size for path in self.runs) // 8 + len(self.buffer)
+
+    def add(self, values: Iterable[int]) -> None:
+        buffer = self.buffer
+        buffer.extend(values)
+        while len(buffer) >= self.run_size:
+            self._write_run(buffer[: self.run_size])
+            del buffer[: self.run_size]
+
+    def _new_run(self) -> Path:
+        self._written += 1
+        return Path(self._dir.name) / f"run-{self._written:06d}.q"
+
+    def _write_run(self, values: array) -> None:
+        path = self._new_run()
+        with open(path, "wb") as f:
+            array("q", sorted(values)).tofile(f)
+        self.runs.append(path)
+
+    def _merge_runs(self, runs: list[Path]) -> Path:
+        """Merges runs into a new one on disk, deleting them."""
+        path = self._new_run()
+        with open(path, "wb") as f:
+            block = array("q")
+            for value in heapq.merge(*(read_run(run) for run in runs)):
+                block.append(value)
+                if len(block) == BLOCK:
+                    block.tofile(f)
+                    block = array("q")
+            block.tofile(f)
+        for run in runs:
+            run.unlink()
+        return path
+
+    def merged(self) -> Iterator[int]:
+        """Every value added so far, in ascending order."""
+        if self.buffer:
+            self._write_run(self.buffer)
+            self.buffer = array("q")
+        while len(self.runs) > FAN_IN:
+            self.runs = [
+                self._merge_runs(self.runs[i : i + FAN_IN])
+                for i in range(0, len(self.runs), FAN_IN)
+            ]
+        if len(self.runs) == 1:
+            return read_run(self.runs[0])
+        return heapq.merge(*(read_run(path) for path in self.runs))
+
+
+def read_run(path: Path) -> Iterator[int]:
+    with open(path, "rb") as f:
+        while True:
+            block = array("q")
+            try:
+                block.fromfile(f, BLOCK)
+            except EOFError:  # the last, partial block is still read
+                yield from block
+                return
+            yield from block
@@ -0,0 +1,62 @@
+"""
+Deterministic synthetic inputs for every puzzle, at any scale.
+
+`scale` multiplies the size of a typical puzzle input: scale=1 is roughly what the puzzle
+hands out, scale=1000 for 2024 day 1 is 10^6 location pairs. Grid days grow the *area*
+by `scale`, so each side grows by sqrt(scale). Where a solution hardcodes a size (the
+71x71 memory space of 2024 day 18, the 101x103 room of day 14) the generator keeps it and
+only scales what it can.
+"""
+
+import hashlib
+import inspect
+import random
+from pathlib import Path
+from typing import Callable
+
+from aoc import runner
+
+Generator = Callable[[random.Random, float], str]
+
+GENERATORS: dict[tuple[int, int], Generator] = {}
+GENERATED_DIR = runner.ROOT / ".aoc" / "generated"
+
+
+def generator(year: int, day: int) -> Callable[[Generator], Generator]:
+    def register(f: Generator) -> Generator:
+        GENERATORS[(year, day)] = f
+        return f
+
+    return register
+
+
+def make_rng(year: int, day: int, seed: int) -> random.Random:
+    return random.Random((year * 100 + day) * 1_000_003 + seed)
+
+
+def generate(year: int, day: int, scale: float = 1, seed: int = 0) -> str:
+    if (year, day) not in GENERATORS:
+        raise runner.SolutionError(f"No generator for {year} day {day:02d}")
+    return GENERATORS[(year, day)](make_rng(year, day, seed), scale)
+
+
+def generated_path(year: int, day: int, scale: float = 1, seed: int = 0) -> Path:
+    """
+    Generates (once) and returns the path of an input file under .aoc/generated. The name
+    carries a hash of the generator's module, so editing a generator makes new files.
+    """
+    if (year, day) not in GENERATORS:
+        raise runner.SolutionError(f"No generator for {year} day {day:02d}")
+    source = Path(inspect.getsourcefile(GENERATORS[(year, day)]) or __file__).read_bytes()
+    version = hashlib.sha1(source).hexdigest()[:8]
+    path = GENERATED_DIR / f"{year}-{day:02d}-x{scale:g}-seed{seed}-{version}.txt"
+    if not path.is_file():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(generate(year, day, scale, seed))
+        tmp.replace(path)
+    return path
+
+
+# Registers the generators
+from aoc.generators import y2024, y2025  # noqa: E402,F401
@@ -0,0 +1,597 @@
+import math
+import random
+from collections import deque
+
+from aoc.generators import generator
+
+
+def side(base: int, scale: float) -> int:
+    return max(4, round(base * scale**0.5))
+
+
+def count(base: int, scale: float) -> int:
+    return max(1, round(base * scale))
+
+
+def lines(rows: list[str]) -> str:
+    return "\n".join(rows) + "\n"
+
+
+def walled_grid(width: int, height: int) -> list[list[str]]:
+    grid = [["."] * width for _ in range(height)]
+    for x in range(width):
+        grid[0][x] = grid[height - 1][x] = "#"
+    for y in range(height):
+        grid[y][0] = grid[y][width - 1] = "#"
+    return grid
+
+
+def maze(rng: random.Random, width: int, height: int) -> list[list[str]]:
+    """Randomised DFS maze on odd coordinates; width and height must be odd."""
+    grid = [["#"] * width for _ in range(height)]
+    stack = [(1, height - 2)]
+    grid[height - 2][1] = "."
+    while stack:
+        x, y = stack[-1]
+        options = [
+            (x + dx, y + dy)
+            for dx, dy in ((2, 0), (-2, 0), (0, 2), (0, -2))
+            if 0 < x + dx < width - 1 and 0 < y + dy < height - 1 and grid[y + dy][x + dx] == "#"
+        ]
+        if not options:
+            stack.pop()
+            continue
+        nx, ny = rng.choice(options)
+        grid[(y + ny) // 2][(x + nx) // 2] = "."
+        grid[ny][nx] = "."
+        stack.append((nx, ny))
+    return grid
+
+
+@generator(2024, 1)
+def location_lists(rng: random.Random, scale: float) -> str:
+    n = count(1000, scale)
+    # Draw the right column partly from the left one so part 2 has matches to count
+    left = [rng.randint(10000, 99999) for _ in range(n)]
+    right = [rng.choice(left) if rng.random() < 0.2 else rng.randint(10000, 99999) for _ in range(n)]
+    return lines([f"{a}   {b}" for a, b in zip(left, right)])
+
+
+@generator(2024, 2)
+def reports(rng: random.Random, scale: float) -> str:
+    rows = []
+    for _ in range(count(1000, scale)):
+        length = rng.randint(5, 8)
+        step = rng.choice((1, -1))
+        level = rng.randint(10, 90)
+        report = []
+        for _ in range(length):
+            report.append(level)
+            level += step * rng.randint(1, 3)
+        # Roughly half the reports get one or two bad levels
+        for _ in range(rng.choice((0, 0, 1, 2))):
+            report[rng.randrange(length)] = rng.randint(1, 99)
+        rows.append(" ".join(map(str, report)))
+    return lines(rows)
+
+
+@generator(2024, 3)
+def corrupted_memory(rng: random.Random, scale: float) -> str:
+    junk = "mul()dont'do%&*[]!@^+-?<>:;,{}# abcdefwhy123"
+    rows = []
+    for _ in range(count(6, scale)):
+        parts = []
+        while sum(map(len, parts)) < 3000:
+            r = rng.random()
+            if r < 0.15:
+                parts.append(f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})")
+            elif r < 0.17:
+                parts.append("do()")
+            elif r < 0.19:
+                parts.append("don't()")
+            else:
+                parts.append("".join(rng.choice(junk) for _ in range(rng.randint(1, 8))))
+        rows.append("".join(parts))
+    return lines(rows)
+
+
+@generator(2024, 4)
+def word_search(rng: random.Random, scale: float) -> str:
+    n = side(140, scale)
+    return lines(["".join(rng.choice("XMAS") for _ in range(n)) for _ in range(n)])
+
+
+@generator(2024, 5)
+def page_ordering(rng: random.Random, scale: float) -> str:
+    pages = rng.sample(range(10, 100), 49)  # pages are 2-digit and the rules cover every pair
+    rules = [f"{a}|{b}" for i, a in enumerate(pages) for b in pages[i + 1 :]]
+    rng.shuffle(rules)
+
+    updates = []
+    for _ in range(count(200, scale)):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(",".join(map(str, update)))
+    return lines(rules) + "\n" + lines(updates)
+
+
+def guard_route(grid: list[list[str]], x: int, y: int) -> int:
+    """Cells the guard visits before leaving the map, or 0 if it walks in a loop."""
+    n = len(grid)
+    dx, dy = 0, -1
+    seen = set()
+    while True:
+        if (x, y, dx, dy) in seen:
+            return 0
+        seen.add((x, y, dx, dy))
+        nx, ny = x + dx, y + dy
+        if not (0 <= nx < n and 0 <= ny < n):
+            return len({(x, y) for x, y, _, _ in seen})
+        if grid[ny][nx] == "#":
+            dx, dy = -dy, dx
+        else:
+            x, y = nx, ny
+
+
+@generator(2024, 6)
+def guard_map(rng: random.Random, scale: float) -> str:
+    # day6.has_exited assumes a square map
+    n = side(130, scale)
+    while True:
+        grid = [["#" if rng.random() < 0.02 else "." for _ in range(n)] for _ in range(n)]
+        x, y = rng.randrange(n), rng.randrange(n // 2, n)
+        grid[y][x] = "^"
+        # part 1 must terminate, so the guard has to leave the map. Most random maps let it
+        # walk straight out, so also insist on a route long enough to be worth scaling.
+        if guard_route(grid, x, y) >= 2 * n:
+            return lines(["".join(row) for row in grid])
+
+
+MAX_CALIBRATION = 10**15  # the real test values have at most 15 digits
+
+
+@generator(2024, 7)
+def calibrations(rng: random.Random, scale: float) -> str:
+    rows = []
+    totals = set()  # test values are unique in the real inputs, and day7.go relies on it
+    while len(rows) < count(850, scale):
+        numbers = [rng.randint(1, 999) if rng.random() < 0.3 else rng.randint(1, 9) for _ in range(rng.randint(3, 12))]
+        total = numbers[0]
+        for n in numbers[1:]:
+            op = rng.randrange(3)
+            if op == 1 and total * n < MAX_CALIBRATION:
+                total *= n
+            elif op == 2 and int(f"{total}{n}") < MAX_CALIBRATION:
+                total = int(f"{total}{n}")
+            else:  # adding keeps the total in range, the others would overshoot it
+                total += n
+        if rng.random() < 0.4:
+            total += rng.randint(1, 100)
+        if total not in totals:
+            totals.add(total)
+            rows.append(f"{total}: {' '.join(map(str, numbers))}")
+    return lines(rows)
+
+
+FREQUENCIES = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+@generator(2024, 8)
+def antennas(rng: random.Random, scale: float) -> str:
+    n = side(50, scale)  # day8.is_within_bounds assumes a square map
+    # Like the real maps, every frequency has a handful of antennas (at least two, or it
+    # makes no antinodes) on cells of their own
+    total = min(count(200, scale), n * n)
+    frequencies = rng.sample(FREQUENCIES, max(1, min(len(FREQUENCIES), total // 4)))
+    cells = rng.sample(range(n * n), total)
+    grid = [["."] * n for _ in range(n)]
+    for i, cell in enumerate(cells):
+        grid[cell // n][cell % n] = frequencies[i % len(frequencies)]
+    return lines(["".join(row) for row in grid])
+
+
+@generator(2024, 9)
+def disk_map(rng: random.Random, scale: float) -> str:
+    n = count(9999, scale)
+    digits = []
+    for i in range(2 * n + 1):  # file, free, file, ..., file
+        digits.append(str(rng.randint(1, 9) if i % 2 == 0 else rng.randint(0, 9)))
+    return "".join(digits) + "\n"
+
+
+@generator(2024, 10)
+def topographic_map(rng: random.Random, scale: float) -> str:
+    # A smooth height field (a few random waves) so neighbouring heights mostly differ by
+    # at most one, like the real maps, which is what makes for lots of hiking trails
+    n = side(50, scale)
+    waves = [
+        (
+            rng.uniform(0.15, 0.3) * rng.choice((-1, 1)),
+            rng.uniform(0.15, 0.3) * rng.choice((-1, 1)),
+            rng.uniform(0, 2 * math.pi),
+        )
+        for _ in range(3)
+    ]
+    grid = []
+    for y in range(n):
+        row = ""
+        for x in range(n):
+            height = 4.5 + 2.5 * sum(math.sin(fx * x + fy * y + phase) for fx, fy, phase in waves)
+            row += str(min(9, max(0, int(height))))
+        grid.append(row)
+    return lines(grid)
+
+
+@generator(2024, 11)
+def stones(rng: random.Random, scale: float) -> str:
+    return " ".join(str(rng.randint(0, 10**7)) for _ in range(count(8, scale))) + "\n"
+
+
+@generator(2024, 12)
+def garden(rng: random.Random, scale: float) -> str:
+    n = side(140, scale)
+    block = 5
+    coarse = [[rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(n // block + 1)] for _ in range(n // block + 1)]
+    grid = [[coarse[y // block][x // block] for x in range(n)] for y in range(n)]
+    # Ragged borders: copy a neighbour's plant into some cells
+    for _ in range(n * n // 4):
+        x, y = rng.randrange(1, n - 1), rng.randrange(1, n - 1)
+        dx, dy = rng.choice(((1, 0), (-1, 0), (0, 1), (0, -1)))
+        grid[y][x] = grid[y + dy][x + dx]
+    return lines(["".join(row) for row in grid])
+
+
+@generator(2024, 13)
+def claw_machines(rng: random.Random, scale: float) -> str:
+    machines = []
+    for _ in range(count(320, scale)):
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        # Parallel buttons never occur in the real inputs, and day13 also trips over ax == ay
+        while ax * by == ay * bx or ax == ay:
+            ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        if rng.random() < 0.5:
+            i, j = rng.randint(0, 100), rng.randint(0, 100)
+            px, py = ax * i + bx * j, ay * i + by * j
+        else:
+            px, py = rng.randint(1000, 20000), rng.randint(1000, 20000)
+        machines.append(
+            f"Button A: X+{ax}, Y+{ay}\nButton B: X+{bx}, Y+{by}\nPrize: X={px}, Y={py}\n"
+        )
+    return "\n".join(machines)
+
+
+@generator(2024, 14)
+def robots(rng: random.Random, scale: float) -> str:
+    width, height = 101, 103  # hardcoded in day14
+    rows = []
+    # Plant a line of robots at some second so part 2 terminates
+    tree_time = rng.randint(100, width * height - 1)
+    x0, y0 = rng.randint(0, width - 20), rng.randint(0, height - 4)
+    for k in range(16):
+        vx, vy = rng.randint(-99, 99), rng.randint(-99, 99)
+        px = (x0 + k - tree_time * vx) % width
+        py = (y0 - tree_time * vy) % height
+        rows.append(f"p={px},{py} v={vx},{vy}")
+    for _ in range(count(500, scale)):
+        rows.append(
+            f"p={rng.randrange(width)},{rng.randrange(height)} "
+            f"v={rng.randint(-99, 99)},{rng.randint(-99, 99)}"
+        )
+    rng.shuffle(rows)
+    return lines(rows)
+
+
+@generator(2024, 15)
+def warehouse(rng: random.Random, scale: float) -> str:
+    n = side(50, scale)
+    grid = walled_grid(n, n)
+    for y in range(1, n - 1):
+        for x in range(1, n - 1):
+            r = rng.random()
+            grid[y][x] = "#" if r < 0.05 else "O" if r < 0.3 else "."
+    grid[rng.randrange(1, n - 1)][rng.randrange(1, n - 1)] = "@"
+    moves = "".join(rng.choice("<>^v") for _ in range(count(20000, scale)))
+    move_rows = [moves[i : i + 1000] for i in range(0, len(moves), 1000)]
+    return lines(["".join(row) for row in grid]) + "\n" + lines(move_rows)
+
+
+@generator(2024, 16)
+def reindeer_maze(rng: random.Random, scale: float) -> str:
+    n = side(141, scale) | 1
+    grid = maze(rng, n, n)
+    # Knock out extra walls so there are several best paths
+    for _ in range(n * n // 20):
+        x, y = rng.randrange(1, n - 1), rng.randrange(1, n - 1)
+        if (x + y) % 2 == 1:
+            grid[y][x] = "."
+    grid[n - 2][1] = "S"
+    grid[1][n - 2] = "E"
+    return lines(["".join(row) for row in grid])
+
+
+def run_program(a: int, program: list[int]) -> list[int]:
+    b = c = 0
+    out = []
+    i = 0
+    while i < len(program):
+        op, operand = program[i], program[i + 1]
+        combo = (0, 1, 2, 3, a, b, c, -1)[operand]
+        if op == 0:
+            a >>= combo
+        elif op == 1:
+            b ^= operand
+        elif op == 2:
+            b = combo % 8
+        elif op == 3 and a != 0:
+            i = operand
+            continue
+        elif op == 4:
+            b ^= c
+        elif op == 5:
+            out.append(combo % 8)
+        elif op == 6:
+            b = a >> combo
+        elif op == 7:
+            c = a >> combo
+        i += 2
+    return out
+
+
+def find_quine(program: list[int], a: int = 0, cursor: int | None = None) -> int | None:
+    cursor = len(program) - 1 if cursor is None else cursor
+    for k in range(8):
+        if run_program(a * 8 + k, program) == program[cursor:]:
+            if cursor == 0:
+                return a * 8 + k
+            found = find_quine(program, a * 8 + k, cursor - 1)
+            if found is not None:
+                return found
+    return None
+
+
+@generator(2024, 17)
+def chronospatial_computer(rng: random.Random, scale: float) -> str:
+    # Same shape as the real programs (bst, bxl, cdv, bxl, bxc, out, adv, jnz), with
+    # constants chosen so that part 2's self-reproducing A exists.
+    while True:
+        k1, k2 = rng.randrange(8), rng.randrange(8)
+        program = [2, 4, 1, k1, 7, 5, 1, k2, 4, rng.randrange(8), 5, 5, 0, 3, 3, 0]
+        if find_quine(program) is not None:
+            break
+    # Part 1 prints one digit per octal digit of A
+    a = rng.randrange(8 ** (count(16, scale) - 1), 8 ** count(16, scale))
+    return f"Register A: {a}\nRegister B: 0\nRegister C: 0\n\nProgram: {','.join(map(str, program))}\n"
+
+
+def path_exists(walls: set[tuple[int, int]], size: int) -> bool:
+    q = deque([(0, 0)])
+    seen = {(0, 0)}
+    while q:
+        x, y = q.popleft()
+        if (x, y) == (size - 1, size - 1):
+            return True
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if 0 <= nx < size and 0 <= ny < size and (nx, ny) not in walls and (nx, ny) not in seen:
+                seen.add((nx, ny))
+                q.append((nx, ny))
+    return False
+
+
+@generator(2024, 18)
+def falling_bytes(rng: random.Random, scale: float) -> str:
+    size = 71  # day18 hardcodes the 71x71 space and the first kilobyte
+    cells = [(x, y) for y in range(size) for x in range(size) if (x, y) not in ((0, 0), (size - 1, size - 1))]
+    while True:
+        rng.shuffle(cells)
+        if path_exists(set(cells[:1024]), size):
+            break
+    return lines([f"{x},{y}" for x, y in cells[: min(len(cells), count(3450, scale))]])
+
+
+TOWEL_COLOURS = "wubrg"
+
+
+@generator(2024, 19)
+def towels(rng: random.Random, scale: float) -> str:
+    patterns = {"".join(rng.choice(TOWEL_COLOURS) for _ in range(rng.randint(1, 8))) for _ in range(447)}
+    patterns.discard("r")  # a missing single colour makes some designs impossible
+    available = sorted(patterns)
+    designs = []
+    for _ in range(count(400, scale)):
+        length = rng.randint(20, 60)
+        if rng.random() < 0.7:
+            design = ""
+            while len(design) < length:
+                design += rng.choice(available)
+        else:
+            design = "".join(rng.choice(TOWEL_COLOURS) for _ in range(length))
+        designs.append(design)
+    return ", ".join(available) + "\n\n" + lines(designs)
+
+
+@generator(2024, 20)
+def racetrack(rng: random.Random, scale: float) -> str:
+    # A single track winding round the whole map, so every track cell is reachable from S
+    # and E and walls between two stretches of track are everywhere. Track cells sit on odd
+    # coordinates, a cells x cells lattice, and the track is a Hamiltonian cycle of it: the
+    # outline of a random spanning tree of the 2x2 blocks of cells (a maze on half the
+    # lattice), cut open at one place to make the start and the end.
+    cells = max(2, (side(141, scale) - 1) // 2) & ~1
+    n = 2 * cells + 1
+    blocks = cells // 2
+    tree = maze(rng, 2 * blocks + 1, 2 * blocks + 1)
+
+    def joined(bx: int, by: int, dx: int, dy: int) -> bool:
+        return tree[2 * by + 1 + dy][2 * bx + 1 + dx] == "."
+
+    # Each cell ends up with exactly two neighbours along the cycle
+    neighbours: list[list[int]] = [[] for _ in range(cells * cells)]
+
+    def link(x1: int, y1: int, x2: int, y2: int) -> None:
+        neighbours[y1 * cells + x1].append(y2 * cells + x2)
+        neighbours[y2 * cells + x2].append(y1 * cells + x1)
+
+    for by in range(blocks):
+        for bx in range(blocks):
+            x, y = 2 * bx, 2 * by
+            # Round the block's edge, except where the tree leads out of it
+            if not joined(bx, by, 0, -1):
+                link(x, y, x + 1, y)
+            if not joined(bx, by, 0, 1):
+                link(x, y + 1, x + 1, y + 1)
+            if not joined(bx, by, -1, 0):
+                link(x, y, x, y + 1)
+            if not joined(bx, by, 1, 0):
+                link(x + 1, y, x + 1, y + 1)
+            # and over into the next block where it does
+            if bx + 1 < blocks and joined(bx, by, 1, 0):
+                link(x + 1, y, x + 2, y)
+                link(x + 1, y + 1, x + 2, y + 1)
+            if by + 1 < blocks and joined(bx, by, 0, 1):
+                link(x, y + 1, x, y + 2)
+                link(x + 1, y + 1, x + 1, y + 2)
+
+    start = rng.randrange(cells * cells)
+    track = [start, neighbours[start][0]]
+    while len(track) < cells * cells:
+        a, b = neighbours[track[-1]]
+        track.append(b if a == track[-2] else a)
+
+    grid = [["#"] * n for _ in range(n)]
+    previous = None
+    for cell in track:
+        x, y = 2 * (cell % cells) + 1, 2 * (cell // cells) + 1
+        grid[y][x] = "."
+        if previous is not None:
+            grid[(y + previous[1]) // 2][(x + previous[0]) // 2] = "."
+        previous = x, y
+    x, y = 2 * (start % cells) + 1, 2 * (start // cells) + 1
+    grid[y][x] = "S"
+    grid[previous[1]][previous[0]] = "E"
+    return lines(["".join(row) for row in grid])
+
+
+@generator(2024, 21)
+def keypad_codes(rng: random.Random, scale: float) -> str:
+    return lines([f"{rng.randint(0, 999):03d}A" for _ in range(count(5, scale))])
+
+
+@generator(2024, 22)
+def secrets(rng: random.Random, scale: float) -> str:
+    return lines([str(rng.randrange(1, 1 << 24)) for _ in range(count(2400, scale))])
+
+
+@generator(2024, 23)
+def lan_party(rng: random.Random, scale: float) -> str:
+    names = [a + b for a in "abcdefghijklmnopqrstuvwxyz" for b in "abcdefghijklmnopqrstuvwxyz"]
+    nodes = rng.sample(names, min(len(names), count(520, scale)))
+    edges = set()
+    clique = nodes[:13]
+    for i, a in enumerate(clique):
+        for b in clique[i + 1 :]:
+            edges.add((a, b))
+    while len(edges) < len(nodes) * 13 // 2:
+        a, b = rng.sample(nodes, 2)
+        if (b, a) not in edges:
+            edges.add((a, b))
+    edge_list = [f"{a}-{b}" for a, b in edges]
+    rng.shuffle(edge_list)
+    return lines(edge_list)
+
+
+def wire_name(rng: random.Random, used: set[str]) -> str:
+    while True:
+        name = "".join(rng.choice("abcdefghijklmnopqrstuvw") for _ in range(3))
+        if name not in used:
+            used.add(name)
+            return name
+
+
+def evaluates(gates: dict[str, tuple[str, str, str]], inputs: set[str]) -> bool:
+    ready = set(inputs)
+    pending = dict(gates)
+    while pending:
+        done = [out for out, (a, b, _) in pending.items() if a in ready and b in ready]
+        if not done:
+            return False
+        for out in done:
+            ready.add(out)
+            del pending[out]
+    return True
+
+
+@generator(2024, 24)
+def crossed_wires(rng: random.Random, scale: float) -> str:
+    # day24 relies on 2-digit wire numbers (x00, z45), so at most 99 bits
+    bits = min(99, count(45, scale))
+    used: set[str] = set()
+    gates: dict[str, tuple[str, str, str]] = {}  # output: (a, b, op)
+    carry = ""
+    xor_ab, and_ab, partial, carry_out = {}, {}, {}, {}
+    for i in range(bits):
+        x, y, z = f"x{i:02d}", f"y{i:02d}", f"z{i:02d}"
+        if i == 0:
+            gates[z] = (x, y, "XOR")
+            carry = wire_name(rng, used)
+            gates[carry] = (x, y, "AND")
+            continue
+        xor_ab[i] = wire_name(rng, used)
+        and_ab[i] = wire_name(rng, used)
+        gates[xor_ab[i]] = (x, y, "XOR")
+        gates[and_ab[i]] = (x, y, "AND")
+        gates[z] = (carry, xor_ab[i], "XOR")
+        partial[i] = wire_name(rng, used)
+        gates[partial[i]] = (carry, xor_ab[i], "AND")
+        carry = f"z{bits:02d}" if i == bits - 1 else wire_name(rng, used)
+        gates[carry] = (partial[i], and_ab[i], "OR")
+        carry_out[i] = carry
+
+    inputs = {f"{c}{i:02d}" for c in "xy" for i in range(bits)}
+    # Four swapped pairs of outputs, in the styles of the real inputs: a z wire swapped with
+    # another gate of its bit, or the two half-adder gates of a bit swapped with each other
+    swapped_bits: set[int] = set()
+    while len(swapped_bits) < 4:
+        i = rng.randrange(2, bits - 1)
+        if i in swapped_bits or i - 1 in swapped_bits or i + 1 in swapped_bits:
+            continue
+        a, b = rng.choice(
+            (
+                (f"z{i:02d}", and_ab[i]),
+                (f"z{i:02d}", partial[i]),
+                (f"z{i:02d}", carry_out[i]),
+                (xor_ab[i], and_ab[i]),
+            )
+        )
+        swapped = dict(gates)
+        swapped[a], swapped[b] = gates[b], gates[a]
+        if b == carry_out[i]:
+            # day24 checks the operands of z gates in order, and would also flag the
+            # (correct) xor_ab of the next bit if the misplaced carry came first
+            z_next = f"z{i + 1:02d}"
+            carry_in, xor_next, op = swapped[z_next]
+            swapped[z_next] = (xor_next, carry_in, op)
+        if evaluates(swapped, inputs):
+            gates = swapped
+            swapped_bits.add(i)
+
+    values = [f"{w}: {rng.randint(0, 1)}" for c in "xy" for w in (f"{c}{i:02d}" for i in range(bits))]
+    gate_rows = [f"{a} {op} {b} -> {out}" for out, (a, b, op) in gates.items()]
+    rng.shuffle(gate_rows)
+    return lines(values) + "\n" + lines(gate_rows)
+
+
+@generator(2024, 25)
+def locks_and_keys(rng: random.Random, scale: float) -> str:
+    schematics = []
+    for _ in range(count(500, scale)):
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        is_lock = rng.random() < 0.5
+        rows = []
+        for r in range(7):
+            if is_lock:
+                rows.append("".join("#" if r <= h else "." for h in heights))
+            else:
+                rows.append("".join("#" if 6 - r <= h else "." for h in heights))
+        schematics.append("\n".join(rows))
+    return "\n\n".join(schematics) + "\n"
@@ -0,0 +1,184 @@
+import random
+
+from aoc.generators import generator
+from aoc.generators.y2024 import count, lines, side
+
+
+@generator(2025, 1)
+def dial_rotations(rng: random.Random, scale: float) -> str:
+    return lines([f"{rng.choice('LR')}{rng.randint(1, 999)}" for _ in range(count(4000, scale))])
+
+
+@generator(2025, 2)
+def id_ranges(rng: random.Random, scale: float) -> str:
+    # The brute-force parts iterate over every id, so scale widens the ranges
+    ranges = []
+    start = rng.randint(10, 1000)
+    for _ in range(30):
+        width = rng.randint(1, count(140000, scale))
+        ranges.append(f"{start}-{start + width}")
+        start = (start + width) * rng.randint(2, 40)
+        if start > 10**12:
+            start = rng.randint(10, 10**6)
+    rng.shuffle(ranges)
+    return ",".join(ranges) + "\n"
+
+
+@generator(2025, 3)
+def battery_banks(rng: random.Random, scale: float) -> str:
+    return lines(["".join(rng.choice("123456789") for _ in range(100)) for _ in range(count(200, scale))])
+
+
+@generator(2025, 4)
+def paper_rolls(rng: random.Random, scale: float) -> str:
+    n = side(140, scale)
+    return lines(["".join("@" if rng.random() < 0.6 else "." for _ in range(n)) for _ in range(n)])
+
+
+@generator(2025, 5)
+def fresh_ingredients(rng: random.Random, scale: float) -> str:
+    ranges = []
+    for _ in range(count(180, scale)):
+        start = rng.randint(1, 5 * 10**14)
+        ranges.append(f"{start}-{start + rng.randint(0, 10**13)}")
+    ids = [str(rng.randint(1, 5 * 10**14)) for _ in range(count(1000, scale))]
+    return lines(ranges) + "\n" + lines(ids)
+
+
+@generator(2025, 6)
+def worksheet(rng: random.Random, scale: float) -> str:
+    rows: list[list[str]] = [[] for _ in range(4)]
+    ops: list[str] = []
+    for _ in range(count(1000, scale)):
+        numbers = [str(rng.randint(1, 9999)) for _ in range(4)]
+        width = max(map(len, numbers))
+        left_aligned = rng.random() < 0.5
+        for row, number in zip(rows, numbers):
+            row.append(number.ljust(width) if left_aligned else number.rjust(width))
+        ops.append(rng.choice("+*").ljust(width))
+    return lines([" ".join(row) for row in rows] + [" ".join(ops)])
+
+
+@generator(2025, 7)
+def tachyon_manifold(rng: random.Random, scale: float) -> str:
+    width, height = side(141, scale), side(142, scale)
+    source = width // 2
+    grid = [["."] * width for _ in range(height)]
+    grid[0][source] = "S"
+    grid[2][source] = "^"
+    for y in range(4, height, 2):
+        # Splitters only where a beam can arrive: the cone widens by one column every two
+        # rows and alternates parity, like the real manifolds. Never on the edge columns.
+        reach = y // 2 - 1
+        for x in range(max(2, source - reach), min(width - 2, source + reach + 1)):
+            if (x - source + reach) % 2 == 0 and rng.random() < 0.8:
+                grid[y][x] = "^"
+    return lines(["".join(row) for row in grid])
+
+
+@generator(2025, 8)
+def junction_boxes(rng: random.Random, scale: float) -> str:
+    return lines(
+        [
+            f"{rng.randint(0, 99999)},{rng.randint(0, 99999)},{rng.randint(0, 99999)}"
+            for _ in range(count(1000, scale))
+        ]
+    )
+
+
+@generator(2025, 9)
+def red_tiles(rng: random.Random, scale: float) -> str:
+    # An x-monotone rectilinear polygon: a staircase along the top from left to right, and
+    # back along the bottom. Consecutive tiles always share a row or column.
+    columns = count(124, scale)
+    xs = sorted(rng.sample(range(1000, 99000), columns + 1))
+    tops: list[int] = []
+    bottoms: list[int] = []
+    for _ in range(columns):
+        top = rng.randint(50000, 98000)
+        bottom = rng.randint(1000, 48000)
+        while tops and top == tops[-1]:
+            top = rng.randint(50000, 98000)
+        while bottoms and bottom == bottoms[-1]:
+            bottom = rng.randint(1000, 48000)
+        tops.append(top)
+        bottoms.append(bottom)
+
+    tiles = []
+    for i in range(columns):
+        tiles += [(xs[i], tops[i]), (xs[i + 1], tops[i])]
+    for i in reversed(range(columns)):
+        tiles += [(xs[i + 1], bottoms[i]), (xs[i], bottoms[i])]
+    return lines([f"{x},{y}" for x, y in tiles])
+
+
+@generator(2025, 10)
+def factory_machines(rng: random.Random, scale: float) -> str:
+    rows = []
+    for _ in range(count(180, scale)):
+        n_lights = rng.randint(4, 10)
+        buttons = [
+            sorted(rng.sample(range(n_lights), rng.randint(1, n_lights - 1)))
+            for _ in range(rng.randint(3, 13))
+        ]
+        # Lights and joltages come from actual presses, so both parts are solvable
+        lights = [False] * n_lights
+        for button in rng.sample(buttons, rng.randint(1, len(buttons))):
+            for i in button:
+                lights[i] = not lights[i]
+        joltages = [0] * n_lights
+        for button in buttons:
+            presses = rng.randint(0, 30)
+            for i in button:
+                joltages[i] += presses
+        diagram = "".join("#" if on else "." for on in lights)
+        schematics = " ".join(f"({','.join(map(str, b))})" for b in buttons)
+        rows.append(f"[{diagram}] {schematics} {{{','.join(map(str, joltages))}}}")
+    return lines(rows)
+
+
+@generator(2025, 11)
+def reactor(rng: random.Random, scale: float) -> str:
+    n = count(600, scale)
+    names: set[str] = {"you", "out", "svr", "fft", "dac"}
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    while len(names) < n:
+        names.add("".join(rng.choice(letters) for _ in range(3)))
+    # Topological order: svr first, out last, everything wired forwards (so it is a DAG)
+    order = ["svr"] + rng.sample(sorted(names - {"svr", "out", "fft", "dac", "you"}), n - 5)
+    order.insert(len(order) // 10, "you")
+    order.insert(len(order) // 3, "fft")
+    order.insert(2 * len(order) // 3, "dac")
+    order.append("out")
+
+    rows = []
+    reach = max(2, n // 10)
+    for i, node in enumerate(order[:-1]):
+        later = order[i + 1 : i + 1 + reach]
+        outputs = set(rng.sample(later, min(len(later), rng.randint(1, 3))))
+        if i + 1 < len(order):
+            outputs.add(order[i + 1])  # keep every node connected to the next one
+        rows.append(f"{node}: {' '.join(sorted(outputs))}")
+    rng.shuffle(rows)
+    return lines(rows)
+
+
+@generator(2025, 12)
+def present_regions(rng: random.Random, scale: float) -> str:
+    shapes = []
+    for i in range(6):
+        cells = ["#" if rng.random() < 0.7 else "." for _ in range(9)]
+        cells[4] = "#"
+        shapes.append(f"{i}:\n" + "\n".join("".join(cells[r * 3 : r * 3 + 3]) for r in range(3)))
+
+    # Like the real input: every region either trivially fits or trivially does not
+    regions = []
+    for _ in range(count(1000, scale)):
+        width, height = rng.randint(12, 50), rng.randint(12, 50)
+        squares = (width // 3) * (height // 3)
+        total = squares if rng.random() < 0.5 else (width * height) // 5
+        counts = [0] * 6
+        for _ in range(total):
+            counts[rng.randrange(6)] += 1
+        regions.append(f"{width}x{height}: {' '.join(map(str, counts))}")
+    return "\n\n".join(shapes) + "\n\n" + lines(regions)
@@ -0,0 +1,256 @@
+"""
+Differential testing of a day's implementations against each other and a golden answer.
+
+Every implementation of a part (the entry point, its variants like `part2_dp`, and the
+parts of the day's other solution files like `day02_fast.py`) is run on the same inputs,
+the day's input.txt and/or generated ones:
+
+    python -m aoc diff 2025 7                   # input.txt if present, else generated seed 0
+    python -m aoc diff 2025 2 --seeds 0,1,2 --scale 10
+    python -m aoc diff --all --seeds 0
+
+An implementation that raises (or dies) fails the part, one that times out is only left
+out. When every implementation that finished agrees, the answer is recorded as the golden
+value for that (part, input) in .aoc/bench.sqlite. Later runs must reproduce it, so an
+optimisation that changes every variant's answer at once is caught too (re-record with
+--update). The agreeing implementations are then listed side by side with their median
+times.
+
+Each implementation runs in a child process with a timeout, since some of the slower
+originals (`day21.py` part 2) never finish on a full input.
+"""
+
+import multiprocessing
+import os
+import sqlite3
+import time
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from pathlib import Path
+from statistics import median
+from time import perf_counter_ns
+
+from aoc import runner
+
+DEFAULT_TIMEOUT = 60.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS golden (
+    year INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    part INTEGER NOT NULL,
+    input_hash TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    implementations TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (year, day, part, input_hash)
+);
+"""
+
+
+@dataclass(frozen=True)
+class Implementation:
+    day: runner.Day
+    part: int
+    variant: str  # "" for the entry point
+
+    @property
+    def label(self) -> str:
+        name = self.day.path.stem
+        return f"{name}[{self.variant}]" if self.variant else name
+
+
+@dataclass
+class Outcome:
+    implementation: Implementation
+    answer: str | None = None
+    median_ns: int | None = None
+    error: str | None = None  # "timeout" or the exception
+
+
+@dataclass
+class PartCheck:
+    part: int
+    input_label: str
+    outcomes: list[Outcome]
+    golden: str | None  # the stored answer before this run
+    answer: str | None  # the agreed answer, None if they disagree or none finished
+
+    @property
+    def agree(self) -> bool:
+        answers = {o.answer for o in self.outcomes if o.error is None}
+        return len(answers) <= 1
+
+    @property
+    def failed(self) -> list[Outcome]:
+        """Implementations that raised or died, as opposed to timing out."""
+        return [o for o in self.outcomes if o.error is not None and o.error != "timeout"]
+
+    @property
+    def matches_golden(self) -> bool:
+        return self.golden is None or self.answer is None or self.answer == self.golden
+
+    @property
+    def ok(self) -> bool:
+        return self.agree and self.matches_golden and not self.failed
+
+
+def implementations(day: runner.Day) -> list[Implementation]:
+    found = []
+    for d in [day] + runner.alternates(day):
+        try:
+            variants = d.variants()
+        except runner.SolutionError:
+            continue  # not a solution file
+        for part, fns in sorted(variants.items()):
+            for variant in fns:
+                found.append(Implementation(d, part, variant))
+    return found
+
+
+def _child(
+    conn: Connection, day: runner.Day, part: int, variant: str, input_path: str, repeat: int
+) -> None:
+    try:
+        # Solutions print grids, traces and timings of their own: kept out of the report
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            parsed = day.parse(input_path)
+            f = day.variants()[part][variant]
+            samples, answer = [], None
+            for _ in range(max(1, repeat)):
+                start = perf_counter_ns()
+                answer = f(parsed)
+                samples.append(perf_counter_ns() - start)
+        conn.send((str(answer), int(median(samples)), None))
+    except Exception as e:
+        conn.send((None, None, f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+def run_isolated(
+    implementation: Implementation, input_path: Path, repeat: int, timeout: float
+) -> Outcome:
+    ctx = multiprocessing.get_context()
+    receiver, sender = ctx.Pipe(duplex=False)
+    day = implementation.day
+    unloaded = runner.Day(day.year, day.day, day.path, day.label)  # modules don't pickle
+    process = ctx.Process(
+        target=_child,
+        args=(
+            sender,
+            unloaded,
+            implementation.part,
+            implementation.variant,
+            str(input_path),
+            repeat,
+        ),
+        daemon=True,
+    )
+    process.start()
+    sender.close()
+    try:
+        if not receiver.poll(timeout):
+            return Outcome(implementation, error="timeout")
+        answer, median_ns, error = receiver.recv()
+        return Outcome(implementation, answer, median_ns, error)
+    except EOFError:
+        return Outcome(implementation, error=f"exited with code {process.exitcode}")
+    finally:
+        if process.is_alive():
+            process.kill()
+        process.join()
+        receiver.close()
+
+
+def connect(db_path: str | Path) -> sqlite3.Connection:
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def golden_answer(
+    conn: sqlite3.Connection, day: runner.Day, part: int, input_hash: str
+) -> str | None:
+    row = conn.execute(
+        "SELECT answer FROM golden WHERE year = ? AND day = ? AND part = ? AND input_hash = ?",
+        (day.year, day.day, part, input_hash),
+    ).fetchone()
+    return row[0] if row else None
+
+
+def record_golden(
+    conn: sqlite3.Connection, check: PartCheck, day: runner.Day, input_hash: str
+) -> None:
+    agreeing = ",".join(o.implementation.label for o in check.outcomes if o.error is None)
+    conn.execute(
+        "INSERT OR REPLACE INTO golden"
+        " (year, day, part, input_hash, answer, implementations, created_at)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (day.year, day.day, check.part, input_hash, check.answer, agreeing, time.time()),
+    )
+    conn.commit()
+
+
+def check_day(
+    conn: sqlite3.Connection,
+    day: runner.Day,
+    input_path: Path,
+    input_label: str,
+    input_hash: str,
+    repeat: int = 3,
+    timeout: float = DEFAULT_TIMEOUT,
+    update: bool = False,
+) -> list[PartCheck]:
+    by_part: dict[int, list[Outcome]] = {}
+    for implementation in implementations(day):
+        outcome = run_isolated(implementation, input_path, repeat, timeout)
+        by_part.setdefault(implementation.part, []).append(outcome)
+
+    checks = []
+    for part, outcomes in sorted(by_part.items()):
+        finished = {o.answer for o in outcomes if o.error is None}
+        answer = finished.pop() if len(finished) == 1 else None
+        golden = golden_answer(conn, day, part, input_hash)
+        check = PartCheck(part, input_label, outcomes, golden, answer)
+        if answer is not None and (golden is None or (update and answer != golden)):
+            record_golden(conn, check, day, input_hash)
+            if update:
+                check.golden = answer
+        checks.append(check)
+    return checks
+
+
+def format_check(day: runner.Day, check: PartCheck) -> str:
+    if not check.agree:
+        status = "DISAGREE"
+    elif check.answer is None:
+        status = "no implementation finished"
+    elif check.golden is None:
+        status = f"agree, recorded golden {check.answer}"
+    elif check.answer == check.golden:
+        status = f"agree, matches golden {check.golden}"
+    else:
+        status = f"GOLDEN MISMATCH: {check.answer} != golden {check.golden}"
+
+    if check.failed:
+        status = f"{len(check.failed)} FAILED, {status}"
+
+    lines = [f"{day.name} part {check.part} on {check.input_label}: {status}"]
+    timed = [o.median_ns for o in check.outcomes if o.median_ns is not None]
+    fastest = min(timed) if timed else None
+    for o in sorted(check.outcomes, key=lambda o: (o.median_ns is None, o.median_ns or 0)):
+        if o.error is not None:
+            mark = "" if o.error == "timeout" else "  <- failed"
+            lines.append(f"    {o.implementation.label:<28} {o.error}{mark}")
+            continue
+        assert o.median_ns is not None and fastest
+        mark = "" if o.answer == check.answer else "  <- differs"
+        lines.append(
+            f"    {o.implementation.label:<28} {o.median_ns / 1e6:>10.2f}ms"
+            f" {o.median_ns / fastest:>6.1f}x  {o.answer}{mark}"
+        )
+    return "\n".join(lines)
+
@@ -0,0 +1,148 @@
+"""
+A 2D grid of single-byte cells for the map puzzles.
+
+The cells live row by row in one flat bytearray with a one-cell BORDER around the map, so
+a cell is a plain integer index, a step is adding an offset (`grid.up`, `grid.right`, ...)
+and bounds checks become "is this the border", without tuples or `len(matrix[0])` in the
+hot loops:
+
+    grid = Grid.from_file("input.txt")
+    i = grid.find("^")
+    while grid[i] != BORDER:
+        i += grid.up
+
+Cells compare as ints; unpack the bytes you need once (`WALL, BOX = b"#O"`). Walking off
+the map always lands on the border first, so a walk must stop there (two steps past the
+edge wraps to the next row, or past the start of the buffer).
+"""
+
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+BORDER = 0
+
+
+class Grid:
+    __slots__ = (
+        "width",
+        "height",
+        "stride",
+        "cells",
+        "up",
+        "right",
+        "down",
+        "left",
+        "directions",
+        "diagonals",
+        "neighbours",
+    )
+
+    def __init__(self, rows: Iterable[str | bytes], border: int = BORDER) -> None:
+        lines = [row.encode() if isinstance(row, str) else bytes(row) for row in rows]
+        if not lines or any(len(line) != len(lines[0]) for line in lines):
+            raise ValueError("a grid needs at least one row, all of the same width")
+
+        self.width = len(lines[0])
+        self.height = len(lines)
+        self.stride = self.width + 2
+        edge = bytes([border]) * self.stride
+        self.cells = bytearray(edge)
+        side = bytes([border])
+        for line in lines:
+            self.cells += side + line + side
+        self.cells += edge
+
+        # Clockwise, so turning right is the next direction: directions[(d + 1) % 4]
+        self.up, self.right, self.down, self.left = -self.stride, 1, self.stride, -1
+        self.directions = (self.up, self.right, self.down, self.left)
+        self.diagonals = (
+            self.up + self.right,
+            self.down + self.right,
+            self.down + self.left,
+            self.up + self.left,
+        )
+        self.neighbours = self.directions + self.diagonals
+
+    @classmethod
+    def from_text(cls, text: str) -> "Grid":
+        return cls(line for line in text.splitlines() if line)
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "Grid":
+        with open(path, "rb") as f:
+            return cls(line for line in f.read().splitlines() if line)
+
+    def __getitem__(self, i: int) -> int:
+        return self.cells[i]
+
+    def __setitem__(self, i: int, value: int) -> None:
+        self.cells[i] = value
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __str__(self) -> str:
+        return "\n".join(row.decode() for row in self.rows())
+
+    def index(self, x: int, y: int) -> int:
+        return (y + 1) * self.stride + x + 1
+
+    def coords(self, i: int) -> tuple[int, int]:
+        y, x = divmod(i, self.stride)
+        return x - 1, y - 1
+
+    def contains(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def rows(self) -> Iterator[bytes]:
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield bytes(self.cells[start : start + self.width])
+
+    def indices(self) -> Iterator[int]:
+        """Every cell inside the border, row by row."""
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield from range(start, start + self.width)
+
+    def find(self, value: str | int) -> int:
+        byte = ord(value) if isinstance(value, str) else value
+        # The border never matches a printable byte, so a plain search is enough
+        i = self.cells.find(byte)
+        if i < 0:
+            raise ValueError(f"{value!r} is not in the grid")
+        return i
+
+    def find_all(self, value: str | int) -> list[int]:
+        byte = ord(value) if isinstance(value, str) else value
+        found = []
+        i = self.cells.find(byte)
+        while i >= 0:
+            found.append(i)
+            i = self.cells.find(byte, i + 1)
+        return found
+
+    def passable(self, *blocked: str | int) -> bytearray:
+        """1 for every cell that is neither the border nor one of `blocked`, else 0."""
+        table = bytearray(b"\x01") * 256
+        table[BORDER] = 0
+        for value in blocked:
+            table[ord(value) if isinstance(value, str) else value] = 0
+        return self.cells.translate(table)
+
+    def bitmap(self) -> bytearray:
+        """A zeroed flag per cell (border included), e.g. for visited cells."""
+        return bytearray(len(self.cells))
+
+    def copy(self) -> "Grid":
+        grid = Grid.__new__(Grid)
+        for name in self.__slots__:
+            setattr(grid, name, getattr(self, name))
+        grid.cells = bytearray(self.cells)
+        return grid
+
+    def array(self) -> Any:
+        """The cells, border included, as a (height + 2, width + 2) uint8 NumPy view."""
+        import numpy as np
+
+        return np.frombuffer(self.cells, dtype=np.uint8).reshape(self.height + 2, self.stride)
@@ -0,0 +1,84 @@
+"""
+Import-time profiling of the daily solutions, to keep startup close to bare interpreter cost.
+
+Each day is imported in a fresh interpreter under `-X importtime`, after `aoc.runner` (which
+every run pays for anyway), so the report only counts what the day itself pulls in:
+
+    python -m aoc imports --all --budget 20
+
+A day over the budget (in ms) fails the command. Heavy dependencies such as numpy and scipy
+belong inside the functions that use them, so importing a day stays cheap and only the
+parts that need them pay for them.
+"""
+
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+
+from aoc import runner
+
+MARKER = "aoc-importtime-day"
+
+# import time: self [us] | cumulative | imported package
+LINE_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+CHILD = f"""
+import sys
+from time import perf_counter_ns
+from aoc import runner
+
+day = runner.find_day({{year}}, {{day}})
+print({MARKER!r}, file=sys.stderr, flush=True)
+start = perf_counter_ns()
+day.load()
+print({MARKER!r}, perf_counter_ns() - start, file=sys.stderr, flush=True)
+"""
+
+
+@dataclass
+class ImportProfile:
+    day: runner.Day
+    load_ns: int
+    # Modules imported directly by the day (not yet loaded by aoc.runner), cumulative us
+    imports: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def load_ms(self) -> float:
+        return self.load_ns / 1e6
+
+    def heaviest(self, n: int = 3) -> list[tuple[str, int]]:
+        return sorted(self.imports.items(), key=lambda item: -item[1])[:n]
+
+
+def parse_importtime(stderr: str) -> tuple[int, dict[str, int]]:
+    """(day load ns, top-level imports made by the day) from the child's stderr."""
+    load_ns = 0
+    imports: dict[str, int] = {}
+    inside = False
+    for line in stderr.splitlines():
+        if line.startswith(MARKER):
+            if inside:
+                load_ns = int(line.split()[1])
+                break
+            inside = True
+            continue
+        match = LINE_PATTERN.match(line)
+        # Nested imports are indented by two spaces per level under the one importing them
+        if inside and match and len(match.group(3)) == 0:
+            imports[match.group(4)] = int(match.group(2))
+    return load_ns, imports
+
+
+def profile(day: runner.Day, executable: str = sys.executable) -> ImportProfile:
+    child = CHILD.format(year=day.year, day=day.day)
+    proc = subprocess.run(
+        [executable, "-X", "importtime", "-c", child],
+        cwd=runner.ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise runner.SolutionError(f"{day.name}: import failed\n{proc.stderr.strip()}")
+    load_ns, imports = parse_importtime(proc.stderr)
+    return ImportProfile(day, load_ns, imports)
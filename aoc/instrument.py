@@ -0,0 +1,242 @@
+"""
+Timing and memory instrumentation shared by every solution.
+
+Disabled by default, in which case `timeit` hands back the undecorated function so it
+can stay on hot part1/part2 functions for free. Enable it with `enable()` or by setting
+`AOC_INSTRUMENT` *before* the solutions are imported:
+
+    AOC_INSTRUMENT=1            JSON lines on stderr
+    AOC_INSTRUMENT=out.jsonl    JSON lines appended to a file
+    AOC_INSTRUMENT_REPEAT=5     timed samples per call (default 1)
+
+Every measured call emits one JSON record with min/median/p95 of its samples, the
+tracemalloc peak of one extra traced run, the GC collections/pause during sampling, and
+the hits/misses/evictions of the aoc.memo caches it used.
+"""
+
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from math import ceil
+from statistics import median
+from time import perf_counter_ns
+from typing import Any, Callable, Iterator, TextIO, TypeVar
+
+from aoc import memo
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class Config:
+    enabled: bool = False
+    repeat: int = 1
+    warmup: int = 0
+    memory: bool = True
+    output: TextIO = sys.stderr
+
+
+config = Config()
+
+
+@dataclass
+class Record:
+    name: str
+    samples_ns: list[int] = field(default_factory=list)
+    peak_bytes: int | None = None
+    gc_collections: int = 0
+    gc_pause_ns: int = 0
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    def percentile(self, p: float) -> int:
+        # nearest-rank percentile
+        ordered = sorted(self.samples_ns)
+        return ordered[max(0, ceil(p / 100 * len(ordered)) - 1)]
+
+    def summary(self) -> dict[str, Any]:
+        out: dict[str, Any] = {"name": self.name, "n": len(self.samples_ns)}
+        if self.samples_ns:
+            out["min_ns"] = min(self.samples_ns)
+            out["median_ns"] = int(median(self.samples_ns))
+            out["p95_ns"] = self.percentile(95)
+        out["peak_bytes"] = self.peak_bytes
+        out["gc_collections"] = self.gc_collections
+        out["gc_pause_ns"] = self.gc_pause_ns
+        out.update(self.extra)
+        return out
+
+
+class GCWatcher:
+    """Counts collections and sums their pauses through `gc.callbacks`."""
+
+    def __init__(self) -> None:
+        self.collections = 0
+        self.pause_ns = 0
+        self._started = 0
+
+    def __call__(self, phase: str, info: dict[str, int]) -> None:
+        if phase == "start":
+            self._started = perf_counter_ns()
+        else:
+            self.collections += 1
+            self.pause_ns += perf_counter_ns() - self._started
+
+    def __enter__(self) -> "GCWatcher":
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        gc.callbacks.remove(self)
+
+
+def traced_peak(f: Callable[..., Any], *args: Any, **kwargs: Any) -> int:
+    # tracemalloc slows allocation down considerably, so it never overlaps a timed sample.
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    try:
+        f(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+    return peak - base
+
+
+def sample(
+    f: Callable[..., Any],
+    *args: Any,
+    name: str | None = None,
+    repeat: int | None = None,
+    warmup: int | None = None,
+    memory: bool | None = None,
+    **kwargs: Any,
+) -> tuple[Any, Record]:
+    """Calls `f` repeatedly and returns (last result, Record). Does not emit."""
+    repeat = config.repeat if repeat is None else repeat
+    warmup = config.warmup if warmup is None else warmup
+    memory = config.memory if memory is None else memory
+    record = Record(name or getattr(f, "__qualname__", repr(f)))
+
+    for _ in range(warmup):
+        f(*args, **kwargs)
+
+    result = None
+    memo_before = memo.snapshot()
+    with GCWatcher() as watcher:
+        for _ in range(max(1, repeat)):
+            start = perf_counter_ns()
+            result = f(*args, **kwargs)
+            record.samples_ns.append(perf_counter_ns() - start)
+    record.gc_collections = watcher.collections
+    record.gc_pause_ns = watcher.pause_ns
+    memo_used = memo.delta(memo_before)
+    if memo_used:
+        record.extra["memo"] = memo_used
+
+    if memory:
+        record.peak_bytes = traced_peak(f, *args, **kwargs)
+    return result, record
+
+
+def emit(record: Record) -> None:
+    config.output.write(json.dumps(record.summary()) + "\n")
+    config.output.flush()
+
+
+def timeit(f: F) -> F:
+    """Emits a Record for every call while instrumentation is enabled, else a no-op."""
+    if not config.enabled:
+        return f
+
+    @wraps(f)
+    def wrap(*args: Any, **kwargs: Any) -> Any:
+        res, record = sample(f, *args, name=f.__qualname__, **kwargs)
+        emit(record)
+        return res
+
+    wrap._instrumented = True  # type: ignore[attr-defined]
+    return wrap  # type: ignore[return-value]
+
+
+def unwrap(f: Callable[..., Any]) -> Callable[..., Any]:
+    """Strips `timeit` wrappers (only), so callers can measure the function themselves."""
+    while getattr(f, "_instrumented", False):
+        f = f.__wrapped__  # type: ignore[attr-defined]
+    return f
+
+
+@contextmanager
+def measure(name: str, memory: bool | None = None) -> Iterator[Record]:
+    """Times the body once. Memory is traced *during* the body, so it inflates the time."""
+    record = Record(name)
+    if not config.enabled:
+        yield record
+        return
+
+    memory = config.memory if memory is None else memory
+    # Leave tracing on for whoever had it on already (an outer measure, --memory)
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    if memory:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+    with GCWatcher() as watcher:
+        start = perf_counter_ns()
+        try:
+            yield record
+        finally:
+            record.samples_ns.append(perf_counter_ns() - start)
+            if memory:
+                record.peak_bytes = tracemalloc.get_traced_memory()[1] - base
+            if started_tracing:
+                tracemalloc.stop()
+    record.gc_collections = watcher.collections
+    record.gc_pause_ns = watcher.pause_ns
+    emit(record)
+
+
+def enable(
+    output: str | TextIO | None = None,
+    repeat: int = 1,
+    warmup: int = 0,
+    memory: bool = True,
+) -> None:
+    """Turns instrumentation on. Only affects `timeit` on functions decorated afterwards."""
+    config.enabled = True
+    config.repeat = repeat
+    config.warmup = warmup
+    config.memory = memory
+    if output is None or output in ("1", "-"):
+        config.output = sys.stderr
+    elif isinstance(output, str):
+        config.output = open(output, "a")
+    else:
+        config.output = output
+
+
+def disable() -> None:
+    config.enabled = False
+
+
+def _configure_from_env() -> None:
+    target = os.environ.get("AOC_INSTRUMENT")
+    if not target or target == "0":
+        return
+    enable(
+        target,
+        repeat=int(os.environ.get("AOC_INSTRUMENT_REPEAT", "1")),
+        warmup=int(os.environ.get("AOC_INSTRUMENT_WARMUP", "0")),
+        memory=os.environ.get("AOC_INSTRUMENT_MEMORY", "1") != "0",
+    )
+
+
+_configure_from_env()
@@ -0,0 +1,146 @@
+"""
+Every integer in an input, in one pass over its bytes, for the days whose input is just
+numbers with some punctuation around them:
+
+    values = read_ints(file_path)               # array('q'), no numpy import
+    robots = records(values, 4)                 # "p=0,4 v=3,-3" -> [(0, 4, 3, -3), ...]
+    coords = read_ints(file_path, numpy=True)   # np.int64, 10^7 ints in 0.5s-0.9s
+    coords = records(coords, 3)                 # "x,y,z" -> shape (n, 3)
+    chunks = read_ints_chunked(file_path)       # array('q')s, 1 MB of input each
+    values, offsets = read_int_rows(file_path)  # row i is values[offsets[i]:offsets[i + 1]]
+
+A run of digits is one integer and anything else separates them. A `-` right before the
+digits makes the integer negative, unless it comes straight after another digit, so
+ranges like `10-14` read as 10, 14 while `v=3,-3` reads as 3, -3. Values must fit in 64
+bits.
+
+The stdlib path costs about as much as `list(map(int, f.read().split()))` and needs no
+numpy import, which takes longer than parsing a puzzle-sized input. Use the numpy path
+for generated inputs and for days whose parts are vectorised anyway.
+"""
+
+import mmap
+import re
+from array import array
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator
+
+if TYPE_CHECKING:
+    import numpy as np
+
+INT = rb"(?<![0-9])-?[0-9]+"  # compiled on first use, it costs more than a small parse
+MINUS, ZERO = b"-0"
+# Everything but digits and minus signs to spaces, for bytes.split()
+NUMBERS_ONLY = bytes(
+    c if ZERO <= c <= ZERO + 9 or c == MINUS else ord(" ") for c in range(256)
+)
+
+
+@contextmanager
+def read_bytes(file_path: str | Path, use_mmap: bool = False) -> Iterator[Any]:
+    """The file's bytes, or a read-only mmap of them (valid inside the with only)."""
+    with open(file_path, "rb") as f:
+        if not use_mmap:
+            yield f.read()
+            return
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files can't be mapped
+            yield b""
+            return
+        with mapped:
+            yield mapped
+
+
+def ints(data: bytes) -> array:
+    """Every integer in data (bytes or an mmap), in order."""
+    # array("q", <list>) converts in one C loop, from an iterator it appends one by one
+    if isinstance(data, bytes):
+        try:
+            return array("q", list(map(int, data.translate(NUMBERS_ONLY).split())))
+        except ValueError:
+            pass  # a "-" int() can't take, like in "10-14"
+    return array("q", list(map(int, re.findall(INT, data))))
+
+
+def ints_numpy(data: Any) -> "np.ndarray":
+    """Every integer in data (bytes or any buffer), in order, as np.int64."""
+    import numpy as np
+
+    numbers = bytes(data).translate(NUMBERS_ONLY)
+    # numpy's own text parser does the conversion (in C, number by number, faster than any
+    # digit-at-a-time array arithmetic), once the only "-"s left are signs. It reads
+    # "1 - 2" as 1, -2 and nothing but whitespace as [0], though.
+    text = np.frombuffer(numbers, dtype=np.uint8)
+    minus = np.flatnonzero(text == MINUS)
+    if len(minus):
+        before = text[np.maximum(minus - 1, 0)] - np.uint8(ZERO) < 10
+        before[minus == 0] = False
+        after = text[np.minimum(minus + 1, len(text) - 1)] - np.uint8(ZERO) < 10
+        after[minus == len(text) - 1] = False
+        not_signs = minus[before | ~after]
+        if len(not_signs):
+            text = text.copy()
+            text[not_signs] = ord(" ")
+            numbers = text.tobytes()
+    if not numbers or numbers.isspace():
+        return np.zeros(0, dtype=np.int64)
+    return np.fromstring(numbers, dtype=np.int64, sep=" ")
+
+
+def read_ints(file_path: str | Path, numpy: bool = False, use_mmap: bool = False) -> Any:
+    with read_bytes(file_path, use_mmap) as data:
+        return ints_numpy(data) if numpy else ints(data)
+
+
+def read_int_rows(file_path: str | Path) -> "tuple[np.ndarray, np.ndarray]":
+    """
+    Every line's integers as a ragged array: all of them flat in one np.int64 array, and
+    offsets such that values[offsets[i]:offsets[i + 1]] are row i's. Blank lines (and
+    lines without a number) are skipped.
+    """
+    import numpy as np
+
+    with read_bytes(file_path) as data:
+        values = ints_numpy(data)
+        text = np.frombuffer(data, dtype=np.uint8)
+        digit = text - np.uint8(ZERO) < 10
+        starts = np.flatnonzero(digit[1:] & ~digit[:-1]) + 1
+        if len(digit) and digit[0]:
+            starts = np.concatenate(([0], starts))
+        line_ends = np.flatnonzero(text == ord("\n"))
+        if len(text) and text[-1] != ord("\n"):
+            line_ends = np.append(line_ends, len(text))
+    # How many integers start before each line's end, without repeats for empty lines
+    offsets = np.concatenate(([0], np.searchsorted(starts, line_ends)))
+    return values, offsets[np.concatenate(([True], offsets[1:] != offsets[:-1]))]
+
+
+def read_ints_chunked(file_path: str | Path, block_bytes: int = 1 << 20) -> Iterator[array]:
+    """
+    read_ints a block of lines at a time, as array('q') chunks, for files too big to hold.
+    Blocks end after a newline, so no number (or line of numbers) is split between two.
+    """
+    with open(file_path, "rb") as f:
+        rest = b""
+        while block := f.read(block_bytes):
+            block = rest + block
+            cut = block.rfind(b"\n") + 1
+            rest = block[cut:]
+            if cut:
+                yield ints(block[:cut])
+        if rest:
+            yield ints(rest)
+
+
+def records(values: Any, arity: int) -> Any:
+    """
+    Groups values into consecutive records of `arity` integers: a list of tuples for an
+    array('q') or a list, an (n, arity) view for a numpy array.
+    """
+    if len(values) % arity:
+        raise ValueError(f"{len(values)} integers don't split into records of {arity}")
+    if isinstance(values, (array, list)):
+        return list(zip(*[iter(values)] * arity))
+    return values.reshape(-1, arity)
@@ -0,0 +1,214 @@
+"""
+Memoisation with a choice of eviction, statistics, and an optional on-disk tier, in place
+of `functools.cache` and hand-rolled dicts:
+
+    @memo()                          # unbounded, like functools.cache
+    @memo(maxsize=4096)              # least recently used entries go first
+    @memo(max_bytes=64 << 20)        # LRU bounded by the (shallow) size of keys and values
+    @memo(disk=True)                 # entries also persist in .aoc/memo across runs
+
+Arguments must be hashable and positional. `AOC_MEMO_MAX_BYTES` bounds every memo declared
+without a bound, so unbounded caches can be capped for big generated inputs instead of
+running the process out of memory.
+
+Hits, misses and evictions add up per memo name (the function's qualified name, without
+`<locals>`), shared by every instance of a nested memoised function. Instrumented calls
+report the ones that moved in their record's `memo` field, and `run --counters` prints
+them as `<name>.hits` etc. under the part. `clear_all()` empties every memo in memory, so
+a resident process (the daemon) times each part from cold rather than off earlier runs.
+
+The disk tier is a SQLite table per function under .aoc/memo, keyed by the pickled
+arguments and invalidated whenever the function's source file changes. It only suits
+pure functions of their arguments, so closures are refused: a nested `dfs` reading the
+enclosing grid would hand one input's answers to another.
+"""
+
+import os
+import sys
+import weakref
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from functools import update_wrapper
+from typing import Any, Callable, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+DEFAULT_MAX_BYTES = int(os.environ.get("AOC_MEMO_MAX_BYTES", "0")) or None
+DISK_COMMIT_EVERY = 1000  # writes per transaction of the disk tier
+
+
+@dataclass
+class Stats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    disk_hits: int = 0
+    peak_entries: int = 0
+
+
+stats: dict[str, Stats] = {}
+live: "weakref.WeakSet[Any]" = weakref.WeakSet()  # every memo wrapper not yet collected
+
+
+def memo_name(f: Callable[..., Any]) -> str:
+    return f.__qualname__.replace("<locals>.", "")
+
+
+def entry_bytes(key: tuple[Any, ...], value: Any) -> int:
+    return sys.getsizeof(key) + sum(map(sys.getsizeof, key)) + sys.getsizeof(value)
+
+
+class DiskTier:
+    """Pickled results of one function in SQLite, valid for one version of its source."""
+
+    def __init__(self, f: Callable[..., Any], name: str) -> None:
+        import atexit
+        import hashlib
+        import pickle
+        import sqlite3
+        from pathlib import Path
+
+        from aoc import runner
+
+        self._pickle = pickle
+        source = Path(f.__code__.co_filename).read_bytes()
+        self.version = hashlib.sha256(source).hexdigest()[:24]
+        path = runner.ROOT / ".aoc" / "memo" / f"{f.__module__}.{name}.sqlite"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS memo"
+            " (version TEXT NOT NULL, key BLOB NOT NULL, value BLOB NOT NULL,"
+            " PRIMARY KEY (version, key))"
+        )
+        self.conn.execute("DELETE FROM memo WHERE version != ?", (self.version,))
+        self.conn.commit()
+        self.pending = 0
+        atexit.register(self.conn.commit)
+
+    def get(self, key: tuple[Any, ...]) -> tuple[bool, Any]:
+        row = self.conn.execute(
+            "SELECT value FROM memo WHERE version = ? AND key = ?",
+            (self.version, self._pickle.dumps(key)),
+        ).fetchone()
+        return (True, self._pickle.loads(row[0])) if row else (False, None)
+
+    def put(self, key: tuple[Any, ...], value: Any) -> None:
+        self.conn.execute(
+            "INSERT OR REPLACE INTO memo VALUES (?, ?, ?)",
+            (self.version, self._pickle.dumps(key), self._pickle.dumps(value)),
+        )
+        self.pending += 1
+        if self.pending >= DISK_COMMIT_EVERY:
+            self.conn.commit()
+            self.pending = 0
+
+
+def memo(
+    maxsize: int | None = None,
+    max_bytes: int | None = None,
+    disk: bool = False,
+    name: str | None = None,
+) -> Callable[[F], F]:
+    if maxsize is not None and max_bytes is not None:
+        raise ValueError("memo takes maxsize or max_bytes, not both")
+    if maxsize is None and max_bytes is None:
+        max_bytes = DEFAULT_MAX_BYTES
+
+    def decorate(f: F) -> F:
+        if disk and f.__closure__:
+            raise ValueError(f"{f.__qualname__}: closures can't be memoised on disk")
+        counts = stats.setdefault(name or memo_name(f), Stats())
+        tier = DiskTier(f, name or memo_name(f)) if disk else None
+
+        if maxsize is None and max_bytes is None and tier is None:
+            # The common case, kept as lean as a Python wrapper gets
+            table: dict[tuple[Any, ...], Any] = {}
+
+            def unbounded(*args: Any) -> Any:
+                try:
+                    value = table[args]
+                except KeyError:
+                    counts.misses += 1
+                    value = table[args] = f(*args)
+                    if len(table) > counts.peak_entries:
+                        counts.peak_entries = len(table)
+                    return value
+                counts.hits += 1
+                return value
+
+            wrapper: Any = unbounded
+            wrapper.cache_clear = table.clear
+        else:
+            lru: OrderedDict[tuple[Any, ...], Any] = OrderedDict()
+            sizes: dict[tuple[Any, ...], int] = {}
+            held = 0  # bytes, when bounded by bytes
+
+            def bounded(*args: Any) -> Any:
+                nonlocal held
+                if args in lru:
+                    counts.hits += 1
+                    lru.move_to_end(args)
+                    return lru[args]
+                found, value = tier.get(args) if tier else (False, None)
+                if found:
+                    counts.disk_hits += 1
+                else:
+                    counts.misses += 1
+                    value = f(*args)
+                    if tier:
+                        tier.put(args, value)
+                lru[args] = value
+                if max_bytes is not None:
+                    sizes[args] = entry_bytes(args, value)
+                    held += sizes[args]
+                while lru and (
+                    (maxsize is not None and len(lru) > maxsize)
+                    or (max_bytes is not None and held > max_bytes)
+                ):
+                    evicted, _ = lru.popitem(last=False)
+                    held -= sizes.pop(evicted, 0)
+                    counts.evictions += 1
+                if len(lru) > counts.peak_entries:
+                    counts.peak_entries = len(lru)
+                return value
+
+            def clear() -> None:
+                nonlocal held
+                lru.clear()
+                sizes.clear()
+                held = 0
+
+            wrapper = bounded
+            wrapper.cache_clear = clear
+
+        live.add(wrapper)
+        return update_wrapper(wrapper, f)  # type: ignore[return-value]
+
+    return decorate
+
+
+def clear_all() -> None:
+    """Drops the in-memory entries of every memo. Disk tiers are kept."""
+    for wrapper in list(live):
+        wrapper.cache_clear()
+
+
+def snapshot() -> dict[str, dict[str, int]]:
+    return {name: asdict(s) for name, s in stats.items()}
+
+
+def delta(before: dict[str, dict[str, int]]) -> dict[str, dict[str, int]]:
+    """What changed since `before` (a snapshot), per memo that was used in between."""
+    changed = {}
+    for name, now in snapshot().items():
+        then = before.get(name, {})
+        diff = {k: v - then.get(k, 0) for k, v in now.items() if k != "peak_entries"}
+        if any(diff.values()):
+            diff["peak_entries"] = now["peak_entries"]
+            changed[name] = diff
+    return changed
+
+
+def flatten(changed: dict[str, dict[str, int]]) -> dict[str, int]:
+    return {f"{name}.{k}": v for name, d in changed.items() for k, v in d.items() if v}
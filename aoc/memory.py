@@ -0,0 +1,184 @@
+"""
+Memory high-water marks of the parts of a day, and where the memory at the peak came from.
+
+    python -m aoc run 2024 9 --memory              # peak RSS, traced peak, top sites
+    python -m aoc bench --all --memory-budget 256  # fail parts peaking above 256 MB
+
+For every part this reports:
+
+    peak RSS      the process high-water mark (VmHWM), reset before the part where Linux
+                  allows it (/proc/self/clear_refs), otherwise the lifetime maximum
+    traced peak   the tracemalloc peak, i.e. Python allocations only, during the part
+    top sites     the lines holding the most memory in a tracemalloc snapshot taken
+                  near the traced peak
+
+tracemalloc cannot snapshot at the exact peak, so a background thread polls the traced
+size and takes a new snapshot whenever it has grown by GROWTH since the last one. The
+sites are therefore those of a moment within GROWTH of the peak. Allocations that have
+already been freed by then don't show up, however large they were.
+"""
+
+import linecache
+import sys
+import threading
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any, Callable, Iterator
+
+from aoc import parallel, runner
+
+POLL_INTERVAL = 0.005
+GROWTH = 0.25  # snapshot again once the traced size grows by this fraction
+MIN_SNAPSHOT_BYTES = 1 << 20
+DEFAULT_TOP = 10
+FRAMES = 1  # traceback depth per allocation, only the allocating line is reported
+
+IGNORED = (tracemalloc.__file__, threading.__file__, __file__)
+
+
+def reset_peak_rss() -> bool:
+    """Resets the kernel's VmHWM for this process (Linux 4.0+). False if unsupported."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss() -> int | None:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # kilobytes on Linux, bytes on macOS
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+@dataclass
+class Site:
+    filename: str
+    lineno: int
+    size: int
+    count: int
+
+    @property
+    def source(self) -> str:
+        return linecache.getline(self.filename, self.lineno).strip()
+
+
+class PeakTracker:
+    """Traces Python allocations and keeps a snapshot taken close to the traced peak."""
+
+    def __init__(self, poll_interval: float = POLL_INTERVAL, growth: float = GROWTH) -> None:
+        self.poll_interval = poll_interval
+        self.growth = growth
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self.snapshot_bytes = 0
+        self.peak_bytes = 0
+        self._base = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._switch_interval = sys.getswitchinterval()
+
+    def _take_snapshot(self, current: int) -> None:
+        self.snapshot = tracemalloc.take_snapshot()
+        self.snapshot_bytes = current
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            current = tracemalloc.get_traced_memory()[0] - self._base
+            threshold = max(MIN_SNAPSHOT_BYTES, self.snapshot_bytes * (1 + self.growth))
+            if current >= threshold:
+                self._take_snapshot(current)
+
+    def __enter__(self) -> "PeakTracker":
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start(FRAMES)
+        tracemalloc.reset_peak()
+        self._base = tracemalloc.get_traced_memory()[0]
+        # Let the poller in more often than the default 5ms GIL switch interval
+        sys.setswitchinterval(min(self._switch_interval, self.poll_interval / 2))
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._stop.set()
+        self._thread.join()
+        sys.setswitchinterval(self._switch_interval)
+        current, peak = tracemalloc.get_traced_memory()
+        self.peak_bytes = peak - self._base
+        # Whatever is still alive may be closer to the peak than the last poll
+        if self.snapshot is None or current - self._base > self.snapshot_bytes:
+            self._take_snapshot(current - self._base)
+        if self._started_tracing:
+            tracemalloc.stop()
+
+    def top_sites(self, limit: int = DEFAULT_TOP) -> list[Site]:
+        if self.snapshot is None:
+            return []
+        snapshot = self.snapshot.filter_traces(
+            [tracemalloc.Filter(False, path) for path in IGNORED]
+            + [tracemalloc.Filter(False, "<frozen importlib._bootstrap*>")]
+        )
+        sites = []
+        for stat in snapshot.statistics("lineno")[:limit]:
+            frame = stat.traceback[0]
+            sites.append(Site(frame.filename, frame.lineno, stat.size, stat.count))
+        return sites
+
+
+def format_mb(n: int | None) -> str:
+    return "-" if n is None else f"{n / (1 << 20):.1f} MB"
+
+
+@dataclass
+class PartMemory:
+    result: runner.PartResult
+    peak_bytes: int
+    peak_rss: int | None
+    rss_reset: bool
+    sites: list[Site] = field(default_factory=list)
+
+    def report(self) -> str:
+        rss = format_mb(self.peak_rss) + ("" if self.rss_reset else " (process lifetime)")
+        lines = [f"peak RSS {rss}, traced peak {format_mb(self.peak_bytes)}"]
+        if self.sites:
+            lines.append(f"{'size':>10} {'blocks':>9}  site")
+            for site in self.sites:
+                where = f"{Path(site.filename).name}:{site.lineno}"
+                lines.append(f"{format_mb(site.size):>10} {site.count:>9}  {where}  {site.source}")
+        return "\n".join(lines)
+
+
+def profile_part(
+    day: runner.Day, part: int, f: Callable[[Any], Any], parsed: Any, top: int = DEFAULT_TOP
+) -> PartMemory:
+    rss_reset = reset_peak_rss()
+    start = perf_counter_ns()
+    # tracemalloc only sees this process, so no worker processes
+    with parallel.serial(), PeakTracker() as tracker:
+        answer = f(parsed)
+    elapsed = perf_counter_ns() - start
+    result = runner.PartResult(day.year, day.day, part, answer, elapsed)
+    return PartMemory(result, tracker.peak_bytes, peak_rss(), rss_reset, tracker.top_sites(top))
+
+
+def profile_parts(
+    day: runner.Day, parsed: Any, parts: tuple[int, ...] = (1, 2), top: int = DEFAULT_TOP
+) -> Iterator[PartMemory]:
+    entry_points = day.parts()
+    for part in parts:
+        if part in entry_points:
+            yield profile_part(day, part, entry_points[part], parsed, top)
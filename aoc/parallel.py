@@ -0,0 +1,173 @@
+"""
+A shared executor for the embarrassingly parallel brute forces.
+
+`map_reduce` runs a worker over a list of tasks and folds the results together:
+
+    chunks = split_ranges(ranges, parallel.chunk_count())
+    total = parallel.map_reduce(worker, [(chunk,) for chunk in chunks], operator.add, 0)
+
+The pool type follows the interpreter: threads on a free-threaded build (where they run
+in parallel and share the input for free), processes wherever the GIL would serialise
+them. `AOC_PARALLEL=threads|processes|serial` overrides the choice and `AOC_WORKERS`
+the worker count. Profilers wrap the part in `serial()`, as they only see the thread that
+runs it.
+
+Work is split into several chunks of roughly equal cost per worker rather than one task
+per input item, and the pool hands the next chunk to whichever worker is idle, so one
+big item no longer leaves the other workers waiting. Results are folded in task order,
+so `reduce` only has to be associative, not commutative.
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+from itertools import accumulate
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Literal, Sequence, TypeVar
+
+from aoc import runner
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+Kind = Literal["threads", "processes", "serial"]
+KINDS: tuple[Kind, ...] = ("threads", "processes", "serial")
+
+CHUNKS_PER_WORKER = 4
+
+
+def free_threaded() -> bool:
+    """True on a free-threaded build with the GIL actually disabled at runtime."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def worker_count() -> int:
+    if "AOC_WORKERS" in os.environ:
+        return max(1, int(os.environ["AOC_WORKERS"]))
+    # process_cpu_count respects the affinity mask (3.13+)
+    count = getattr(os, "process_cpu_count", os.cpu_count)()
+    return count or 1
+
+
+def chunk_count(workers: int | None = None) -> int:
+    return (workers or worker_count()) * CHUNKS_PER_WORKER
+
+
+def default_kind() -> Kind:
+    kind = os.environ.get("AOC_PARALLEL")
+    if kind:
+        if kind not in KINDS:
+            raise ValueError(f"AOC_PARALLEL must be one of {KINDS}, not {kind!r}")
+        return kind  # type: ignore[return-value]
+    return "threads" if free_threaded() else "processes"
+
+
+@contextmanager
+def serial() -> Iterator[None]:
+    """Runs every map_reduce inside the block in the calling thread."""
+    previous = os.environ.get("AOC_PARALLEL")
+    os.environ["AOC_PARALLEL"] = "serial"
+    try:
+        yield
+    finally:
+        if previous is None:
+            del os.environ["AOC_PARALLEL"]
+        else:
+            os.environ["AOC_PARALLEL"] = previous
+
+
+def _import_days(modules: dict[str, str]) -> None:
+    # Days are imported from their file as `aoc_YYYY_dayDD`, which a spawned or
+    # forkserver process cannot import by name when it unpickles a worker function.
+    for name, path in modules.items():
+        if name not in sys.modules:
+            runner.load_module(Path(path), name)
+
+
+def executor(kind: Kind, workers: int, fn: Callable[..., Any]) -> "Executor":
+    # concurrent.futures costs ~20ms to import, which serial runs don't need to pay
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    if kind == "threads":
+        return ThreadPoolExecutor(max_workers=workers)
+
+    module = sys.modules.get(fn.__module__)
+    path = getattr(module, "__file__", None)
+    modules = {fn.__module__: path} if path and fn.__module__.startswith("aoc_") else {}
+    return ProcessPoolExecutor(max_workers=workers, initializer=_import_days, initargs=(modules,))
+
+
+def map_reduce(
+    fn: Callable[..., R],
+    tasks: Sequence[tuple[Any, ...]],
+    reduce: Callable[[R, R], R],
+    initial: R,
+    kind: Kind | None = None,
+    workers: int | None = None,
+) -> R:
+    """reduce(...reduce(reduce(initial, fn(*tasks[0])), fn(*tasks[1]))..., fn(*tasks[-1]))"""
+    kind = kind or default_kind()
+    workers = min(workers or worker_count(), len(tasks))
+    result = initial
+
+    if kind == "serial" or workers <= 1:
+        for task in tasks:
+            result = reduce(result, fn(*task))
+        return result
+
+    with executor(kind, workers, fn) as pool:
+        futures = [pool.submit(fn, *task) for task in tasks]
+        for future in futures:
+            result = reduce(result, future.result())
+    return result
+
+
+def split_costs(costs: Sequence[int], chunks: int) -> list[range]:
+    """Contiguous index ranges over `costs` with roughly equal total cost each."""
+    if not costs:
+        return []
+    prefix = list(accumulate(costs))
+    total = prefix[-1]
+    bounds, start = [], 0
+    for k in range(1, chunks):
+        target = total * k / chunks
+        # first index whose cumulative cost reaches the target
+        stop = start
+        while stop < len(costs) and prefix[stop] < target:
+            stop += 1
+        if stop > start:
+            bounds.append(range(start, stop))
+            start = stop
+    bounds.append(range(start, len(costs)))
+    return [b for b in bounds if b]
+
+
+def split_ranges(ranges: Sequence[tuple[int, int]], chunks: int) -> list[list[tuple[int, int]]]:
+    """
+    Redistributes inclusive integer ranges into `chunks` lists of ranges covering about
+    the same number of integers each, splitting ranges across chunk boundaries.
+    """
+    total = sum(right - left + 1 for left, right in ranges)
+    size = max(1, -(-total // chunks))
+    out: list[list[tuple[int, int]]] = [[]]
+    room = size
+    for left, right in ranges:
+        while left <= right:
+            if room == 0:
+                out.append([])
+                room = size
+            take = min(room, right - left + 1)
+            out[-1].append((left, left + take - 1))
+            left += take
+            room -= take
+    return [chunk for chunk in out if chunk]
+
+
+def split_evenly(items: Sequence[T], chunks: int) -> list[Sequence[T]]:
+    """Contiguous slices of `items` for work items of about the same cost."""
+    size = max(1, -(-len(items) // chunks))
+    return [items[i : i + size] for i in range(0, len(items), size)]
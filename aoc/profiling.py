@@ -0,0 +1,296 @@
+"""
+Profiles the parts of a day, for when a print timing says a part is slow but not why.
+
+    python -m aoc run 2024 6 --part 2 --profile             # sampling profiler
+    python -m aoc run 2024 6 --part 2 --profile cprofile    # deterministic, exact call counts
+    python -m aoc run 2024 6 --part 2 --lines has_loop      # per-line hits and time
+
+Every profiled part prints a top-N table of hot functions and writes its files under
+.aoc/profile:
+
+    2024-06-part2.collapsed   sampled stacks, one `outer;inner count` line per stack, for
+                              flamegraph.pl, speedscope or inferno
+    2024-06-part2.pstats      cProfile stats, for pstats or snakeviz
+    2024-06-part2.lines.txt   the line report
+
+The sampler reads the running thread's stack every `interval` seconds from a background
+thread. It barely slows the part down. cProfile and the line profiler see every call, and
+the line profiler slows the traced functions down several times over. Compare their
+relative numbers, not their absolute ones. None of them can see other threads or
+processes, so profiled parts run their aoc.parallel work serially.
+"""
+
+import cProfile
+import linecache
+import pstats
+import sys
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter_ns
+from types import CodeType, FrameType
+from typing import Any, Callable, Iterator, Literal
+
+from aoc import parallel, runner
+
+PROFILE_DIR = runner.ROOT / ".aoc" / "profile"
+DEFAULT_INTERVAL = 0.001
+DEFAULT_TOP = 15
+
+Mode = Literal["sample", "cprofile"]
+
+
+def frame_label(code: CodeType) -> str:
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+@dataclass
+class HotFunction:
+    name: str
+    calls: int | None  # unknown when sampled
+    self_fraction: float
+    total_fraction: float
+
+
+class Sampler:
+    """Collapsed stacks of one thread, sampled from a background thread."""
+
+    def __init__(self, root: CodeType, interval: float = DEFAULT_INTERVAL) -> None:
+        self.root = root  # stacks are cut just above this code object
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._target = threading.get_ident()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._switch_interval = sys.getswitchinterval()
+
+    def _stack(self, frame: FrameType | None) -> list[str] | None:
+        stack = []
+        while frame is not None:
+            stack.append(frame_label(frame.f_code))
+            if frame.f_code is self.root:
+                stack.reverse()
+                return stack
+            frame = frame.f_back
+        return None  # not inside the profiled part (yet)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            stack = self._stack(sys._current_frames().get(self._target))
+            if stack:
+                self.stacks[";".join(stack)] += 1
+
+    def __enter__(self) -> "Sampler":
+        # The GIL is only handed over every switch interval (5ms by default), which would
+        # cap the sampling rate
+        sys.setswitchinterval(min(self._switch_interval, self.interval / 2))
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._stop.set()
+        self._thread.join()
+        sys.setswitchinterval(self._switch_interval)
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def hot_functions(self, top: int = DEFAULT_TOP) -> list[HotFunction]:
+        total = sum(self.stacks.values())
+        if not total:
+            return []
+        self_counts: Counter[str] = Counter()
+        total_counts: Counter[str] = Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(";")
+            self_counts[frames[-1]] += count
+            for name in set(frames):  # recursion counts once per sample
+                total_counts[name] += count
+        return [
+            HotFunction(name, None, count / total, total_counts[name] / total)
+            for name, count in self_counts.most_common(top)
+        ]
+
+
+def cprofile_hot_functions(profile: cProfile.Profile, top: int = DEFAULT_TOP) -> list[HotFunction]:
+    stats = pstats.Stats(profile).stats  # type: ignore[attr-defined]
+    total = sum(tottime for _, _, tottime, _, _ in stats.values()) or 1.0
+    rows = sorted(stats.items(), key=lambda item: -item[1][2])[:top]
+    hot = []
+    for (filename, line, name), (_, ncalls, tottime, cumtime, _) in rows:
+        label = name if filename == "~" else f"{name} ({Path(filename).name}:{line})"
+        hot.append(HotFunction(label, ncalls, tottime / total, cumtime / total))
+    return hot
+
+
+def format_hot_functions(hot: list[HotFunction]) -> str:
+    lines = [f"{'self':>7} {'total':>7} {'calls':>10}  function"]
+    for h in hot:
+        calls = "" if h.calls is None else str(h.calls)
+        lines.append(
+            f"{h.self_fraction:>7.1%} {h.total_fraction:>7.1%} {calls:>10}  {h.name}"
+        )
+    return "\n".join(lines)
+
+
+@dataclass
+class LineStats:
+    code: CodeType
+    hits: Counter[int] = field(default_factory=Counter)
+    time_ns: Counter[int] = field(default_factory=Counter)
+
+
+class LineProfiler:
+    """
+    Per-line hits and time for the functions of one file named in `functions`, through
+    sys.settrace. A line's time runs until the next line event of the same frame, so it
+    includes the calls the line makes, except calls into other traced functions (the
+    callee's own lines get that time, so recursion isn't counted twice).
+    """
+
+    def __init__(self, filename: str, functions: set[str]) -> None:
+        self.filename = filename
+        self.functions = functions
+        self.stats: dict[CodeType, LineStats] = {}
+        # frame -> (line being timed, when it started or None while a traced callee runs)
+        self._current: dict[FrameType, tuple[int, int | None]] = {}
+
+    def _charge(self, frame: FrameType, now: int) -> int | None:
+        line, start = self._current.get(frame, (0, None))
+        if start is not None:
+            self.stats[frame.f_code].time_ns[line] += now - start
+        return line if frame in self._current else None
+
+    def _trace(self, frame: FrameType, event: str, arg: Any) -> Any:
+        code = frame.f_code
+        if code.co_name in self.functions and code.co_filename == self.filename:
+            self.stats.setdefault(code, LineStats(code))
+            caller = frame.f_back
+            if caller is not None and caller in self._current:
+                self._charge(caller, perf_counter_ns())
+                self._current[caller] = (self._current[caller][0], None)
+            return self._trace_lines
+        return None
+
+    def _trace_lines(self, frame: FrameType, event: str, arg: Any) -> Any:
+        now = perf_counter_ns()
+        line = self._charge(frame, now)
+        if event == "line":
+            self.stats[frame.f_code].hits[frame.f_lineno] += 1
+            self._current[frame] = (frame.f_lineno, perf_counter_ns())
+        elif event == "return":
+            self._current.pop(frame, None)
+            caller = frame.f_back
+            if caller is not None and caller in self._current:
+                self._current[caller] = (self._current[caller][0], perf_counter_ns())
+        elif line is not None:
+            # exception: keep timing the current line
+            self._current[frame] = (line, now)
+        return self._trace_lines
+
+    def __enter__(self) -> "LineProfiler":
+        sys.settrace(self._trace)
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        sys.settrace(None)
+        self._current.clear()
+
+    def report(self) -> str:
+        sections = []
+        for code, stats in self.stats.items():
+            total = sum(stats.time_ns.values()) or 1
+            lines = [
+                f"{frame_label(code)}: {total / 1e6:.2f}ms",
+                f"{'line':>6} {'hits':>10} {'time':>11} {'%':>6}  source",
+            ]
+            last = max(stats.hits, default=code.co_firstlineno)
+            for line in range(code.co_firstlineno, last + 1):
+                source = linecache.getline(code.co_filename, line).rstrip()
+                hits, time_ns = stats.hits.get(line), stats.time_ns.get(line, 0)
+                if hits is None:
+                    lines.append(f"{line:>6} {'':>10} {'':>11} {'':>6}  {source}")
+                else:
+                    lines.append(
+                        f"{line:>6} {hits:>10} {time_ns / 1e6:>9.2f}ms "
+                        f"{time_ns / total:>6.1%}  {source}"
+                    )
+            sections.append("\n".join(lines))
+        return "\n\n".join(sections)
+
+
+@dataclass
+class PartProfile:
+    result: runner.PartResult
+    report: str
+    files: list[Path]
+
+
+def profile_part(
+    day: runner.Day,
+    part: int,
+    f: Callable[[Any], Any],
+    parsed: Any,
+    mode: Mode | None = "sample",
+    functions: set[str] | None = None,
+    top: int = DEFAULT_TOP,
+    interval: float = DEFAULT_INTERVAL,
+    out_dir: Path = PROFILE_DIR,
+) -> PartProfile:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stem = out_dir / f"{day.year}-{day.day:02d}-part{part}"
+    files: list[Path] = []
+    sections: list[str] = []
+
+    start = perf_counter_ns()
+    if functions:
+        with parallel.serial(), LineProfiler(str(day.path), functions) as lines:
+            answer = f(parsed)
+        report = lines.report() or f"none of {sorted(functions)} ran"
+        path = stem.with_suffix(".lines.txt")
+        path.write_text(report + "\n")
+        sections.append(report)
+        files.append(path)
+    elif mode == "cprofile":
+        profile = cProfile.Profile()
+        with parallel.serial():
+            answer = profile.runcall(f, parsed)
+        path = stem.with_suffix(".pstats")
+        profile.dump_stats(path)
+        sections.append(format_hot_functions(cprofile_hot_functions(profile, top)))
+        files.append(path)
+    else:
+        code = getattr(f, "__code__", None)
+        if code is None:
+            raise runner.SolutionError(f"{day.name}: cannot sample {f!r}, it has no code object")
+        with parallel.serial(), Sampler(code, interval) as sampler:
+            answer = f(parsed)
+        path = stem.with_suffix(".collapsed")
+        path.write_text(sampler.collapsed())
+        samples = sum(sampler.stacks.values())
+        sections.append(
+            f"{samples} samples\n" + format_hot_functions(sampler.hot_functions(top))
+        )
+        files.append(path)
+    elapsed = perf_counter_ns() - start
+
+    result = runner.PartResult(day.year, day.day, part, answer, elapsed)
+    return PartProfile(result, "\n".join(sections), files)
+
+
+def profile_parts(
+    day: runner.Day,
+    parsed: Any,
+    parts: tuple[int, ...] = (1, 2),
+    mode: Mode | None = "sample",
+    functions: set[str] | None = None,
+    top: int = DEFAULT_TOP,
+    interval: float = DEFAULT_INTERVAL,
+) -> Iterator[PartProfile]:
+    entry_points = day.parts()
+    for part in parts:
+        if part in entry_points:
+            yield profile_part(
+                day, part, entry_points[part], parsed, mode, functions, top, interval
+            )
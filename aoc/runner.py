@@ -0,0 +1,227 @@
+"""
+Discovers the daily solutions and runs them inside a single interpreter.
+
+Every day is loaded from its own directory (`2024/day-05/day5.py`, `2025/day08/day08.py`),
+imported once, and called through its existing entry points:
+
+    parser:  read_input(path) | process_input(path)
+    parts:   part1/part2 | solve_part1/solve_part2 | solve (returns both parts)
+
+The parsed input is shared by both parts, so parts must not mutate it.
+"""
+
+import importlib.util
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter_ns
+from types import ModuleType
+from typing import Any, Callable, Iterator
+
+from aoc import counters, instrument, memo
+
+ROOT = Path(__file__).resolve().parent.parent
+YEARS = (2024, 2025)
+
+PARSER_NAMES = ("read_input", "process_input")
+PART_NAMES = {1: ("part1", "solve_part1"), 2: ("part2", "solve_part2")}
+SOLVE_NAME = "solve"  # single entry point returning (part1, part2)
+
+# Alternative implementations of a part, e.g. `part2_dp` or `part1_par_procs`
+VARIANT_PATTERN = re.compile(r"^(?:solve_)?part([12])_(\w+)$")
+NON_VARIANT_SUFFIXES = ("helper", "worker")  # these don't take the parsed input
+
+DAY_DIR_PATTERN = re.compile(r"^day-?(\d+)$")
+
+
+class SolutionError(Exception):
+    pass
+
+
+@dataclass
+class PartResult:
+    year: int
+    day: int
+    part: int
+    answer: Any
+    elapsed_ns: int
+    counters: dict[str, int] = field(default_factory=dict)  # while counting is enabled
+
+
+@dataclass
+class Day:
+    year: int
+    day: int
+    path: Path
+    # Set for the other implementations of a day (`day02_fast.py`), see alternates()
+    label: str = ""
+    _module: ModuleType | None = field(default=None, repr=False)
+
+    @property
+    def name(self) -> str:
+        return f"{self.year} day {self.day:02d}" + (f" ({self.label})" if self.label else "")
+
+    @property
+    def key(self) -> str:
+        return f"{self.year}/{self.day:02d}"
+
+    @property
+    def default_input(self) -> Path:
+        return self.path.parent / "input.txt"
+
+    @property
+    def module_name(self) -> str:
+        suffix = "_" + re.sub(r"\W", "_", self.label) if self.label else ""
+        return f"aoc_{self.year}_day{self.day:02d}{suffix}"
+
+    def load(self) -> ModuleType:
+        if self._module is None:
+            self._module = load_module(self.path, self.module_name)
+        return self._module
+
+    def parser(self) -> Callable[[str], Any]:
+        module = self.load()
+        for name in PARSER_NAMES:
+            if hasattr(module, name):
+                return instrument.unwrap(getattr(module, name))
+        raise SolutionError(f"{self.name}: no parser found (expected one of {PARSER_NAMES})")
+
+    def parse(self, input_path: str | Path) -> Any:
+        parsed = self.parser()(str(input_path))
+        # 2025 parsers swallow errors and return None
+        if parsed is None:
+            raise SolutionError(f"{self.name}: failed to parse {input_path}")
+        return parsed
+
+    def parts(self) -> dict[int, Callable[[Any], Any]]:
+        module = self.load()
+        parts: dict[int, Callable[[Any], Any]] = {}
+        for part, names in PART_NAMES.items():
+            for name in names:
+                if hasattr(module, name):
+                    parts[part] = instrument.unwrap(getattr(module, name))
+                    break
+
+        if not parts and hasattr(module, SOLVE_NAME):
+            solve = instrument.unwrap(getattr(module, SOLVE_NAME))
+            # solve() computes both parts at once: part 1 pays for it, part 2 reuses the answer.
+            cache: dict[int, tuple[Any, Any]] = {}
+
+            def solve_part(part: int) -> Callable[[Any], Any]:
+                def wrap(parsed: Any) -> Any:
+                    key = id(parsed)
+                    if part == 1 or key not in cache:
+                        cache.clear()
+                        cache[key] = solve(parsed)
+                    return cache[key][part - 1]
+
+                wrap.__name__ = f"{SOLVE_NAME}[{part}]"
+                return wrap
+
+            parts = {1: solve_part(1), 2: solve_part(2)}
+
+        if not parts:
+            raise SolutionError(f"{self.name}: no part entry points found")
+        return parts
+
+    def variants(self) -> dict[int, dict[str, Callable[[Any], Any]]]:
+        """Every implementation of each part, keyed by variant ("" for the main entry point)."""
+        module = self.load()
+        variants = {part: {"": f} for part, f in self.parts().items()}
+        for name, value in vars(module).items():
+            match = VARIANT_PATTERN.match(name)
+            if not match or not callable(value) or match.group(2).endswith(NON_VARIANT_SUFFIXES):
+                continue
+            if getattr(value, "__module__", None) != module.__name__:
+                continue
+            variants.setdefault(int(match.group(1)), {})[match.group(2)] = instrument.unwrap(value)
+        return variants
+
+
+def load_module(path: Path, module_name: str) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    if spec is None or spec.loader is None:
+        raise SolutionError(f"Cannot import {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def day_dir_number(dir_name: str) -> int | None:
+    match = DAY_DIR_PATTERN.match(dir_name)
+    return int(match.group(1)) if match else None
+
+
+def discover(years: tuple[int, ...] = YEARS) -> list[Day]:
+    days: list[Day] = []
+    for year in years:
+        year_dir = ROOT / str(year)
+        if not year_dir.is_dir():
+            continue
+        for day_dir in sorted(year_dir.iterdir()):
+            number = day_dir_number(day_dir.name)
+            if number is None:
+                continue
+            # `day5.py` (2024) or `day05.py` (2025); variants like `day02_fast.py` are skipped.
+            # A `-rewrite` supersedes the original (day21.py part 2 never finishes).
+            candidates = (f"day{number}-rewrite.py", f"day{number}.py", f"day{number:02d}.py")
+            for candidate in candidates:
+                if (day_dir / candidate).is_file():
+                    days.append(Day(year, number, day_dir / candidate))
+                    break
+    return days
+
+
+def alternates(day: Day) -> list[Day]:
+    """The day's other solution files (`day02_fast.py`, the original `day21.py`), if any."""
+    others = []
+    for path in sorted(day.path.parent.glob("day*.py")):
+        if path != day.path and day_dir_number(path.stem.split("_")[0].split("-")[0]) == day.day:
+            others.append(Day(day.year, day.day, path, label=path.stem))
+    return others
+
+
+def find_day(year: int, day: int) -> Day:
+    for d in discover((year,)):
+        if d.day == day:
+            return d
+    raise SolutionError(f"No solution found for {year} day {day:02d}")
+
+
+def call(name: str, f: Callable[..., Any], *args: Any) -> tuple[Any, int]:
+    """Returns (result, elapsed ns), emitting a full Record while instrumentation is on."""
+    if not instrument.config.enabled:
+        start = perf_counter_ns()
+        result = f(*args)
+        return result, perf_counter_ns() - start
+
+    result, record = instrument.sample(f, *args, name=name)
+    instrument.emit(record)
+    return result, min(record.samples_ns)
+
+
+def parse(day: Day, input_path: str | Path) -> tuple[Any, int]:
+    return call(f"{day.key}/parse", day.parse, input_path)
+
+
+def run_parts(day: Day, parsed: Any, parts: tuple[int, ...] = (1, 2)) -> Iterator[PartResult]:
+    entry_points = day.parts()
+    for part in parts:
+        if part not in entry_points:
+            continue
+        counters.reset()
+        memo_before = memo.snapshot()
+        answer, elapsed = call(f"{day.key}/part{part}", entry_points[part], parsed)
+        counted = {}
+        if counters.COUNTING:
+            counted = {**counters.snapshot(), **memo.flatten(memo.delta(memo_before))}
+        yield PartResult(day.year, day.day, part, answer, elapsed, counted)
+
+
+def run_day(
+    day: Day, input_path: str | Path | None = None, parts: tuple[int, ...] = (1, 2)
+) -> list[PartResult]:
+    parsed, _ = parse(day, input_path or day.default_input)
+    return list(run_parts(day, parsed, parts))
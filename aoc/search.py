@@ -0,0 +1,229 @@
+"""
+Graph searches over integer node ids, such as Grid cell indices or `cell * 4 + direction`.
+
+A `Search` owns preallocated `array('i')` distance and predecessor buffers for a fixed
+number of nodes and reuses them for every search it runs, so repeated searches (one per
+candidate in a brute force, say) allocate nothing per call but their queues:
+
+    search = Search(len(grid))
+    dist = search.bfs_grid([start], grid.passable(WALL), grid.directions, target=end)
+    steps = dist[end]  # UNREACHED if there is no path
+
+Every search takes a list of sources (all at distance 0), stops early once `target` is
+settled, and returns the distance buffer. The buffer is overwritten by the next search
+on the same `Search`, so copy it (`array("i", dist)`) or use another `Search` to keep it.
+
+Edges come from a `neighbours(node)` callable, yielding nodes for the unweighted searches
+and (node, weight) pairs for the weighted ones. `bfs_grid` is the fast path for grids,
+stepping through fixed offsets over a passable mask instead of calling back into Python.
+
+With counting enabled (aoc.counters) every search adds its nodes popped and pushed, the
+stale queue entries it skipped, and its largest queue or frontier (max_queue).
+"""
+
+from array import array
+from heapq import heappop, heappush
+from typing import Callable, Iterable, Sequence
+
+from aoc import counters
+from aoc.counters import COUNTING
+
+UNREACHED = -1
+NO_NODE = -1
+
+Neighbours = Callable[[int], Iterable[int]]
+WeightedNeighbours = Callable[[int], Iterable[tuple[int, int]]]
+
+
+class Search:
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.dist = array("i", [UNREACHED]) * size
+        self.prev = array("i", [NO_NODE]) * size
+        self._blank = array("i", [UNREACHED]) * size  # UNREACHED == NO_NODE
+
+    def reset(self, sources: Iterable[int]) -> list[int]:
+        # Copying a blank array is a memcpy, much cheaper than a fresh allocation
+        self.dist[:] = self._blank
+        self.prev[:] = self._blank
+        sources = list(sources)
+        for source in sources:
+            self.dist[source] = 0
+        return sources
+
+    def path(self, target: int) -> list[int]:
+        """The nodes from a source to `target` along the predecessors of the last search."""
+        if self.dist[target] == UNREACHED:
+            return []
+        path = [target]
+        while self.prev[path[-1]] != NO_NODE:
+            path.append(self.prev[path[-1]])
+        path.reverse()
+        return path
+
+    def bfs(
+        self, sources: Iterable[int], neighbours: Neighbours, target: int | None = None
+    ) -> array:
+        dist, prev = self.dist, self.prev
+        frontier = self.reset(sources)
+        if target in frontier:
+            return dist
+
+        d = 0
+        while frontier:
+            if COUNTING:
+                counters.add("popped", len(frontier))
+                counters.peak("max_queue", len(frontier))
+            d += 1
+            next_frontier = []
+            for node in frontier:
+                for n in neighbours(node):
+                    if dist[n] == UNREACHED:
+                        dist[n] = d
+                        prev[n] = node
+                        if n == target:
+                            return dist
+                        next_frontier.append(n)
+            if COUNTING:
+                counters.add("pushed", len(next_frontier))
+            frontier = next_frontier
+        return dist
+
+    def bfs_grid(
+        self,
+        sources: Iterable[int],
+        passable: bytes | bytearray,
+        steps: Sequence[int],
+        target: int | None = None,
+    ) -> array:
+        """BFS where node + step is a neighbour whenever passable[node + step] is nonzero."""
+        dist, prev = self.dist, self.prev
+        frontier = self.reset(sources)
+        if target in frontier:
+            return dist
+
+        d = 0
+        while frontier:
+            if COUNTING:
+                counters.add("popped", len(frontier))
+                counters.peak("max_queue", len(frontier))
+            d += 1
+            next_frontier = []
+            for node in frontier:
+                for step in steps:
+                    n = node + step
+                    if passable[n] and dist[n] == UNREACHED:
+                        dist[n] = d
+                        prev[n] = node
+                        next_frontier.append(n)
+            if COUNTING:
+                counters.add("pushed", len(next_frontier))
+            if target is not None and dist[target] != UNREACHED:
+                return dist
+            frontier = next_frontier
+        return dist
+
+    def dijkstra(
+        self, sources: Iterable[int], neighbours: WeightedNeighbours, target: int | None = None
+    ) -> array:
+        dist, prev = self.dist, self.prev
+        queue = [(0, source) for source in self.reset(sources)]
+
+        while queue:
+            if COUNTING:
+                counters.add("popped")
+                counters.peak("max_queue", len(queue))
+            d, node = heappop(queue)
+            if d > dist[node]:
+                if COUNTING:
+                    counters.add("stale")
+                continue  # stale entry, the node was reached more cheaply since
+            if node == target:
+                return dist
+            for n, weight in neighbours(node):
+                nd = d + weight
+                if dist[n] == UNREACHED or nd < dist[n]:
+                    dist[n] = nd
+                    prev[n] = node
+                    heappush(queue, (nd, n))
+                    if COUNTING:
+                        counters.add("pushed")
+        return dist
+
+    def dial(
+        self,
+        sources: Iterable[int],
+        neighbours: WeightedNeighbours,
+        max_weight: int,
+        target: int | None = None,
+    ) -> array:
+        """
+        Dijkstra with a circular array of max_weight + 1 buckets instead of a heap (Dial's
+        algorithm), for small non-negative integer weights. Every bucket holds the nodes
+        at one distance, and a node is never more than max_weight ahead of the current one.
+        """
+        dist, prev = self.dist, self.prev
+        buckets: list[list[int]] = [[] for _ in range(max_weight + 1)]
+        buckets[0] = self.reset(sources)
+        pending = len(buckets[0])
+
+        d = 0
+        while pending:
+            bucket = buckets[d % len(buckets)]
+            if COUNTING:
+                counters.peak("max_queue", pending)
+            while bucket:
+                node = bucket.pop()
+                pending -= 1
+                if COUNTING:
+                    counters.add("popped")
+                if dist[node] != d:
+                    if COUNTING:
+                        counters.add("stale")
+                    continue  # stale entry
+                if node == target:
+                    return dist
+                for n, weight in neighbours(node):
+                    nd = d + weight
+                    if dist[n] == UNREACHED or nd < dist[n]:
+                        dist[n] = nd
+                        prev[n] = node
+                        buckets[nd % len(buckets)].append(n)
+                        pending += 1
+                        if COUNTING:
+                            counters.add("pushed")
+            d += 1
+        return dist
+
+    def astar(
+        self,
+        source: int,
+        target: int,
+        neighbours: WeightedNeighbours,
+        heuristic: Callable[[int], int],
+    ) -> array:
+        """Dijkstra towards `target`, guided by an admissible (never overestimating) heuristic."""
+        dist, prev = self.dist, self.prev
+        self.reset((source,))
+        queue = [(heuristic(source), 0, source)]
+
+        while queue:
+            if COUNTING:
+                counters.add("popped")
+                counters.peak("max_queue", len(queue))
+            _, d, node = heappop(queue)
+            if d > dist[node]:
+                if COUNTING:
+                    counters.add("stale")
+                continue
+            if node == target:
+                return dist
+            for n, weight in neighbours(node):
+                nd = d + weight
+                if dist[n] == UNREACHED or nd < dist[n]:
+                    dist[n] = nd
+                    prev[n] = node
+                    heappush(queue, (nd + heuristic(n), nd, n))
+                    if COUNTING:
+                        counters.add("pushed")
+        return dist
@@ -0,0 +1,32 @@
+from aoc import runner
+
+day1 = runner.find_day(2024, 1).load()
+
+
+def write(tmp_path, rows):
+    path = tmp_path / "input.txt"
+    path.write_text("".join(f"{l}   {r}\n" for l, r in rows))
+    return str(path)
+
+
+def test_example(tmp_path):
+    path = write(tmp_path, [(3, 4), (4, 3), (2, 5), (1, 3), (3, 9), (3, 3)])
+    data = day1.process_input(path)
+    assert day1.part1(data) == day1.part1_python(data) == 11
+    assert day1.part2(data) == day1.part2_python(data) == 31
+    assert day1.solve_external(path) == (11, 31)
+
+
+def test_part1_sum_past_int64(tmp_path):
+    # Each difference fits in an int64, their total (10^19) doesn't
+    path = write(tmp_path, [(10**15, 0)] * 10**4)
+    data = day1.process_input(path)
+    assert day1.part1(data) == day1.part1_python(data) == 10**19
+    assert day1.solve_external(path)[0] == 10**19
+
+
+def test_part1_difference_past_int64(tmp_path):
+    big = 2**63 - 1
+    path = write(tmp_path, [(big, -big), (big, -big), (5, 2)])
+    data = day1.process_input(path)
+    assert day1.part1(data) == day1.part1_python(data) == (5 + big) + 2 * big + (big - 2)
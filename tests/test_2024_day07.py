@@ -0,0 +1,26 @@
+from aoc import runner
+
+day7 = runner.find_day(2024, 7).load()
+
+
+def parse(tmp_path, text):
+    path = tmp_path / "input.txt"
+    path.write_text(text)
+    return day7.process_input(str(path))
+
+
+def test_target_reached_early_is_finished_with_times_one(tmp_path):
+    # 3 * 1, 2 + 1 * 1 and 4 + 1 * 1: each total hits its target before the last component
+    data = parse(tmp_path, "3: 3 1\n3: 2 1 1\n5: 4 1 1\n")
+    assert day7.solve_part1(data) == 3 + 3 + 5
+    assert day7.solve_part2(data) == 3 + 3 + 5
+
+
+def test_example(tmp_path):
+    data = parse(
+        tmp_path,
+        "190: 10 19\n3267: 81 40 27\n83: 17 5\n156: 15 6\n7290: 6 8 6 15\n"
+        "161011: 16 10 13\n192: 17 8 14\n21037: 9 7 18 13\n292: 11 6 16 20\n",
+    )
+    assert day7.solve_part1(data) == 3749
+    assert day7.solve_part2(data) == 11387
@@ -0,0 +1,63 @@
+import random
+import shutil
+import subprocess
+
+import pytest
+
+from aoc import runner
+
+day = runner.find_day(2024, 9)
+day9 = day.load()
+
+
+def compact_checksum(disk_map):
+    # One block at a time: the last file block into the first gap, until none is left of it
+    blocks = []
+    for i, size in enumerate(disk_map):
+        blocks += [i // 2 if i % 2 == 0 else None] * int(size)
+    left, right = 0, len(blocks) - 1
+    while True:
+        while left < right and blocks[left] is not None:
+            left += 1
+        while right > left and blocks[right] is None:
+            right -= 1
+        if left >= right:
+            break
+        blocks[left], blocks[right] = blocks[right], None
+    return sum(i * block for i, block in enumerate(blocks) if block is not None)
+
+
+def random_disk_maps(count):
+    rng = random.Random(9)
+    for _ in range(count):
+        files = rng.randint(1, 7)
+        # file, gap, file, ..., file
+        sizes = [rng.randint(1 - i % 2, 9) for i in range(2 * files - 1)]
+        yield "".join(map(str, sizes))
+
+
+def test_gaps_behind_the_last_file_block():
+    # 00....11 compacts to 0011...., the gaps past the last file are left alone
+    assert day9.solve_part1("242") == 5
+
+
+def test_example():
+    assert day9.solve_part1("2333133121414131402") == 1928
+    assert day9.solve_part2("2333133121414131402") == 2858
+
+
+def test_part1_matches_block_by_block_compaction():
+    for disk_map in random_disk_maps(300):
+        assert day9.solve_part1(disk_map) == compact_checksum(disk_map), disk_map
+
+
+@pytest.mark.skipif(shutil.which("go") is None, reason="no go on PATH")
+def test_go_port_part1(tmp_path):
+    binary = tmp_path / "day9"
+    subprocess.run(["go", "build", "-o", str(binary), str(day.path.with_suffix(".go"))], check=True)
+    (tmp_path / "day-09").mkdir()
+    for disk_map in random_disk_maps(40):
+        (tmp_path / "day-09" / "input.txt").write_text(disk_map)
+        output = subprocess.run([binary], cwd=tmp_path, capture_output=True, text=True, check=True)
+        part1 = output.stdout.splitlines()[0].split()[-1]
+        assert int(part1) == compact_checksum(disk_map), disk_map
@@ -0,0 +1,43 @@
+from aoc import bench, instrument
+
+
+def result(median_ns):
+    return bench.Result(2024, 11, 1, "", instrument.Record("part1", [median_ns]), 0)
+
+
+def stored(tmp_path, *runs):
+    conn = bench.connect(tmp_path / "bench.sqlite")
+    for median_ns, commit, dirty in runs:
+        bench.store(conn, [result(median_ns)], "input", commit, dirty, "cpython-3.11")
+    return conn
+
+
+def regressions(conn, median_ns, commit, dirty, baseline_commit=None):
+    return bench.check_regressions(
+        conn, [result(median_ns)], "input", "cpython-3.11", commit, dirty, 0.1, baseline_commit
+    )
+
+
+def test_same_commit_clean_compares_with_previous_run(tmp_path):
+    conn = stored(tmp_path, (1000, "abc", False))
+    (reg,) = regressions(conn, 2000, "abc", False)
+    assert (reg.baseline_commit, reg.baseline_ns) == ("abc", 1000)
+
+
+def test_dirty_compares_with_clean_run_at_head(tmp_path):
+    # The dirty run in between is an earlier edit, not what the edits are measured against
+    conn = stored(tmp_path, (5000, "old", False), (1000, "abc", False), (3000, "abc", True))
+    (reg,) = regressions(conn, 2000, "abc", True)
+    assert (reg.baseline_commit, reg.baseline_ns) == ("abc", 1000)
+
+
+def test_dirty_without_clean_run_at_head_uses_another_commit(tmp_path):
+    conn = stored(tmp_path, (1000, "old", False), (3000, "abc", True))
+    (reg,) = regressions(conn, 2000, "abc", True)
+    assert (reg.baseline_commit, reg.baseline_ns) == ("old", 1000)
+
+
+def test_explicit_baseline(tmp_path):
+    conn = stored(tmp_path, (1000, "old", False), (3000, "abc", False))
+    assert regressions(conn, 2000, "abc", False, "abc") == []
+    assert len(regressions(conn, 2000, "abc", False, "old")) == 1
@@ -0,0 +1,33 @@
+import random
+
+import pytest
+
+from aoc import ints
+
+CASES = [
+    (b"", []),
+    (b" \n", []),
+    (b"p=0,4 v=3,-3\n", [0, 4, 3, -3]),
+    (b"10-14,-5", [10, 14, -5]),
+    (b"1 - 2 --3 -", [1, 2, -3]),
+    (b"-9223372036854775808 9223372036854775807", [-(2**63), 2**63 - 1]),
+]
+
+
+@pytest.mark.parametrize("data, expected", CASES)
+def test_numpy_matches_stdlib(data, expected):
+    assert list(ints.ints(data)) == expected
+    assert ints.ints_numpy(data).tolist() == expected
+
+
+def test_random_punctuation():
+    rng = random.Random(16)
+    for _ in range(2000):
+        data = "".join(rng.choice("0123456789-- ,=x\n") for _ in range(rng.randint(0, 30)))
+        assert ints.ints_numpy(data.encode()).tolist() == list(ints.ints(data.encode()))
+
+
+def test_mmap(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"3-4 -5\n")
+    assert ints.read_ints(path, numpy=True, use_mmap=True).tolist() == [3, 4, -5]